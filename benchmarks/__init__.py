@@ -0,0 +1,25 @@
+# ============================================================
+# SHOOTER - QGIS Plugin
+#
+# Author  : Achmad Amrulloh
+# Email   : achmad.amrulloh@gmail.com
+# LinkedIn: https://www.linkedin.com/in/achmad-amrulloh/
+#
+# Description:
+# Manual Add Sector & Site Tool for RF Planning and RF Optimization.
+#
+# Copyright (C) 2026 Achmad Amrulloh
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# ============================================================
@@ -0,0 +1,426 @@
+# ============================================================
+# SHOOTER - QGIS Plugin
+#
+# Author  : Achmad Amrulloh
+# Email   : achmad.amrulloh@gmail.com
+# LinkedIn: https://www.linkedin.com/in/achmad-amrulloh/
+#
+# Description:
+# Manual Add Sector & Site Tool for RF Planning and RF Optimization.
+#
+# Copyright (C) 2026 Achmad Amrulloh
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# ============================================================
+"""
+Micro-benchmark hot path geometry dan layer Shooter.
+
+Pemakaian (dari folder plugin atau di mana saja):
+
+    python benchmarks/bench_shooter.py --json results.json
+    python benchmarks/bench_shooter.py --quick
+    python benchmarks/bench_shooter.py --compare baseline.json --threshold 1.25
+
+Jika qgis tidak bisa di-import, stand-in dari qgis_stubs dipakai
+(atau paksa dengan --stand-ins). Hasil berupa JSON; dengan --compare
+exit code 1 jika ada case yang lebih lambat dari baseline x threshold.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PLUGIN_DIR = os.path.dirname(BENCH_DIR)
+
+CRS_CASES = ["EPSG:4326", "EPSG:3857", "EPSG:4269"]
+SEGMENT_CASES = [8, 36, 72, 360]
+RADIUS_CASES = [50.0, 1000.0, 30000.0]
+LAYER_SIZES = [1000, 10000, 100000]
+
+# Titik uji (sekitar Jakarta) per CRS
+CENTER_WGS84 = (106.8272, -6.1754)
+
+
+# ============================================================
+# Environment
+# ============================================================
+
+def _setup_qgis(force_stand_ins):
+    """
+    Return (label backend, QgsApplication atau None).
+    """
+    if not force_stand_ins:
+        try:
+            from qgis.core import QgsApplication, Qgis
+            app = QgsApplication([], False)
+            app.initQgis()
+            return f"qgis {Qgis.QGIS_VERSION}", app
+        except ImportError:
+            pass
+
+    sys.path.insert(0, BENCH_DIR)
+    import qgis_stubs
+    qgis_stubs.install()
+    return "stand-ins", None
+
+
+def _import_plugin(module):
+    parent = os.path.dirname(PLUGIN_DIR)
+    if parent not in sys.path:
+        sys.path.insert(0, parent)
+    package = os.path.basename(PLUGIN_DIR)
+    return importlib.import_module(f"{package}.{module}")
+
+
+# ============================================================
+# Timing
+# ============================================================
+
+def _measure(func, number, repeat):
+    """
+    Jalankan func() number kali, diulang repeat kali.
+    Return dict waktu (detik per batch) dan per operasi (mikrodetik).
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        times.append(time.perf_counter() - start)
+
+    best = min(times)
+    return {
+        "number": number,
+        "repeat": repeat,
+        "min_s": best,
+        "median_s": statistics.median(times),
+        "per_op_us": best / number * 1e6,
+    }
+
+
+class BenchmarkSuite:
+
+    def __init__(self, quick=False):
+        self.quick = quick
+        self.results = []
+
+    def record(self, name, params, func, number, repeat=5):
+        if self.quick:
+            number = max(1, number // 10)
+            repeat = min(repeat, 3)
+
+        stats = _measure(func, number, repeat)
+        result = {"name": name, "params": params}
+        result.update(stats)
+        self.results.append(result)
+
+        label = ", ".join(f"{k}={v}" for k, v in params.items())
+        print(f"{name:<28} {label:<48} {stats['per_op_us']:>12.2f} us/op")
+
+
+# ============================================================
+# Cases
+# ============================================================
+
+def bench_azimuth(suite):
+    geometry = _import_plugin("shooter_geometry")
+    from qgis.core import QgsPointXY
+
+    center = QgsPointXY(*CENTER_WGS84)
+    point = QgsPointXY(CENTER_WGS84[0] + 0.01, CENTER_WGS84[1] + 0.02)
+
+    suite.record(
+        "calcAzimuth", {},
+        lambda: geometry.ShooterGeometry.calcAzimuth(center, point),
+        number=10000
+    )
+
+    for ctrl, shift in ((False, False), (True, False), (True, True)):
+        suite.record(
+            "snapAzimuth", {"ctrl": ctrl, "shift": shift},
+            lambda: geometry.ShooterGeometry.snapAzimuth(123.4, ctrl, shift),
+            number=10000
+        )
+
+
+def _center_in(crs_authid):
+    from qgis.core import (
+        QgsPointXY,
+        QgsCoordinateReferenceSystem,
+        QgsCoordinateTransform,
+        QgsProject
+    )
+
+    wgs84 = QgsCoordinateReferenceSystem("EPSG:4326")
+    crs = QgsCoordinateReferenceSystem(crs_authid)
+    ct = QgsCoordinateTransform(wgs84, crs, QgsProject.instance())
+    return ct.transform(QgsPointXY(*CENTER_WGS84))
+
+
+def bench_wedge(suite):
+    geometry = _import_plugin("shooter_geometry")
+    from qgis.core import QgsProject, QgsCoordinateReferenceSystem
+
+    ShooterGeometry = geometry.ShooterGeometry
+    project = QgsProject.instance()
+
+    for crs_authid in CRS_CASES:
+        project.setCrs(QgsCoordinateReferenceSystem(crs_authid))
+        center = _center_in(crs_authid)
+
+        for segments in SEGMENT_CASES:
+            for radius in RADIUS_CASES:
+                suite.record(
+                    "buildWedgePolygon",
+                    {"crs": crs_authid, "segments": segments, "radius_m": radius},
+                    lambda: ShooterGeometry.buildWedgePolygon(
+                        center, 45.0, radius, 30, segments
+                    ),
+                    number=200
+                )
+
+        n = 10000
+        centers = [center] * n
+        azimuths = [float(i % 360) for i in range(n)]
+        suite.record(
+            "buildWedgePolygons",
+            {"crs": crs_authid, "segments": 72, "sectors": n},
+            lambda: ShooterGeometry.buildWedgePolygons(
+                centers, azimuths, 1000.0, 30, 72
+            ),
+            number=1,
+            repeat=3
+        )
+
+    project.setCrs(QgsCoordinateReferenceSystem("EPSG:4326"))
+
+
+def bench_layer(suite):
+    geometry = _import_plugin("shooter_geometry")
+    layer_manager = _import_plugin("shooter_layer_manager")
+    from qgis.core import QgsProject, QgsPointXY
+
+    ShooterLayerManager = layer_manager.ShooterLayerManager
+    project = QgsProject.instance()
+
+    geom = geometry.ShooterGeometry.buildWedgePolygon(
+        QgsPointXY(*CENTER_WGS84), 45.0, 1000.0, 30, 72
+    )
+    attrs = {
+        "sector_id": "Sector 1",
+        "dummy_id": "BENCH",
+        "azimuth": 45.0,
+        "radius_m": 1000.0,
+        "beamwidth": 30.0,
+        "center_lat": CENTER_WGS84[1],
+        "center_lon": CENTER_WGS84[0],
+        "line_color": "#FFFF00",
+        "line_width": 2,
+        "show_label": True,
+    }
+
+    sizes = LAYER_SIZES[:2] if suite.quick else LAYER_SIZES
+    for size in sizes:
+        for layer in project.mapLayersByName("SHOOTER_ADD_SECTOR"):
+            project.removeMapLayer(layer.id())
+
+        def add_all():
+            for _ in range(size):
+                ShooterLayerManager.addFeatureByLayer(
+                    "SHOOTER_ADD_SECTOR", geom, attrs
+                )
+
+        _record_per_feature(suite, "addFeatureByLayer", size, add_all)
+
+        for layer in project.mapLayersByName("SHOOTER_ADD_SECTOR"):
+            project.removeMapLayer(layer.id())
+
+        items = [(geom, attrs)] * size
+        _record_per_feature(
+            suite, "addFeaturesByLayer", size,
+            lambda: ShooterLayerManager.addFeaturesByLayer("SHOOTER_ADD_SECTOR", items)
+        )
+
+
+def bench_project(suite):
+    layer_manager = _import_plugin("shooter_layer_manager")
+    project_store = _import_plugin("shooter_project_store")
+    from qgis.core import QgsProject
+
+    ShooterLayerManager = layer_manager.ShooterLayerManager
+    ShooterProjectStore = project_store.ShooterProjectStore
+    project = QgsProject.instance()
+
+    sizes = LAYER_SIZES[:2] if suite.quick else LAYER_SIZES
+    for size in sizes:
+        for layer in project.mapLayersByName("SHOOTER_ADD_SECTOR"):
+            project.removeMapLayer(layer.id())
+
+        layer = ShooterLayerManager.getOrCreateLayerByName("SHOOTER_ADD_SECTOR")
+        entry = _project_entry(size)
+        _record_per_feature(
+            suite, "restoreLayer", size,
+            lambda: ShooterProjectStore.restoreLayer(layer, entry)
+        )
+
+        _record_per_feature(
+            suite, "serializeLayer", size,
+            lambda: ShooterProjectStore.encode(
+                {"layers": [ShooterProjectStore.serializeLayer(layer)]}
+            )
+        )
+
+
+def _project_entry(size):
+    """
+    Tabel atribut sintetis dalam format ShooterProjectStore.
+    """
+    import base64
+    import numpy as np
+
+    def f8(values):
+        array = np.asarray(values, dtype="<f8")
+        return {"f8": base64.b64encode(array.tobytes()).decode("ascii")}
+
+    index = np.arange(size)
+    return {
+        "id": "bench",
+        "name": "SHOOTER_ADD_SECTOR",
+        "count": size,
+        "columns": {
+            "sector_id": {"values": [f"Sector {i % 3 + 1}" for i in range(size)]},
+            "dummy_id": {"values": [f"SITE{i // 3}" for i in range(size)]},
+            "azimuth": f8((index % 3) * 120.0),
+            "radius_m": f8(np.full(size, 1000.0)),
+            "beamwidth": f8(np.full(size, 65.0)),
+            "center_lat": f8(CENTER_WGS84[1] + (index // 3) * 1e-3),
+            "center_lon": f8(np.full(size, CENTER_WGS84[0])),
+            "line_color": {"values": ["#FFFF00"] * size},
+            "line_width": {"values": [2] * size},
+            "show_label": {"values": [True] * size},
+        },
+    }
+
+
+def _record_per_feature(suite, name, size, func):
+    stats = _measure(func, 1, 1)
+    result = {
+        "name": name,
+        "params": {"features": size},
+    }
+    result.update(stats)
+    result["per_op_us"] = stats["min_s"] / size * 1e6
+    suite.results.append(result)
+    print(f"{name:<28} {'features=' + str(size):<48} {result['per_op_us']:>12.2f} us/op")
+
+
+BENCHMARKS = {
+    "azimuth": bench_azimuth,
+    "wedge": bench_wedge,
+    "layer": bench_layer,
+    "project": bench_project,
+}
+
+
+# ============================================================
+# Compare
+# ============================================================
+
+def _case_key(result):
+    return result["name"], json.dumps(result["params"], sort_keys=True)
+
+
+def compare(results, baseline_path, threshold):
+    """
+    Return list regresi: case dengan per_op_us > baseline * threshold.
+    """
+    with open(baseline_path, encoding="utf-8") as fh:
+        baseline = json.load(fh)
+
+    base = {_case_key(r): r for r in baseline["results"]}
+    regressions = []
+    for result in results:
+        ref = base.get(_case_key(result))
+        if ref is None:
+            continue
+        ratio = result["per_op_us"] / ref["per_op_us"] if ref["per_op_us"] else 1.0
+        if ratio > threshold:
+            regressions.append({
+                "name": result["name"],
+                "params": result["params"],
+                "baseline_us": ref["per_op_us"],
+                "current_us": result["per_op_us"],
+                "ratio": ratio,
+            })
+    return regressions
+
+
+# ============================================================
+# Main
+# ============================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Shooter micro-benchmarks")
+    parser.add_argument("--json", help="tulis hasil ke file JSON")
+    parser.add_argument("--quick", action="store_true", help="jumlah iterasi dikurangi")
+    parser.add_argument("--stand-ins", action="store_true", help="paksa stand-in QGIS")
+    parser.add_argument("--only", choices=sorted(BENCHMARKS), action="append",
+                        help="jalankan grup tertentu saja")
+    parser.add_argument("--compare", help="file JSON baseline")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="rasio maksimum terhadap baseline (default 1.25)")
+    args = parser.parse_args(argv)
+
+    backend, app = _setup_qgis(args.stand_ins)
+
+    suite = BenchmarkSuite(quick=args.quick)
+    for name in args.only or list(BENCHMARKS):
+        BENCHMARKS[name](suite)
+
+    report = {
+        "backend": backend,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "quick": args.quick,
+        "results": suite.results,
+    }
+
+    exit_code = 0
+    if args.compare:
+        regressions = compare(suite.results, args.compare, args.threshold)
+        report["regressions"] = regressions
+        for reg in regressions:
+            print(f"REGRESSION {reg['name']} {reg['params']}: "
+                  f"{reg['baseline_us']:.2f} -> {reg['current_us']:.2f} us/op "
+                  f"(x{reg['ratio']:.2f})")
+        exit_code = 1 if regressions else 0
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+
+    if app is not None:
+        app.exitQgis()
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
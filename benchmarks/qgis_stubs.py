@@ -0,0 +1,783 @@
+# ============================================================
+# SHOOTER - QGIS Plugin
+#
+# Author  : Achmad Amrulloh
+# Email   : achmad.amrulloh@gmail.com
+# LinkedIn: https://www.linkedin.com/in/achmad-amrulloh/
+#
+# Description:
+# Manual Add Sector & Site Tool for RF Planning and RF Optimization.
+#
+# Copyright (C) 2026 Achmad Amrulloh
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# ============================================================
+"""
+Stand-in ringan untuk kelas QGIS / PyQt yang dipakai hot path Shooter.
+
+Hanya dipakai benchmark saat QGIS tidak terinstall. Perilaku dibuat
+cukup mirip (lookup layer linear, edit buffer list, transform CRS
+sederhana) agar biaya sisi Python bisa diukur; biaya C++ QGIS
+(mis. QgsGeometry.transform, rendering) tidak dimodelkan.
+"""
+
+import math
+import sys
+import types
+
+
+# ============================================================
+# Generic no-op objects (styling, labeling, colors, ...)
+# ============================================================
+
+class _Anything:
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __call__(self, *args, **kwargs):
+        return _Anything()
+
+    def __getattr__(self, name):
+        return _Anything()
+
+
+class _AnythingMeta(type):
+
+    def __getattr__(cls, name):
+        return _Anything()
+
+
+def _anything_class(name):
+    return _AnythingMeta(name, (_Anything,), {})
+
+
+class _Signal:
+
+    def __init__(self):
+        self._slots = []
+
+    def connect(self, slot):
+        self._slots.append(slot)
+
+    def disconnect(self, slot=None):
+        if slot is None:
+            self._slots.clear()
+        elif slot in self._slots:
+            self._slots.remove(slot)
+
+    def emit(self, *args):
+        for slot in list(self._slots):
+            slot(*args)
+
+
+class pyqtSignal:
+    """
+    Signal di level class: tiap instance mendapat _Signal sendiri.
+    """
+
+    def __init__(self, *types):
+        self._name = None
+
+    def __set_name__(self, owner, name):
+        self._name = "_signal_" + name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        signal = obj.__dict__.get(self._name)
+        if signal is None:
+            signal = obj.__dict__[self._name] = _Signal()
+        return signal
+
+
+class QObject:
+
+    def __init__(self, *args):
+        pass
+
+
+# ============================================================
+# Settings
+# ============================================================
+
+class QSettings:
+
+    _store = {}
+
+    def __init__(self, *args):
+        self._group = ""
+
+    def beginGroup(self, group):
+        self._group = group
+
+    def endGroup(self):
+        self._group = ""
+
+    def _key(self, key):
+        return f"{self._group}/{key}" if self._group else key
+
+    def value(self, key, default=None, type=None):
+        val = QSettings._store.get(self._key(key), default)
+        if type is not None and val is not None:
+            return type(val)
+        return val
+
+    def setValue(self, key, value):
+        QSettings._store[self._key(key)] = value
+
+
+class QVariant:
+    String = 10
+    Double = 6
+    Int = 2
+    Bool = 1
+
+
+# ============================================================
+# Geometry & CRS
+# ============================================================
+
+class QgsPointXY:
+
+    __slots__ = ("_x", "_y")
+
+    def __init__(self, x=0.0, y=0.0):
+        self._x = float(x)
+        self._y = float(y)
+
+    def x(self):
+        return self._x
+
+    def y(self):
+        return self._y
+
+    def distance(self, other):
+        return math.hypot(other._x - self._x, other._y - self._y)
+
+
+class QgsGeometry:
+
+    def __init__(self):
+        self._wkb = b""
+
+    def fromWkb(self, wkb):
+        self._wkb = bytes(wkb)
+
+    def asWkb(self):
+        return self._wkb
+
+    def transform(self, ct):
+        # Biaya transform C++ tidak dimodelkan
+        return 0
+
+    @staticmethod
+    def fromPolygonXY(rings):
+        return QgsGeometry()
+
+
+class QgsUnitTypes:
+    DistanceMeters = 0
+    DistanceDegrees = 6
+
+
+_R_MERCATOR = 6378137.0
+
+
+def _mercator_from_wgs(x, y):
+    return (
+        math.radians(x) * _R_MERCATOR,
+        math.log(math.tan(math.pi / 4 + math.radians(y) / 2)) * _R_MERCATOR
+    )
+
+
+def _mercator_to_wgs(x, y):
+    return (
+        math.degrees(x / _R_MERCATOR),
+        math.degrees(2 * math.atan(math.exp(y / _R_MERCATOR)) - math.pi / 2)
+    )
+
+
+def _identity(x, y):
+    return x, y
+
+
+# authid → (geographic, map units, to WGS84, from WGS84)
+_CRS_DEFS = {
+    "EPSG:4326": (True, QgsUnitTypes.DistanceDegrees, _identity, _identity),
+    "EPSG:4269": (True, QgsUnitTypes.DistanceDegrees, _identity, _identity),
+    "EPSG:3857": (False, QgsUnitTypes.DistanceMeters, _mercator_to_wgs, _mercator_from_wgs),
+}
+
+
+class QgsCoordinateReferenceSystem:
+
+    def __init__(self, authid="EPSG:4326"):
+        self._authid = authid if authid in _CRS_DEFS else ""
+
+    def isValid(self):
+        return bool(self._authid)
+
+    def authid(self):
+        return self._authid
+
+    def toWkt(self):
+        return self._authid
+
+    def isGeographic(self):
+        return _CRS_DEFS[self._authid][0]
+
+    def mapUnits(self):
+        return _CRS_DEFS[self._authid][1]
+
+    def __eq__(self, other):
+        return isinstance(other, QgsCoordinateReferenceSystem) and self._authid == other._authid
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self._authid)
+
+
+class QgsCoordinateTransformContext:
+
+    def __eq__(self, other):
+        return isinstance(other, QgsCoordinateTransformContext)
+
+
+class QgsCsException(Exception):
+    pass
+
+
+class QgsCoordinateTransform:
+
+    def __init__(self, source, dest, context=None):
+        self._to_wgs = _CRS_DEFS[source.authid()][2]
+        self._from_wgs = _CRS_DEFS[dest.authid()][3]
+
+    def transform(self, point):
+        x, y = self._from_wgs(*self._to_wgs(point.x(), point.y()))
+        return QgsPointXY(x, y)
+
+
+class QgsWkbTypes:
+    Polygon = 3
+    CurvePolygon = 10
+    LineGeometry = 1
+    PolygonGeometry = 2
+
+    @staticmethod
+    def isCurvedType(wkb_type):
+        return wkb_type == QgsWkbTypes.CurvePolygon
+
+
+# ============================================================
+# Fields, features, layers
+# ============================================================
+
+class QgsField:
+
+    def __init__(self, name, type_=None):
+        self._name = name
+        self._type = type_
+
+    def name(self):
+        return self._name
+
+    def type(self):
+        return self._type
+
+
+class QgsFields:
+
+    def __init__(self):
+        self._fields = []
+        self._index = {}
+
+    def append(self, field):
+        self._index[field.name()] = len(self._fields)
+        self._fields.append(field)
+
+    def indexFromName(self, name):
+        return self._index.get(name, -1)
+
+    def count(self):
+        return len(self._fields)
+
+    def __iter__(self):
+        return iter(self._fields)
+
+
+class QgsFeatureRequest:
+
+    NoGeometry = 1
+
+    def setFlags(self, flags):
+        return self
+
+
+class QgsFeature:
+
+    _next_id = 1
+
+    def __init__(self, fields=None):
+        self._fields = fields
+        self._attrs = [None] * (fields.count() if fields else 0)
+        self._geom = None
+        self._id = QgsFeature._next_id
+        QgsFeature._next_id += 1
+
+    def __setitem__(self, key, value):
+        idx = key if isinstance(key, int) else self._fields.indexFromName(key)
+        self._attrs[idx] = value
+
+    def __getitem__(self, key):
+        idx = key if isinstance(key, int) else self._fields.indexFromName(key)
+        return self._attrs[idx]
+
+    def setAttributes(self, attrs):
+        self._attrs = list(attrs)
+
+    def attributes(self):
+        return list(self._attrs)
+
+    def setGeometry(self, geometry):
+        self._geom = geometry
+
+    def geometry(self):
+        return self._geom
+
+    def id(self):
+        return self._id
+
+
+class _DataProvider:
+
+    def __init__(self, layer):
+        self._layer = layer
+
+    def addAttributes(self, fields):
+        for field in fields._fields:
+            self._layer._pending_fields.append(field)
+        return True
+
+    def addFeatures(self, features):
+        # Provider langsung: tanpa signal edit buffer
+        for feature in features:
+            self._layer._features[feature.id()] = feature
+        return True
+
+
+class QgsVectorLayer:
+
+    _next_id = 1
+
+    def __init__(self, uri="", name="", provider="memory"):
+        self._name = name
+        self._id = f"{name}_{QgsVectorLayer._next_id}"
+        QgsVectorLayer._next_id += 1
+        self._wkb_type = (
+            QgsWkbTypes.CurvePolygon if uri.startswith("CurvePolygon")
+            else QgsWkbTypes.Polygon
+        )
+        self._fields = QgsFields()
+        self._pending_fields = []
+        self._editable = False
+        self._features = {}
+        self._provider = _DataProvider(self)
+        self._provider_type = provider
+
+        self.nameChanged = _Signal()
+        self.featureAdded = _Signal()
+        self.featureDeleted = _Signal()
+        self.attributeValueChanged = _Signal()
+        self.geometryChanged = _Signal()
+        self.willBeDeleted = _Signal()
+
+    def name(self):
+        return self._name
+
+    def setName(self, name):
+        self._name = name
+        self.nameChanged.emit()
+
+    def id(self):
+        return self._id
+
+    def providerType(self):
+        return self._provider_type
+
+    def wkbType(self):
+        return self._wkb_type
+
+    def dataProvider(self):
+        return self._provider
+
+    def updateFields(self):
+        for field in self._pending_fields:
+            self._fields.append(field)
+        self._pending_fields = []
+
+    def fields(self):
+        return self._fields
+
+    def isEditable(self):
+        return self._editable
+
+    def startEditing(self):
+        self._editable = True
+        return True
+
+    def commitChanges(self, stopEditing=True):
+        self._editable = not stopEditing
+        return True
+
+    def isModified(self):
+        return False
+
+    def beginEditCommand(self, text):
+        pass
+
+    def endEditCommand(self):
+        pass
+
+    def destroyEditCommand(self):
+        pass
+
+    def addFeature(self, feature):
+        self._features[feature.id()] = feature
+        self.featureAdded.emit(feature.id())
+        return True
+
+    def addFeatures(self, features):
+        for feature in features:
+            self.addFeature(feature)
+        return True
+
+    def featureCount(self):
+        return len(self._features)
+
+    def getFeatures(self, request=None):
+        return iter(list(self._features.values()))
+
+    def crs(self):
+        return QgsProject.instance().crs()
+
+    def updateExtents(self):
+        pass
+
+    def triggerRepaint(self):
+        pass
+
+    def setRenderer(self, renderer):
+        pass
+
+    def setLabeling(self, labeling):
+        pass
+
+    def setLabelsEnabled(self, enabled):
+        pass
+
+
+# ============================================================
+# Project & layer tree
+# ============================================================
+
+class _LayerTreeNode:
+
+    def __init__(self):
+        self._parent = None
+        self._visible = True
+
+    def parent(self):
+        return self._parent
+
+    def setItemVisibilityChecked(self, checked):
+        self._visible = checked
+
+    def itemVisibilityChecked(self):
+        return self._visible
+
+
+class QgsLayerTreeLayer(_LayerTreeNode):
+
+    def __init__(self, layer_id):
+        super().__init__()
+        self._layer_id = layer_id
+
+    def layerId(self):
+        return self._layer_id
+
+    def clone(self):
+        return QgsLayerTreeLayer(self._layer_id)
+
+
+class QgsLayerTreeGroup(_LayerTreeNode):
+
+    def __init__(self, name=""):
+        super().__init__()
+        self._name = name
+        self._children = []
+        self._expanded = True
+
+    def name(self):
+        return self._name
+
+    def children(self):
+        return list(self._children)
+
+    def findGroup(self, name):
+        for child in self._children:
+            if isinstance(child, QgsLayerTreeGroup):
+                if child._name == name:
+                    return child
+                found = child.findGroup(name)
+                if found:
+                    return found
+        return None
+
+    def findLayer(self, layer_id):
+        for child in self._children:
+            if isinstance(child, QgsLayerTreeLayer) and child._layer_id == layer_id:
+                return child
+            if isinstance(child, QgsLayerTreeGroup):
+                found = child.findLayer(layer_id)
+                if found:
+                    return found
+        return None
+
+    def insertGroup(self, index, name):
+        group = QgsLayerTreeGroup(name)
+        self.insertChildNode(index, group)
+        return group
+
+    def insertChildNode(self, index, node):
+        node._parent = self
+        self._children.insert(index, node)
+
+    def addLayer(self, layer):
+        node = QgsLayerTreeLayer(layer.id())
+        self.insertChildNode(len(self._children), node)
+        return node
+
+    def removeChildNode(self, node):
+        if node in self._children:
+            self._children.remove(node)
+            node._parent = None
+            _removedFromTree(node)
+
+    def takeChild(self, node):
+        if node in self._children:
+            self._children.remove(node)
+            node._parent = None
+            _removedFromTree(node)
+            return True
+        return False
+
+    def _layerIds(self):
+        ids = []
+        for child in self._children:
+            if isinstance(child, QgsLayerTreeGroup):
+                ids.extend(child._layerIds())
+            else:
+                ids.append(child._layer_id)
+        return ids
+
+    def clone(self):
+        group = QgsLayerTreeGroup(self._name)
+        for child in self._children:
+            group.insertChildNode(len(group._children), child.clone())
+        return group
+
+    def setExpanded(self, expanded):
+        self._expanded = expanded
+
+    def isExpanded(self):
+        return self._expanded
+
+
+class QgsLayerTreeRegistryBridge:
+    """
+    Seperti bridge asli: layer yang node-nya keluar dari layer tree
+    ikut dihapus dari project (asli: queued, di sini langsung).
+    """
+
+    def __init__(self):
+        self._enabled = True
+
+    def setEnabled(self, enabled):
+        self._enabled = enabled
+
+    def isEnabled(self):
+        return self._enabled
+
+
+def _removedFromTree(node):
+    project = QgsProject._instance
+    if project is None or not project._bridge.isEnabled():
+        return
+
+    if isinstance(node, QgsLayerTreeGroup):
+        layer_ids = node._layerIds()
+    else:
+        layer_ids = [node._layer_id]
+
+    for layer_id in layer_ids:
+        if layer_id in project._layers and project._root.findLayer(layer_id) is None:
+            project.removeMapLayer(layer_id)
+
+
+class QgsProject:
+
+    _instance = None
+
+    def __init__(self):
+        self._crs = QgsCoordinateReferenceSystem("EPSG:4326")
+        self._context = QgsCoordinateTransformContext()
+        self._layers = {}
+        self._root = QgsLayerTreeGroup()
+        self._bridge = QgsLayerTreeRegistryBridge()
+
+        self.crsChanged = _Signal()
+        self.transformContextChanged = _Signal()
+        self.cleared = _Signal()
+        self.layersAdded = _Signal()
+        self.layersWillBeRemoved = _Signal()
+        self.readProject = _Signal()
+        self.writeProject = _Signal()
+
+    @staticmethod
+    def instance():
+        if QgsProject._instance is None:
+            QgsProject._instance = QgsProject()
+        return QgsProject._instance
+
+    def crs(self):
+        return self._crs
+
+    def setCrs(self, crs):
+        self._crs = crs
+        self.crsChanged.emit()
+
+    def transformContext(self):
+        return self._context
+
+    def mapLayers(self):
+        return dict(self._layers)
+
+    def mapLayer(self, layer_id):
+        return self._layers.get(layer_id)
+
+    def mapLayersByName(self, name):
+        # Linear scan, seperti QgsProject asli
+        return [layer for layer in self._layers.values() if layer.name() == name]
+
+    def addMapLayer(self, layer, add_to_legend=True):
+        self._layers[layer.id()] = layer
+        if add_to_legend:
+            self._root.addLayer(layer)
+        self.layersAdded.emit([layer])
+        return layer
+
+    def removeMapLayer(self, layer_id):
+        layer = self._layers.get(layer_id)
+        if layer is None:
+            return
+        self.layersWillBeRemoved.emit([layer_id])
+        del self._layers[layer_id]
+        node = self._root.findLayer(layer_id)
+        if node is not None and node.parent() is not None:
+            node.parent().removeChildNode(node)
+
+    def layerTreeRoot(self):
+        return self._root
+
+    def layerTreeRegistryBridge(self):
+        return self._bridge
+
+    def clear(self):
+        for layer_id in list(self._layers):
+            self.removeMapLayer(layer_id)
+        self.cleared.emit()
+
+
+# ============================================================
+# Install
+# ============================================================
+
+def _module(name, **attrs):
+    module = types.ModuleType(name)
+    module.__dict__.update(attrs)
+    sys.modules[name] = module
+    return module
+
+
+def install():
+    """
+    Daftarkan stand-in sebagai qgis.core / qgis.PyQt / PyQt5
+    di sys.modules (hanya jika QGIS asli belum ter-import).
+    """
+    if "qgis.core" in sys.modules:
+        return
+
+    core = dict(
+        QgsPointXY=QgsPointXY,
+        QgsGeometry=QgsGeometry,
+        QgsUnitTypes=QgsUnitTypes,
+        QgsCoordinateReferenceSystem=QgsCoordinateReferenceSystem,
+        QgsCoordinateTransform=QgsCoordinateTransform,
+        QgsCoordinateTransformContext=QgsCoordinateTransformContext,
+        QgsCsException=QgsCsException,
+        QgsWkbTypes=QgsWkbTypes,
+        QgsField=QgsField,
+        QgsFields=QgsFields,
+        QgsFeature=QgsFeature,
+        QgsFeatureRequest=QgsFeatureRequest,
+        QgsVectorLayer=QgsVectorLayer,
+        QgsProject=QgsProject,
+        QgsLayerTreeGroup=QgsLayerTreeGroup,
+        QgsLayerTreeLayer=QgsLayerTreeLayer,
+    )
+    for name in (
+        "QgsSingleSymbolRenderer",
+        "QgsFillSymbol",
+        "QgsPalLayerSettings",
+        "QgsTextFormat",
+        "QgsProperty",
+        "QgsVectorLayerSimpleLabeling",
+        "Qgis",
+        "QgsApplication",
+        "QgsMessageLog",
+        "QgsVectorFileWriter",
+    ):
+        core[name] = _anything_class(name)
+
+    qt_core = dict(
+        QSettings=QSettings,
+        QVariant=QVariant,
+        QObject=QObject,
+        pyqtSignal=pyqtSignal,
+    )
+    qt_gui = dict(QColor=_anything_class("QColor"), QFont=_anything_class("QFont"))
+
+    qgis = _module("qgis")
+    qgis.core = _module("qgis.core", **core)
+    qgis.PyQt = _module("qgis.PyQt")
+    qgis.PyQt.QtCore = _module("qgis.PyQt.QtCore", **qt_core)
+    qgis.PyQt.QtGui = _module("qgis.PyQt.QtGui", **qt_gui)
+
+    pyqt5 = _module("PyQt5")
+    pyqt5.QtCore = _module("PyQt5.QtCore", **qt_core)
+    pyqt5.QtGui = _module("PyQt5.QtGui", **qt_gui)
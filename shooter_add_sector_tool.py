@@ -24,22 +24,31 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 # ============================================================
 
-from qgis.gui import QgsMapTool, QgsRubberBand, QgsMapToolIdentify
+from qgis.gui import QgsMapTool, QgsRubberBand
 from qgis.core import (
     QgsWkbTypes, QgsPointXY,
-    QgsDistanceArea, QgsTextAnnotation,
+    QgsDistanceArea,
     QgsProject
 )
-from PyQt5.QtCore import Qt, QPointF, QSizeF
-from PyQt5.QtGui import QColor, QTextDocument
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QColor
 from qgis.utils import iface
 from PyQt5.QtWidgets import QMenu, QAction, QInputDialog
 from .shooter_geometry import ShooterGeometry
+from .shooter_wedge_preview import ShooterWedgePreview
+from .shooter_overlay_item import ShooterOverlayItem
+from .shooter_hover_highlight import ShooterHoverHighlight
 from .shooter_layer_manager import ShooterLayerManager
+from .shooter_settings import ShooterSettings
+from .shooter_icons import ShooterIcons
+from .shooter_sector_index import ShooterSectorIndex
 from .shooter_edit_sector_dialog import ShooterEditSectorDialog
 from .shooter_edit_center_dialog import ShooterEditCenterDialog
 from .shooter_context_menu_builder import ShooterContextMenuBuilder
 
+# Interval pemrosesan mouse move (~1 frame display @60 Hz)
+FRAME_INTERVAL_MS = 16
+
 
 class ShooterAddSectorTool(QgsMapTool):
 
@@ -47,33 +56,10 @@ class ShooterAddSectorTool(QgsMapTool):
         super().__init__(canvas)
         self.canvas = canvas
 
-        from PyQt5.QtGui import QCursor, QPixmap
-        import os
-
         # =========================
-        # Custom Cursor (SVG)
+        # Custom Cursor (SVG, di-render sekali lewat registry)
         # =========================
-        plugin_dir = os.path.dirname(__file__)
-        cursor_path = os.path.join(plugin_dir, "Icon", "shooter-sector.svg")
-        # pixmap = QPixmap(cursor_path)
-        # cursor = QCursor(pixmap, 0, 0)
-        # self.setCursor(cursor)
-        
-        from PyQt5.QtSvg import QSvgRenderer
-        from PyQt5.QtGui import QPainter, QPixmap
-
-        renderer = QSvgRenderer(cursor_path)
-
-        size = 28  # ideal cursor size
-        pixmap = QPixmap(size, size)
-        pixmap.fill(Qt.transparent)
-
-        painter = QPainter(pixmap)
-        renderer.render(painter)
-        painter.end()
-
-        cursor = QCursor(pixmap, size // 2, size // 2)
-        self.setCursor(cursor)
+        self.setCursor(ShooterIcons.cursor("shooter-sector", dpr=canvas.devicePixelRatioF()))
 
         
         self.center = None
@@ -86,11 +72,15 @@ class ShooterAddSectorTool(QgsMapTool):
         self.ctrl_pressed = False
         self.shift_pressed = False
 
+        # Snapshot settings (cache), diperbarui lewat signal changed
+        self.settings = ShooterSettings.instance().values()
+        ShooterSettings.instance().changed.connect(self._onSettingsChanged)
+
         self.canvas.setFocusPolicy(Qt.StrongFocus)
         self.canvas.setFocus()
 
         self.canvas.scene().views()[0].window().statusBar().showMessage(
-            "SHOOTER: Drag to add sector | Ctrl=5° snap | Shift=10°"
+            "SHOOTER: Drag to add sector | Ctrl=5° snap | Shift=10° | Shift (hover)=cycle overlapping sectors"
         )
 
         # Distance Area
@@ -111,11 +101,23 @@ class ShooterAddSectorTool(QgsMapTool):
         self.rb_poly.setStrokeColor(QColor(255, 255, 0, 200))
         self.rb_poly.setWidth(1.0)
 
+        self.preview = ShooterWedgePreview(self.rb_poly)
+
+        # Hover highlight sektor saat idle (Shift = cycle sektor overlap)
+        self.hover = ShooterHoverHighlight(canvas, ["SHOOTER_ADD_SITE", "SHOOTER_ADD_SECTOR"])
+
         # Overlay
-        self.annotation = None
-        self._overlay_doc = QTextDocument()
+        self.overlay = None
         self._last_overlay_pos = None
 
+        # Mouse move coalescing: maks. 1x proses per frame,
+        # hanya posisi cursor terakhir yang diproses
+        self._pending_move = None
+        self._move_timer = QTimer()
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(FRAME_INTERVAL_MS)
+        self._move_timer.timeout.connect(self._processPendingMove)
+
 
 
     def canvasPressEvent(self, event):
@@ -128,15 +130,20 @@ class ShooterAddSectorTool(QgsMapTool):
             feature = self.feature_to_move
             layer = self.layer_to_move
 
+            new_geom = None
             if feature and layer:
                 az, r, bw = feature["azimuth"], feature["radius_m"], feature["beamwidth"]
                 center_pt = QgsPointXY(new_center.x(), new_center.y())
-                new_geom = ShooterGeometry.buildWedgePolygon(center_pt, az, r, bw, 72)
+                # Geometry dan center dalam CRS layer
+                new_geom, layer_center = ShooterLayerManager.buildLayerWedge(
+                    layer, center_pt, az, r, bw
+                )
 
+            if new_geom is not None:
                 layer.startEditing()
                 layer.changeGeometry(feature.id(), new_geom)
-                layer.changeAttributeValue(feature.id(), layer.fields().indexFromName("center_lat"), new_center.y())
-                layer.changeAttributeValue(feature.id(), layer.fields().indexFromName("center_lon"), new_center.x())
+                layer.changeAttributeValue(feature.id(), layer.fields().indexFromName("center_lat"), layer_center.y())
+                layer.changeAttributeValue(feature.id(), layer.fields().indexFromName("center_lon"), layer_center.x())
                 layer.commitChanges()
                 layer.triggerRepaint()
 
@@ -151,33 +158,65 @@ class ShooterAddSectorTool(QgsMapTool):
             self.center = self.toMapCoordinates(event.pos())
             self.last_cursor_pt = self.center
             self.is_dragging = True
+            self.hover.clear()
             self.rb_line.reset(QgsWkbTypes.LineGeometry)
-            self.rb_poly.reset(QgsWkbTypes.PolygonGeometry)
+            self.rb_line.addPoint(self.center, False)
+            self.rb_line.addPoint(self.center, True)
+            self.preview.begin(self.center)
 
 
     def canvasMoveEvent(self, event):
+        cursor_pt = self.toMapCoordinates(event.pos())
+
         if not self.is_dragging or not self.center:
+            if not self.is_picking_center:
+                self.hover.update(cursor_pt)
             return
 
-        cursor_pt = self.toMapCoordinates(event.pos())
         self.last_cursor_pt = cursor_pt
 
+        # Dalam frame yang sama: simpan posisi terakhir saja
+        if self._move_timer.isActive():
+            self._pending_move = (cursor_pt, event.pos())
+            return
+
+        self._processMove(cursor_pt, event.pos())
+        self._move_timer.start()
+
+
+    def _processPendingMove(self):
+        if self._pending_move is None:
+            return
+        if not self.is_dragging or not self.center:
+            self._pending_move = None
+            return
+
+        cursor_pt, pixel_pos = self._pending_move
+        self._pending_move = None
+        self._processMove(cursor_pt, pixel_pos)
+        self._move_timer.start()
+
+
+    def _processMove(self, cursor_pt, pixel_pos):
         # Hitung Azimuth & Radius
         az = ShooterGeometry.calcAzimuth(self.center, cursor_pt)
         az = ShooterGeometry.snapAzimuth(az, self.ctrl_pressed, self.shift_pressed)
         radius = self.dist.measureLine(self.center, cursor_pt)
 
-        # Update RubberBands
-        self.rb_line.reset(QgsWkbTypes.LineGeometry)
-        self.rb_line.addPoint(self.center)
-        self.rb_line.addPoint(cursor_pt)
+        # Update RubberBands (geser vertex, tanpa rebuild)
+        self.rb_line.movePoint(1, cursor_pt)
 
         if radius > 1:
-            geom = ShooterGeometry.buildWedgePolygon(self.center, az, radius, 40, 72)
-            self.rb_poly.setToGeometry(geom, None)
+            # Preview LOD: chord error busur < 1 pixel di layar
+            segments = ShooterGeometry.segmentsForChordError(
+                self.center.distance(cursor_pt),
+                40,
+                self.canvas.mapUnitsPerPixel()
+            )
+            self.preview.update(az, radius, 40, segments)
 
         # Update Overlay Text (AZ & R melayang)
-        self._updateOverlay(cursor_pt, az, radius, event.pos())
+        self._updateOverlay(cursor_pt, az, radius, pixel_pos)
 
 
     def _updateOverlay(self, map_pt, az, radius, pixel_pos):
@@ -189,22 +228,18 @@ class ShooterAddSectorTool(QgsMapTool):
         snap_info = " (10°)" if self.ctrl_pressed and self.shift_pressed else (" (5°)" if self.ctrl_pressed else "")
 
         html = (
-            "<div style='background-color: rgba(0,0,0,160); color: white; padding: 6px; border-radius: 4px; font-size: 11px; white-space: nowrap;'>"
             f"<b>AZ</b>: {az:.1f}°{snap_info}<br>"
             f"<b>R</b>: {radius:.1f} m"
-            "</div>"
         )
 
-        if not self.annotation:
-            self.annotation = QgsTextAnnotation()
-            self.annotation.setFrameSize(QSizeF(0, 0))
-            self.annotation.setFrameOffsetFromReferencePoint(QPointF(15, -15))
-            QgsProject.instance().annotationManager().addAnnotation(self.annotation)
+        if not self.overlay:
+            self.overlay = ShooterOverlayItem(self.canvas)
 
-        self.annotation.setMapPosition(map_pt)
-        self._overlay_doc.setHtml(html)
-        self.annotation.setDocument(self._overlay_doc)
-        self.canvas.refresh()
+        # Canvas item hanya me-repaint area-nya sendiri;
+        # jangan canvas.refresh() (render ulang semua layer)
+        self.overlay.setText(html)
+        self.overlay.setMapPosition(map_pt)
+        self.overlay.show()
 
 
     def canvasReleaseEvent(self, event):
@@ -232,28 +267,28 @@ class ShooterAddSectorTool(QgsMapTool):
             az = ShooterGeometry.calcAzimuth(self.center, self.last_cursor_pt)
             az = ShooterGeometry.snapAzimuth(az, self.ctrl_pressed, self.shift_pressed)
 
-            from qgis.PyQt.QtCore import QSettings
+            settings = self.settings
 
-            settings = QSettings()
-            settings.beginGroup("SHOOTER/settings")
-
-            use_drag_radius = settings.value("use_drag_radius", True, type=bool)
-            default_radius = settings.value("default_radius", 100, type=int)
-            default_beamwidth = settings.value("default_beamwidth", 30, type=int)
-            default_line_color = settings.value("default_line_color", "#FFFF00", type=str)
-            default_line_width = settings.value("default_line_width", 2, type=int)
-
-            settings.endGroup()
+            use_drag_radius = settings["use_drag_radius"]
+            default_radius = settings["default_radius"]
+            default_beamwidth = settings["default_beamwidth"]
+            default_line_color = settings["default_line_color"]
+            default_line_width = settings["default_line_width"]
 
             final_radius = radius_drag if use_drag_radius else default_radius
 
-            geom = ShooterGeometry.buildWedgePolygon(
+            layer = ShooterLayerManager.getOrCreateLayerByName("SHOOTER_ADD_SECTOR")
+            # Geometry dan center dalam CRS layer
+            geom, layer_center = ShooterLayerManager.buildLayerWedge(
+                layer,
                 self.center,
                 az,
                 final_radius,
-                default_beamwidth,
-                72
+                default_beamwidth
             )
+            if geom is None:
+                self._cleanup()
+                return
 
             ShooterLayerManager.addFeatureByLayer(
                 "SHOOTER_ADD_SECTOR",
@@ -264,8 +299,8 @@ class ShooterAddSectorTool(QgsMapTool):
                     "azimuth": az,
                     "radius_m": final_radius,
                     "beamwidth": default_beamwidth,
-                    "center_lat": self.center.y(),
-                    "center_lon": self.center.x(),
+                    "center_lat": layer_center.y(),
+                    "center_lon": layer_center.x(),
                     "line_color": default_line_color,
                     "line_width": default_line_width,
                     "show_label": True
@@ -279,28 +314,17 @@ class ShooterAddSectorTool(QgsMapTool):
 
     def _showContextMenu(self, event):
         layer_names = ["SHOOTER_ADD_SITE", "SHOOTER_ADD_SECTOR"]
-        project = QgsProject.instance()
-        target_layer, target_feature = None, None
-
-        identify = QgsMapToolIdentify(self.canvas)
-
-        for name in layer_names:
-            layers = project.mapLayersByName(name)
-            if not layers:
-                continue
 
-            results = identify.identify(
-                event.x(),
-                event.y(),
-                [layers[0]],
-                QgsMapToolIdentify.TopDownAll
+        # Sektor yang sedang di-highlight (termasuk hasil cycle Shift),
+        # fallback hit test analitik via index sektor
+        target_layer, target_feature = self.hover.current()
+        if not target_layer:
+            target_layer, target_feature = ShooterSectorIndex.hitTest(
+                [ShooterLayerManager.getLayer(name) for name in layer_names],
+                self.toMapCoordinates(event.pos()),
+                self.canvas.mapSettings().destinationCrs()
             )
 
-            if results:
-                target_layer = layers[0]
-                target_feature = results[0].mFeature
-                break
-
         if not target_layer:
             return
 
@@ -325,14 +349,22 @@ class ShooterAddSectorTool(QgsMapTool):
 
         menu.exec_(self.canvas.mapToGlobal(event.pos()))
 
+        # Feature bisa berubah / terhapus lewat menu
+        self.hover.clear()
+
 
     # --- Fungsi Pendukung Identik dengan sebelumnya ---
     def _openEditDialog(self, layer, feature):
         dlg = ShooterEditSectorDialog(feature["azimuth"], feature["radius_m"], feature["beamwidth"], self.canvas)
         if dlg.exec_() == dlg.Accepted:
             new_az, new_r, new_bw = dlg.values()
+            # Atribut center dalam CRS layer
             center = QgsPointXY(feature["center_lon"], feature["center_lat"])
-            new_geom = ShooterGeometry.buildWedgePolygon(center, new_az, new_r, new_bw, 72)
+            new_geom, _layer_center = ShooterLayerManager.buildLayerWedge(
+                layer, center, new_az, new_r, new_bw, layer.crs()
+            )
+            if new_geom is None:
+                return
             layer.startEditing()
             layer.changeGeometry(feature.id(), new_geom)
             layer.changeAttributeValue(feature.id(), layer.fields().indexFromName("azimuth"), new_az)
@@ -345,8 +377,14 @@ class ShooterAddSectorTool(QgsMapTool):
         dlg = ShooterEditCenterDialog(feature["center_lon"], feature["center_lat"], self.canvas)
         if dlg.exec_() == dlg.Accepted:
             n_lon, n_lat = dlg.values()
+            # Dialog menampilkan center dalam CRS layer
             center = QgsPointXY(n_lon, n_lat)
-            new_geom = ShooterGeometry.buildWedgePolygon(center, feature["azimuth"], feature["radius_m"], feature["beamwidth"], 72)
+            new_geom, _layer_center = ShooterLayerManager.buildLayerWedge(
+                layer, center, feature["azimuth"], feature["radius_m"], feature["beamwidth"],
+                layer.crs()
+            )
+            if new_geom is None:
+                return
             layer.startEditing()
             layer.changeGeometry(feature.id(), new_geom)
             layer.changeAttributeValue(feature.id(), layer.fields().indexFromName("center_lon"), n_lon)
@@ -424,15 +462,33 @@ class ShooterAddSectorTool(QgsMapTool):
 
 
     def _cleanup(self):
+        self._move_timer.stop()
+        self._pending_move = None
         self.is_dragging = False
         self.center = None
         self.last_cursor_pt = None
         self._last_overlay_pos = None
-        self.rb_line.reset(); self.rb_poly.reset()
-        if self.annotation:
-            QgsProject.instance().annotationManager().removeAnnotation(self.annotation)
-            self.annotation = None
-        self.canvas.refresh()
+        self.rb_line.reset(QgsWkbTypes.LineGeometry)
+        self.preview.reset()
+        if self.overlay:
+            self.overlay.hide()
+
+
+    def _onSettingsChanged(self, _keys):
+        self.settings = ShooterSettings.instance().values()
+
+
+    def deactivate(self):
+        self._cleanup()
+        self.hover.remove()
+        try:
+            ShooterSettings.instance().changed.disconnect(self._onSettingsChanged)
+        except TypeError:
+            pass
+        if self.overlay:
+            self.canvas.scene().removeItem(self.overlay)
+            self.overlay = None
+        super().deactivate()
 
 
     def keyPressEvent(self, event):
@@ -440,7 +496,13 @@ class ShooterAddSectorTool(QgsMapTool):
             self._cleanup()
             return
         if event.key() == Qt.Key_Control: self.ctrl_pressed = True
-        elif event.key() == Qt.Key_Shift: self.shift_pressed = True
+        elif event.key() == Qt.Key_Shift:
+            self.shift_pressed = True
+            # Shift ditahan: abaikan auto-repeat, satu tekan = satu cycle
+            if event.isAutoRepeat():
+                return
+            if not self.is_dragging and not self.ctrl_pressed:
+                self.hover.cycle()
 
 
     def keyReleaseEvent(self, event):
@@ -24,14 +24,16 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 # ============================================================
 
-from qgis.gui import QgsMapTool, QgsMapToolIdentify
+from qgis.gui import QgsMapTool
 from qgis.core import QgsPointXY, QgsWkbTypes, QgsProject
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QMenu, QAction, QInputDialog
-from qgis.PyQt.QtCore import QSettings
 
-from .shooter_geometry import ShooterGeometry
 from .shooter_layer_manager import ShooterLayerManager
+from .shooter_settings import ShooterSettings
+from .shooter_icons import ShooterIcons
+from .shooter_sector_index import ShooterSectorIndex
+from .shooter_hover_highlight import ShooterHoverHighlight
 from .shooter_edit_sector_dialog import ShooterEditSectorDialog
 from .shooter_edit_center_dialog import ShooterEditCenterDialog
 from .shooter_context_menu_builder import ShooterContextMenuBuilder
@@ -43,41 +45,25 @@ class ShooterAddSiteTool(QgsMapTool):
         super().__init__(canvas)
         self.canvas = canvas
 
-        from PyQt5.QtGui import QCursor, QPixmap
-        import os
-
         # =========================
-        # Custom Cursor (SVG)
+        # Custom Cursor (SVG, di-render sekali lewat registry)
         # =========================
-        plugin_dir = os.path.dirname(__file__)
-        cursor_path = os.path.join(plugin_dir, "Icon", "shooter-site.svg")
-        # pixmap = QPixmap(cursor_path)
-        # cursor = QCursor(pixmap, 0, 0)
-        # self.setCursor(cursor)
-        
-        from PyQt5.QtSvg import QSvgRenderer
-        from PyQt5.QtGui import QPainter, QPixmap
-
-        renderer = QSvgRenderer(cursor_path)
-
-        size = 28
-        pixmap = QPixmap(size, size)
-        pixmap.fill(Qt.transparent)
-
-        painter = QPainter(pixmap)
-        renderer.render(painter)
-        painter.end()
-
-        cursor = QCursor(pixmap, size // 2, size // 2)
-        self.setCursor(cursor)
+        self.setCursor(ShooterIcons.cursor("shooter-site", dpr=canvas.devicePixelRatioF()))
 
         
         self.is_picking_center = False
         self.feature_to_move = None
         self.layer_to_move = None
 
+        # Snapshot settings (cache), diperbarui lewat signal changed
+        self.settings = ShooterSettings.instance().values()
+        ShooterSettings.instance().changed.connect(self._onSettingsChanged)
+
+        # Hover highlight sektor (Shift = cycle sektor overlap)
+        self.hover = ShooterHoverHighlight(canvas, ["SHOOTER_ADD_SITE", "SHOOTER_ADD_SECTOR"])
+
         self.canvas.scene().views()[0].window().statusBar().showMessage(
-            "SHOOTER: Click map to add 3-sector site"
+            "SHOOTER: Click map to add 3-sector site | Shift (hover)=cycle overlapping sectors"
         )
 
 
@@ -89,18 +75,23 @@ class ShooterAddSiteTool(QgsMapTool):
             feature = self.feature_to_move
             layer = self.layer_to_move
             
+            new_geom = None
             if feature and layer:
                 az, r, bw = feature["azimuth"], feature["radius_m"], feature["beamwidth"]
                 center_pt = QgsPointXY(new_center.x(), new_center.y())
-                new_geom = ShooterGeometry.buildWedgePolygon(center_pt, az, r, bw, 72)
-                
+                # Geometry dan center dalam CRS layer
+                new_geom, layer_center = ShooterLayerManager.buildLayerWedge(
+                    layer, center_pt, az, r, bw
+                )
+            
+            if new_geom is not None:
                 layer.startEditing()
                 layer.changeGeometry(feature.id(), new_geom)
                 
                 idx_lat = layer.fields().indexFromName("center_lat")
                 idx_lon = layer.fields().indexFromName("center_lon")
-                if idx_lat != -1: layer.changeAttributeValue(feature.id(), idx_lat, new_center.y())
-                if idx_lon != -1: layer.changeAttributeValue(feature.id(), idx_lon, new_center.x())
+                if idx_lat != -1: layer.changeAttributeValue(feature.id(), idx_lat, layer_center.y())
+                if idx_lon != -1: layer.changeAttributeValue(feature.id(), idx_lon, layer_center.x())
                 
                 layer.commitChanges()
                 layer.triggerRepaint()
@@ -127,9 +118,8 @@ class ShooterAddSiteTool(QgsMapTool):
 
         ShooterLayerManager.ensureShooterGroupAndLayerVisible("SHOOTER_ADD_SITE")
         # Ensure layer is editable (Design Tool behavior)
-        layer_list = QgsProject.instance().mapLayersByName("SHOOTER_ADD_SITE")
-        if layer_list:
-            layer = layer_list[0]
+        layer = ShooterLayerManager.getLayer("SHOOTER_ADD_SITE")
+        if layer:
             if not layer.isEditable():
                 layer.startEditing()
 
@@ -140,26 +130,28 @@ class ShooterAddSiteTool(QgsMapTool):
         # BAGIAN LOOP ADD SITE - START
         # ------------------------------
         
-        settings = QSettings()
-        settings.beginGroup("SHOOTER/settings")
-        default_site_radius = settings.value("default_site_radius", 100, type=int)
-        default_beamwidth = settings.value("default_beamwidth", 30, type=int)
-        default_line_color = settings.value("default_line_color", "#FFFF00", type=str)
-        default_line_width = settings.value("default_line_width", 2, type=int)
-        settings.endGroup()
+        settings = self.settings
+        default_site_radius = settings["default_site_radius"]
+        default_beamwidth = settings["default_beamwidth"]
+        default_line_color = settings["default_line_color"]
+        default_line_width = settings["default_line_width"]
 
         azimuths = [0, 120, 240]
-        for idx, az in enumerate(azimuths, start=1):
-            geom = ShooterGeometry.buildWedgePolygon(
-                center_pt,
-                az,
-                default_site_radius,
-                default_beamwidth,
-                72
-            )
+        site_layer = ShooterLayerManager.getOrCreateLayerByName("SHOOTER_ADD_SITE")
+        # Geometry dan center dalam CRS layer
+        geoms, layer_xy = ShooterLayerManager.buildLayerWedges(
+            site_layer,
+            [[center_pt.x(), center_pt.y()]] * len(azimuths),
+            azimuths,
+            default_site_radius,
+            default_beamwidth
+        )
+        if geoms[0] is None:
+            return
 
-            ShooterLayerManager.addFeatureByLayer(
-                "SHOOTER_ADD_SITE",
+        items = []
+        for idx, (az, geom) in enumerate(zip(azimuths, geoms), start=1):
+            items.append((
                 geom,
                 {
                     "sector_id": f"Sector {idx}",
@@ -167,18 +159,25 @@ class ShooterAddSiteTool(QgsMapTool):
                     "azimuth": az,
                     "radius_m": default_site_radius,
                     "beamwidth": default_beamwidth,
-                    "center_lat": center_pt.y(),
-                    "center_lon": center_pt.x(),
+                    "center_lat": float(layer_xy[0, 1]),
+                    "center_lon": float(layer_xy[0, 0]),
                     "line_color": default_line_color,
                     "line_width": default_line_width,
                     "show_label": True
                 }
-            )
+            ))
+
+        ShooterLayerManager.addFeaturesByLayer("SHOOTER_ADD_SITE", items, f"Add site {dummy_id}")
 
         # ------------------------------
         # BAGIAN LOOP ADD SITE - END
         # ------------------------------
-        self.canvas.refresh()
+
+
+    def canvasMoveEvent(self, event):
+        if self.is_picking_center:
+            return
+        self.hover.update(self.toMapCoordinates(event.pos()))
 
 
     def canvasReleaseEvent(self, event):
@@ -188,30 +187,17 @@ class ShooterAddSiteTool(QgsMapTool):
 
     def _showContextMenu(self, event):
         layer_names = ["SHOOTER_ADD_SITE", "SHOOTER_ADD_SECTOR"]
-        project = QgsProject.instance()
-
-        target_layer = None
-        target_feature = None
-
-        identify = QgsMapToolIdentify(self.canvas)
 
-        for name in layer_names:
-            layers = project.mapLayersByName(name)
-            if not layers:
-                continue
-
-            results = identify.identify(
-                event.x(),
-                event.y(),
-                [layers[0]],
-                QgsMapToolIdentify.TopDownAll
+        # Sektor yang sedang di-highlight (termasuk hasil cycle Shift),
+        # fallback hit test analitik via index sektor
+        target_layer, target_feature = self.hover.current()
+        if not target_layer:
+            target_layer, target_feature = ShooterSectorIndex.hitTest(
+                [ShooterLayerManager.getLayer(name) for name in layer_names],
+                self.toMapCoordinates(event.pos()),
+                self.canvas.mapSettings().destinationCrs()
             )
 
-            if results:
-                target_layer = layers[0]
-                target_feature = results[0].mFeature
-                break
-
         if not target_layer:
             return
 
@@ -236,6 +222,9 @@ class ShooterAddSiteTool(QgsMapTool):
 
         menu.exec_(self.canvas.mapToGlobal(event.pos()))
 
+        # Feature bisa berubah / terhapus lewat menu
+        self.hover.clear()
+
 
     def _openEditDialog(self, layer, feature):
         from .shooter_edit_sector_dialog import ShooterEditSectorDialog
@@ -243,8 +232,13 @@ class ShooterAddSiteTool(QgsMapTool):
         dlg = ShooterEditSectorDialog(feature["azimuth"], feature["radius_m"], feature["beamwidth"], self.canvas)
         if dlg.exec_() == dlg.Accepted:
             new_az, new_r, new_bw = dlg.values()
+            # Atribut center dalam CRS layer
             center = QgsPointXY(feature["center_lon"], feature["center_lat"])
-            new_geom = ShooterGeometry.buildWedgePolygon(center, new_az, new_r, new_bw, 72)
+            new_geom, _layer_center = ShooterLayerManager.buildLayerWedge(
+                layer, center, new_az, new_r, new_bw, layer.crs()
+            )
+            if new_geom is None:
+                return
             layer.startEditing()
             layer.changeGeometry(feature.id(), new_geom)
             layer.changeAttributeValue(feature.id(), layer.fields().indexFromName("azimuth"), new_az)
@@ -258,8 +252,14 @@ class ShooterAddSiteTool(QgsMapTool):
         dlg = ShooterEditCenterDialog(feature["center_lon"], feature["center_lat"], self.canvas)
         if dlg.exec_() == dlg.Accepted:
             n_lon, n_lat = dlg.values()
+            # Dialog menampilkan center dalam CRS layer
             new_center = QgsPointXY(n_lon, n_lat)
-            new_geom = ShooterGeometry.buildWedgePolygon(new_center, feature["azimuth"], feature["radius_m"], feature["beamwidth"], 72)
+            new_geom, _layer_center = ShooterLayerManager.buildLayerWedge(
+                layer, new_center, feature["azimuth"], feature["radius_m"], feature["beamwidth"],
+                layer.crs()
+            )
+            if new_geom is None:
+                return
             layer.startEditing()
             layer.changeGeometry(feature.id(), new_geom)
             layer.changeAttributeValue(feature.id(), layer.fields().indexFromName("center_lon"), n_lon)
@@ -336,3 +336,24 @@ class ShooterAddSiteTool(QgsMapTool):
         from .shooter_settings_dialog import ShooterSettingsDialog
         dlg = ShooterSettingsDialog(self.canvas)
         dlg.exec_()
+
+
+    def _onSettingsChanged(self, _keys):
+        self.settings = ShooterSettings.instance().values()
+
+
+    def deactivate(self):
+        self.hover.remove()
+        try:
+            ShooterSettings.instance().changed.disconnect(self._onSettingsChanged)
+        except TypeError:
+            pass
+        super().deactivate()
+
+
+    def keyPressEvent(self, event):
+        if event.key() == Qt.Key_Shift:
+            # Shift ditahan: abaikan auto-repeat, satu tekan = satu cycle
+            if event.isAutoRepeat():
+                return
+            self.hover.cycle()
@@ -26,6 +26,8 @@
 
 from qgis.PyQt.QtWidgets import QMenu, QAction
 
+from .shooter_icons import ShooterIcons
+
 
 class ShooterContextMenuBuilder:
 
@@ -49,18 +51,8 @@ class ShooterContextMenuBuilder:
         }
         """
 
-        from PyQt5.QtGui import QIcon
-        from PyQt5.QtCore import QSize
-        import os
-
-        plugin_dir = os.path.dirname(__file__)
-        icon_dir = os.path.join(plugin_dir, "Icon")
-
-        def icon(name):
-            path = os.path.join(icon_dir, f"{name}.svg")
-            ic = QIcon()
-            ic.addFile(path, QSize(18, 18))
-            return ic
+        # Icon dari registry (sudah di-render, tanpa baca SVG per klik)
+        icon = ShooterIcons.icon
 
         menu = QMenu(canvas)
 
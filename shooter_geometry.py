@@ -23,24 +23,176 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 # ============================================================
-import math
+import numpy as np
 from qgis.core import QgsPointXY, QgsGeometry
 
+from .shooter_geometry_kernel import (
+    DEFAULT_SEGMENTS,
+    MAX_TOLERANCE_SEGMENTS,
+    M_PER_DEG,
+    calc_azimuth,
+    snap_azimuth,
+    segments_for_chord_error,
+    wgs84_m_per_deg,
+    equirectangular_frame,
+    wedge_rings,
+    wedge_wkbs,
+    curve_polygon_wkb,
+    curve_arc_pieces,
+)
+
+# Langkah beda hingga untuk Jacobian proyeksi (meter)
+FRAME_STEP_M = 100.0
+
+
 class ShooterGeometry:
 
+    # Cache QgsCoordinateTransform: key (source CRS, destination CRS),
+    # value (transform context, transform). Dikosongkan saat CRS
+    # atau transform context project berubah.
+    _transform_cache = {}
+    _transform_signals_connected = False
+    _wgs84_crs = None
+
     @staticmethod
     def calcAzimuth(center: QgsPointXY, point: QgsPointXY) -> float:
-        dx = point.x() - center.x()
-        dy = point.y() - center.y()
-        az = math.degrees(math.atan2(dx, dy))
-        return (az + 360) % 360
+        return calc_azimuth(center.x(), center.y(), point.x(), point.y())
 
     @staticmethod
     def snapAzimuth(az: float, ctrl=False, shift=False) -> float:
-        if not ctrl:
-            return az
-        step = 10 if shift else 5
-        return round(az / step) * step
+        return snap_azimuth(az, ctrl, shift)
+
+
+    @staticmethod
+    def segmentsForChordError(radius: float,
+                              beamwidth: float,
+                              max_error: float,
+                              min_segments: int = 2,
+                              max_segments: int = 72) -> int:
+        return segments_for_chord_error(
+            radius, beamwidth, max_error, min_segments, max_segments
+        )
+
+
+    @staticmethod
+    def storageSegments(radius_m: float, beamwidth: float) -> int:
+        """
+        Jumlah segmen busur untuk geometry yang disimpan ke layer.
+        Default 72 (fixed); jika mode toleransi aktif di Settings,
+        dihitung dari max chord error (meter).
+        """
+        storage = ShooterGeometry._storageSettings()
+        return ShooterGeometry._storageSegmentsFor(
+            [radius_m], [beamwidth], storage
+        )[0]
+
+
+    @staticmethod
+    def _storageSettings() -> dict:
+        from .shooter_settings import ShooterSettings
+
+        settings = ShooterSettings.instance()
+        return {
+            "use_arc_tolerance": settings.value("use_arc_tolerance"),
+            "arc_tolerance_m": settings.value("arc_tolerance_m"),
+            "geodesic_wedges": settings.value("geodesic_wedges"),
+        }
+
+
+    @staticmethod
+    def _storageSegmentsFor(radii, beamwidths, storage) -> list:
+        if not storage["use_arc_tolerance"]:
+            return [DEFAULT_SEGMENTS] * len(radii)
+
+        return [
+            segments_for_chord_error(
+                float(r),
+                float(bw),
+                storage["arc_tolerance_m"],
+                min_segments=2,
+                max_segments=MAX_TOLERANCE_SEGMENTS
+            )
+            for r, bw in zip(radii, beamwidths)
+        ]
+
+
+    # --------------------------------------------------
+    # Coordinate transform cache
+    # --------------------------------------------------
+    @staticmethod
+    def wgs84Crs():
+        if ShooterGeometry._wgs84_crs is None:
+            from qgis.core import QgsCoordinateReferenceSystem
+            ShooterGeometry._wgs84_crs = QgsCoordinateReferenceSystem("EPSG:4326")
+        return ShooterGeometry._wgs84_crs
+
+    @staticmethod
+    def getTransform(source_crs, dest_crs):
+        """
+        Return QgsCoordinateTransform dari cache (main thread only).
+        Transform dibuat ulang jika transform context project berubah.
+        """
+        from qgis.core import QgsProject, QgsCoordinateTransform
+
+        project = QgsProject.instance()
+        ShooterGeometry._connectTransformInvalidation(project)
+
+        context = project.transformContext()
+        key = (
+            source_crs.authid() or source_crs.toWkt(),
+            dest_crs.authid() or dest_crs.toWkt()
+        )
+
+        cached = ShooterGeometry._transform_cache.get(key)
+        if cached is not None and cached[0] == context:
+            return cached[1]
+
+        transform = QgsCoordinateTransform(source_crs, dest_crs, context)
+        ShooterGeometry._transform_cache[key] = (context, transform)
+        return transform
+
+    @staticmethod
+    def transformXY(xy, source_crs, dest_crs):
+        """
+        Transform array titik (N, 2) antar CRS (copy).
+        Return (xy, valid): baris yang tidak finite atau gagal
+        ditransform berisi NaN dengan valid False.
+        """
+        from qgis.core import QgsCsException
+
+        out = _centers_array(xy)
+        valid = np.isfinite(out).all(axis=1)
+        out[~valid] = np.nan
+
+        if source_crs == dest_crs:
+            return out, valid
+
+        transform = ShooterGeometry.getTransform(source_crs, dest_crs)
+        for i in np.flatnonzero(valid):
+            try:
+                p = transform.transform(QgsPointXY(out[i, 0], out[i, 1]))
+            except QgsCsException:
+                out[i] = np.nan
+                valid[i] = False
+                continue
+            out[i, 0] = p.x()
+            out[i, 1] = p.y()
+
+        return out, valid
+
+    @staticmethod
+    def invalidateTransformCache(*_args):
+        ShooterGeometry._transform_cache.clear()
+
+    @staticmethod
+    def _connectTransformInvalidation(project):
+        if ShooterGeometry._transform_signals_connected:
+            return
+
+        project.crsChanged.connect(ShooterGeometry.invalidateTransformCache)
+        project.transformContextChanged.connect(ShooterGeometry.invalidateTransformCache)
+        project.cleared.connect(ShooterGeometry.invalidateTransformCache)
+        ShooterGeometry._transform_signals_connected = True
 
 
     @staticmethod
@@ -50,58 +202,336 @@ class ShooterGeometry:
                           beamwidth: float = 40,
                           segments: int = 72) -> QgsGeometry:
 
-        from qgis.core import (
-            QgsProject,
-            QgsCoordinateReferenceSystem,
-            QgsCoordinateTransform
+        return ShooterGeometry.buildWedgePolygons(
+            [center], [azimuth], [radius_m], [beamwidth], segments
+        )[0]
+
+
+    @staticmethod
+    def buildWedgePolygons(centers,
+                           azimuths,
+                           radii,
+                           beamwidths,
+                           segments=72,
+                           as_wkb: bool = False,
+                           geodesic: bool = False) -> list:
+        """
+        Bangun banyak wedge sekaligus (vectorized NumPy).
+
+        centers    : list QgsPointXY (project CRS) atau array (N, 2)
+        azimuths   : skalar atau sequence panjang N
+        radii      : skalar atau sequence panjang N (meter)
+        beamwidths : skalar atau sequence panjang N (derajat)
+        segments   : skalar atau sequence panjang N (lihat storageSegments)
+        geodesic   : vertex busur dari direct geodesic WGS84
+                     (default: aproksimasi meter per derajat)
+
+        Return list QgsGeometry dalam project CRS,
+        atau list WKB (bytes) jika as_wkb=True.
+        """
+
+        xy, frames, to_project = ShooterGeometry._prepareCenters(centers, geodesic)
+        if len(xy) == 0:
+            return []
+
+        wkbs = wedge_wkbs(
+            xy[:, 0], xy[:, 1],
+            azimuths, radii, beamwidths,
+            segments,
+            frames,
+            geodesic
         )
 
-        project = QgsProject.instance()
-        project_crs = project.crs()
-        wgs84 = QgsCoordinateReferenceSystem("EPSG:4326")
-
-        # --------------------------------------------------
-        # Transform center → WGS84 if needed
-        # --------------------------------------------------
-        if project_crs != wgs84:
-            to_wgs = QgsCoordinateTransform(project_crs, wgs84, project)
-            center_wgs = to_wgs.transform(center)
-        else:
-            center_wgs = center
-
-        half_bw = beamwidth / 2.0
-        start = azimuth - half_bw
-        lat = center_wgs.y()
-
-        m_per_deg_lat = 111320.0
-        m_per_deg_lon = 111320.0 * math.cos(math.radians(lat))
-
-        pts_wgs = [center_wgs]
-
-        for i in range(segments + 1):
-            ang = start + (beamwidth * i / segments)
-            theta = math.radians(90 - ang)
-
-            dx = (radius_m * math.cos(theta)) / m_per_deg_lon
-            dy = (radius_m * math.sin(theta)) / m_per_deg_lat
-
-            pts_wgs.append(
-                QgsPointXY(
-                    center_wgs.x() + dx,
-                    center_wgs.y() + dy
-                )
+        return ShooterGeometry._wkbsToGeometries(wkbs, to_project, as_wkb)
+
+
+    @staticmethod
+    def buildWedgeCurve(center: QgsPointXY,
+                        azimuth: float,
+                        radius_m: float,
+                        beamwidth: float = 40) -> QgsGeometry:
+
+        return ShooterGeometry.buildWedgeCurves(
+            [center], [azimuth], [radius_m], [beamwidth]
+        )[0]
+
+
+    @staticmethod
+    def buildWedgeCurves(centers,
+                         azimuths,
+                         radii,
+                         beamwidths,
+                         as_wkb: bool = False,
+                         geodesic: bool = False) -> list:
+        """
+        Bangun wedge sebagai CurvePolygon:
+        LineString (center → awal busur), CircularString (busur),
+        LineString (akhir busur → center).
+
+        Busur paling akurat pada project CRS proyeksi metrik (mis. UTM),
+        di mana titik kontrol dibangun langsung di project CRS. Busur
+        dipecah per maksimal 90°; pada CRS geografis busur 3 titik
+        adalah lingkaran di ruang derajat (bukan di permukaan), sehingga
+        dipecah lagi sesuai latitude dan radius agar error ≤ arc
+        tolerance Settings (lihat curve_arc_pieces).
+        """
+        from qgis.core import QgsProject
+
+        xy, frames, to_project = ShooterGeometry._prepareCenters(centers, geodesic)
+        n = len(xy)
+        if n == 0:
+            return []
+
+        az = np.broadcast_to(np.asarray(azimuths, dtype=np.float64), (n,))
+        r = np.broadcast_to(np.asarray(radii, dtype=np.float64), (n,))
+        bw = np.broadcast_to(np.asarray(beamwidths, dtype=np.float64), (n,))
+
+        lat = None
+        if QgsProject.instance().crs().isGeographic():
+            lat = xy[:, 1]
+        pieces = curve_arc_pieces(
+            r, bw, lat, ShooterGeometry._storageSettings()["arc_tolerance_m"]
+        )
+
+        # Satu batch kernel per jumlah potongan (segments = 2 × potongan)
+        wkbs = [None] * n
+        for k in np.unique(pieces):
+            rows = np.flatnonzero(pieces == k)
+            rings = wedge_rings(
+                xy[rows, 0], xy[rows, 1],
+                az[rows], r[rows], bw[rows],
+                2 * int(k),
+                None if frames is None else frames[rows],
+                geodesic
+            )
+            for row, wkb in zip(rows, curve_polygon_wkb(rings)):
+                wkbs[row] = wkb
+
+        return ShooterGeometry._wkbsToGeometries(wkbs, to_project, as_wkb)
+
+
+    @staticmethod
+    def buildStoredWedge(center: QgsPointXY,
+                         azimuth: float,
+                         radius_m: float,
+                         beamwidth: float,
+                         curved: bool = False) -> QgsGeometry:
+
+        return ShooterGeometry.buildStoredWedges(
+            [center], [azimuth], [radius_m], [beamwidth], curved
+        )[0]
+
+
+    @staticmethod
+    def buildStoredWedges(centers,
+                          azimuths,
+                          radii,
+                          beamwidths,
+                          curved: bool = False) -> list:
+        """
+        Geometry wedge untuk disimpan ke layer Shooter:
+        CurvePolygon jika curved=True, selain itu polygon
+        dengan jumlah segmen dari storageSegments.
+        Mode geodesic mengikuti Settings.
+        """
+        storage = ShooterGeometry._storageSettings()
+        geodesic = storage["geodesic_wedges"]
+
+        if curved:
+            return ShooterGeometry.buildWedgeCurves(
+                centers, azimuths, radii, beamwidths,
+                geodesic=geodesic
+            )
+
+        n = len(centers)
+        r = np.broadcast_to(np.asarray(radii, dtype=np.float64), (n,))
+        bw = np.broadcast_to(np.asarray(beamwidths, dtype=np.float64), (n,))
+        segments = ShooterGeometry._storageSegmentsFor(r, bw, storage)
+
+        return ShooterGeometry.buildWedgePolygons(
+            centers, azimuths, radii, beamwidths, segments,
+            geodesic=geodesic
+        )
+
+
+    @staticmethod
+    def isProjectedMetricCrs(crs) -> bool:
+        """
+        True untuk CRS proyeksi dengan satuan meter (mis. UTM).
+        """
+        from qgis.core import QgsUnitTypes
+
+        return (
+            crs.isValid()
+            and not crs.isGeographic()
+            and crs.mapUnits() == QgsUnitTypes.DistanceMeters
+        )
+
+
+    @staticmethod
+    def localFrame(center: QgsPointXY):
+        """
+        Frame 2x2 di center (map unit project CRS per meter ke timur /
+        utara), untuk konstruksi wedge cepat tanpa transform per vertex.
+        """
+        return ShooterGeometry.wedgeFrames([center])[0]
+
+
+    @staticmethod
+    def wedgeFrames(xy, geodesic=None):
+        """
+        Frame lokal (N, 2, 2) di tiap center (map unit project CRS per
+        meter ke timur / utara), mengikuti aturan _prepareCenters agar
+        preview dan hit test sama dengan wedge yang disimpan:
+        - project WGS84      : equirectangular (M_PER_DEG), atau skala
+                               ellipsoid WGS84 pada mode geodesic
+        - proyeksi metrik    : Jacobian proyeksi (_projectedFrames)
+        - CRS lain / geodesic: wedge dibangun di WGS84 lalu ditransform,
+                               jadi Jacobian WGS84 → project dikali
+                               frame WGS84 di atas
+        """
+        from qgis.core import QgsProject
+
+        if geodesic is None:
+            geodesic = ShooterGeometry._storageSettings()["geodesic_wedges"]
+
+        xy = _centers_array(xy)
+        crs = QgsProject.instance().crs()
+
+        if crs == ShooterGeometry.wgs84Crs():
+            return np.array([
+                _wgs84_frame(lat, geodesic) for lat in xy[:, 1]
+            ]).reshape(-1, 2, 2)
+
+        if not geodesic and ShooterGeometry.isProjectedMetricCrs(crs):
+            return ShooterGeometry._projectedFrames(xy, crs)
+
+        return ShooterGeometry._projectedFrames(xy, crs, ellipsoidal=geodesic)
+
+
+    @staticmethod
+    def _prepareCenters(centers, geodesic=False):
+        """
+        Siapkan center untuk konstruksi ring.
+
+        Return (xy, frames, to_project):
+        - project WGS84      : xy apa adanya, frames None, tanpa transform
+        - proyeksi metrik    : xy apa adanya (project CRS), frames =
+                               faktor skala lokal proyeksi, tanpa transform
+                               (tidak dipakai pada mode geodesic)
+        - CRS lain           : xy di WGS84, frames None,
+                               to_project = transform WGS84 → project
+        """
+        from qgis.core import QgsProject
+
+        xy = _centers_array(centers)
+
+        project_crs = QgsProject.instance().crs()
+        wgs84 = ShooterGeometry.wgs84Crs()
+
+        if project_crs == wgs84 or len(xy) == 0:
+            return xy, None, None
+
+        if not geodesic and ShooterGeometry.isProjectedMetricCrs(project_crs):
+            frames = ShooterGeometry._projectedFrames(xy, project_crs)
+            return xy, frames, None
+
+        to_wgs = ShooterGeometry.getTransform(project_crs, wgs84)
+        for i in range(len(xy)):
+            p = to_wgs.transform(QgsPointXY(xy[i, 0], xy[i, 1]))
+            xy[i, 0] = p.x()
+            xy[i, 1] = p.y()
+
+        return xy, None, ShooterGeometry.getTransform(wgs84, project_crs)
+
+
+    @staticmethod
+    def _projectedFrames(xy, crs, ellipsoidal=True):
+        """
+        Jacobian lokal proyeksi di tiap center: array (N, 2, 2),
+        kolom 0 = map unit per meter ke timur, kolom 1 = ke utara.
+        Berlaku untuk CRS apa pun yang bisa ditransform ke WGS84.
+        Mencakup scale factor dan meridian convergence proyeksi,
+        sehingga ring bisa dibangun langsung di project CRS.
+        ellipsoidal=False: meter per derajat equirectangular (M_PER_DEG),
+        untuk wedge yang dibangun di WGS84 tanpa mode geodesic.
+        """
+        wgs84 = ShooterGeometry.wgs84Crs()
+        to_wgs = ShooterGeometry.getTransform(crs, wgs84)
+        to_proj = ShooterGeometry.getTransform(wgs84, crs)
+
+        frames = np.empty((len(xy), 2, 2), dtype=np.float64)
+        for i in range(len(xy)):
+            geo = to_wgs.transform(QgsPointXY(xy[i, 0], xy[i, 1]))
+            if ellipsoidal:
+                m_lon, m_lat = wgs84_m_per_deg(geo.y())
+            else:
+                m_lon = M_PER_DEG * np.cos(np.radians(geo.y()))
+                m_lat = M_PER_DEG
+
+            east = to_proj.transform(
+                QgsPointXY(geo.x() + FRAME_STEP_M / m_lon, geo.y())
+            )
+            north = to_proj.transform(
+                QgsPointXY(geo.x(), geo.y() + FRAME_STEP_M / m_lat)
             )
 
-        pts_wgs.append(center_wgs)
+            frames[i, 0, 0] = (east.x() - xy[i, 0]) / FRAME_STEP_M
+            frames[i, 1, 0] = (east.y() - xy[i, 1]) / FRAME_STEP_M
+            frames[i, 0, 1] = (north.x() - xy[i, 0]) / FRAME_STEP_M
+            frames[i, 1, 1] = (north.y() - xy[i, 1]) / FRAME_STEP_M
+
+        return frames
+
+
+    @staticmethod
+    def _wkbsToGeometries(wkbs, to_project, as_wkb):
+        """
+        WKB → QgsGeometry (atau WKB) dalam project CRS.
+        """
+        if to_project is None and as_wkb:
+            return wkbs
+
+        geoms = []
+        for wkb in wkbs:
+            geom = QgsGeometry()
+            geom.fromWkb(wkb)
+            if to_project is not None:
+                geom.transform(to_project)
+            geoms.append(geom)
+
+        if as_wkb:
+            return [bytes(geom.asWkb()) for geom in geoms]
+
+        return geoms
+
+
+# ============================================================
+# QGIS input helpers
+# ============================================================
 
-        geom_wgs = QgsGeometry.fromPolygonXY([pts_wgs])
+def _wgs84_frame(lat, ellipsoidal):
+    """
+    Frame 2x2 WGS84 (derajat per meter timur / utara) di latitude lat:
+    equirectangular, atau skala ellipsoid lokal (mode geodesic).
+    """
+    if not ellipsoidal:
+        return equirectangular_frame(lat)
 
-        # --------------------------------------------------
-        # Transform geometry back → project CRS
-        # --------------------------------------------------
-        if project_crs != wgs84:
-            to_project = QgsCoordinateTransform(wgs84, project_crs, project)
-            geom_wgs.transform(to_project)
+    m_lon, m_lat = wgs84_m_per_deg(lat)
+    return np.array([
+        [1.0 / m_lon, 0.0],
+        [0.0, 1.0 / m_lat],
+    ])
 
-        return geom_wgs
 
+def _centers_array(centers):
+    """
+    QgsPointXY list / (N, 2) array → float64 array (N, 2) (copy).
+    """
+    if isinstance(centers, np.ndarray):
+        return np.array(centers, dtype=np.float64).reshape(-1, 2)
+    return np.array(
+        [(p.x(), p.y()) for p in centers],
+        dtype=np.float64
+    ).reshape(-1, 2)
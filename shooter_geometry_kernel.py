@@ -0,0 +1,605 @@
+# ============================================================
+# SHOOTER - QGIS Plugin
+#
+# Author  : Achmad Amrulloh
+# Email   : achmad.amrulloh@gmail.com
+# LinkedIn: https://www.linkedin.com/in/achmad-amrulloh/
+#
+# Description:
+# Manual Add Sector & Site Tool for RF Planning and RF Optimization.
+#
+# Copyright (C) 2026 Achmad Amrulloh
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# ============================================================
+"""
+Kernel geometry Shooter: azimuth, snapping dan ring wedge di atas float
+dan array NumPy. Tidak bergantung pada qgis, sehingga bisa dipakai di
+batch job headless, benchmark dan worker process.
+ShooterGeometry (shooter_geometry.py) adalah adapter QGIS di atasnya.
+"""
+
+import math
+from functools import lru_cache
+
+import numpy as np
+
+DEFAULT_SEGMENTS = 72
+MAX_TOLERANCE_SEGMENTS = 720
+
+M_PER_DEG = 111320.0
+
+# WGS84 ellipsoid
+WGS84_A = 6378137.0
+WGS84_F = 1 / 298.257223563
+WGS84_E2 = WGS84_F * (2 - WGS84_F)
+
+GEODESIC_MAX_ITER = 20
+
+# Cache koefisien latitude geodesic per band 1e-7° (~1 cm)
+GEODESIC_LAT_BAND = 1e7
+GEODESIC_LAT_CACHE_SIZE = 4096
+_geodesic_lat_cache = {}
+
+# Busur CircularString: span maksimum per potongan (derajat) dan
+# koefisien error busur 3 titik di ruang derajat (lihat curve_arc_pieces)
+CURVE_MAX_SPAN = 90.0
+CURVE_MAX_PIECES = 64
+CURVE_ERROR_COEF = 0.025
+
+
+# ============================================================
+# Azimuth & segment count
+# ============================================================
+
+def calc_azimuth(cx, cy, px, py):
+    """
+    Azimuth (derajat, 0 = utara, searah jarum jam) dari center ke titik.
+    """
+    az = math.degrees(math.atan2(px - cx, py - cy))
+    return (az + 360) % 360
+
+
+def snap_azimuth(az, ctrl=False, shift=False):
+    if not ctrl:
+        return az
+    step = 10 if shift else 5
+    return round(az / step) * step
+
+
+def segments_for_chord_error(radius, beamwidth, max_error,
+                             min_segments=2, max_segments=DEFAULT_SEGMENTS):
+    """
+    Jumlah segmen busur minimum agar chord error (sagitta) tidak
+    melebihi max_error. radius dan max_error dalam satuan yang sama.
+    """
+    if radius <= 0 or max_error <= 0:
+        return max_segments
+    if max_error >= radius:
+        return min_segments
+
+    step = 2.0 * math.acos(1.0 - max_error / radius)
+    segments = math.ceil(math.radians(beamwidth) / step)
+    return max(min_segments, min(max_segments, segments))
+
+
+# ============================================================
+# Wedge rings
+# ============================================================
+
+def wgs84_m_per_deg(lat):
+    """
+    Meter per derajat (lon, lat) pada ellipsoid WGS84 di latitude lat.
+    """
+    phi = math.radians(lat)
+    w = 1.0 - WGS84_E2 * math.sin(phi) ** 2
+    m_lat = WGS84_A * (1.0 - WGS84_E2) / w ** 1.5
+    m_lon = WGS84_A * math.cos(phi) / math.sqrt(w)
+    return math.radians(m_lon), math.radians(m_lat)
+
+
+def _geodesic_lat_terms(lat):
+    """
+    Koefisien geodesic yang hanya bergantung pada latitude center:
+    (sinU1, cosU1, tanU1) dari reduced latitude U1.
+    Di-cache per band latitude (1e-7°) lintas pemanggilan, sehingga
+    preview / rebuild berulang di site yang sama tidak menghitung ulang;
+    dalam satu pemanggilan dihitung sekali per band unik.
+    """
+    bands = np.round(np.asarray(lat, dtype=np.float64) * GEODESIC_LAT_BAND).astype(np.int64)
+    unique_bands, inverse = np.unique(bands, return_inverse=True)
+
+    terms = np.empty((len(unique_bands), 3), dtype=np.float64)
+    missing = []
+    for i, band in enumerate(unique_bands.tolist()):
+        cached = _geodesic_lat_cache.get(band)
+        if cached is None:
+            missing.append(i)
+        else:
+            terms[i] = cached
+
+    if missing:
+        rows = np.array(missing, dtype=np.intp)
+        tan_u1 = (1.0 - WGS84_F) * np.tan(np.radians(unique_bands[rows] / GEODESIC_LAT_BAND))
+        cos_u1 = 1.0 / np.sqrt(1.0 + tan_u1 * tan_u1)
+        terms[rows, 0] = tan_u1 * cos_u1
+        terms[rows, 1] = cos_u1
+        terms[rows, 2] = tan_u1
+
+        if len(_geodesic_lat_cache) + len(rows) > GEODESIC_LAT_CACHE_SIZE:
+            _geodesic_lat_cache.clear()
+        for i in missing:
+            _geodesic_lat_cache[int(unique_bands[i])] = tuple(terms[i].tolist())
+
+    terms = terms[inverse.reshape(-1)]
+    return terms[:, 0], terms[:, 1], terms[:, 2]
+
+
+def geodesic_direct(lon, lat, sin_alpha1, cos_alpha1, distance_m):
+    """
+    Direct geodesic problem (Vincenty) pada ellipsoid WGS84, vectorized.
+
+    lon, lat     : array (N,) titik awal (derajat)
+    sin_alpha1,
+    cos_alpha1   : array (N, M) azimuth awal tiap vertex
+    distance_m   : array (N,) atau (N, M)
+
+    Return (lon2, lat2) array (N, M) dalam derajat.
+    """
+    b = WGS84_A * (1.0 - WGS84_F)
+
+    sin_u1, cos_u1, tan_u1 = _geodesic_lat_terms(lat)
+    sin_u1 = sin_u1[:, None]
+    cos_u1 = cos_u1[:, None]
+    tan_u1 = tan_u1[:, None]
+
+    s = np.broadcast_to(np.asarray(distance_m, dtype=np.float64).reshape(len(lat), -1), sin_alpha1.shape)
+
+    sigma1 = np.arctan2(tan_u1, cos_alpha1)
+    sin_alpha = cos_u1 * sin_alpha1
+    cos2_alpha = 1.0 - sin_alpha * sin_alpha
+    u2 = cos2_alpha * (WGS84_A * WGS84_A - b * b) / (b * b)
+
+    A = 1.0 + u2 / 16384.0 * (4096.0 + u2 * (-768.0 + u2 * (320.0 - 175.0 * u2)))
+    B = u2 / 1024.0 * (256.0 + u2 * (-128.0 + u2 * (74.0 - 47.0 * u2)))
+
+    sigma0 = s / (b * A)
+    sigma = sigma0
+    for _ in range(GEODESIC_MAX_ITER):
+        cos_2sm = np.cos(2.0 * sigma1 + sigma)
+        sin_sigma = np.sin(sigma)
+        cos_sigma = np.cos(sigma)
+        delta_sigma = B * sin_sigma * (
+            cos_2sm + B / 4.0 * (
+                cos_sigma * (-1.0 + 2.0 * cos_2sm * cos_2sm)
+                - B / 6.0 * cos_2sm
+                * (-3.0 + 4.0 * sin_sigma * sin_sigma)
+                * (-3.0 + 4.0 * cos_2sm * cos_2sm)
+            )
+        )
+        sigma_next = sigma0 + delta_sigma
+        converged = np.max(np.abs(sigma_next - sigma)) < 1e-12
+        sigma = sigma_next
+        if converged:
+            break
+
+    cos_2sm = np.cos(2.0 * sigma1 + sigma)
+    sin_sigma = np.sin(sigma)
+    cos_sigma = np.cos(sigma)
+
+    x = sin_u1 * sin_sigma - cos_u1 * cos_sigma * cos_alpha1
+    lat2 = np.arctan2(
+        sin_u1 * cos_sigma + cos_u1 * sin_sigma * cos_alpha1,
+        (1.0 - WGS84_F) * np.sqrt(sin_alpha * sin_alpha + x * x)
+    )
+    lam = np.arctan2(
+        sin_sigma * sin_alpha1,
+        cos_u1 * cos_sigma - sin_u1 * sin_sigma * cos_alpha1
+    )
+    C = WGS84_F / 16.0 * cos2_alpha * (4.0 + WGS84_F * (4.0 - 3.0 * cos2_alpha))
+    L = lam - (1.0 - C) * WGS84_F * sin_alpha * (
+        sigma + C * sin_sigma * (
+            cos_2sm + C * cos_sigma * (-1.0 + 2.0 * cos_2sm * cos_2sm)
+        )
+    )
+
+    return lon[:, None] + np.degrees(L), np.degrees(lat2)
+
+
+def geodesic_inverse(lon1, lat1, lon2, lat2):
+    """
+    Inverse geodesic problem (Vincenty) pada ellipsoid WGS84, vectorized.
+
+    lon1, lat1 : array (N,) titik awal (derajat)
+    lon2, lat2 : array (N,) atau skalar, titik tujuan (derajat)
+
+    Return (distance_m, azimuth) array (N,); azimuth awal dalam derajat
+    searah jarum jam dari utara. Titik yang sama: jarak 0, azimuth 0.
+    """
+    b = WGS84_A * (1.0 - WGS84_F)
+
+    lon1 = np.asarray(lon1, dtype=np.float64)
+    lat1 = np.asarray(lat1, dtype=np.float64)
+    n = len(lat1)
+    lon2 = np.broadcast_to(np.asarray(lon2, dtype=np.float64), (n,))
+    lat2 = np.broadcast_to(np.asarray(lat2, dtype=np.float64), (n,))
+
+    sin_u1, cos_u1, _tan_u1 = _geodesic_lat_terms(lat1)
+    u2 = np.arctan((1.0 - WGS84_F) * np.tan(np.radians(lat2)))
+    sin_u2 = np.sin(u2)
+    cos_u2 = np.cos(u2)
+
+    L = np.radians((lon2 - lon1 + 180.0) % 360.0 - 180.0)
+    lam = L
+    for _ in range(GEODESIC_MAX_ITER):
+        sin_lam = np.sin(lam)
+        cos_lam = np.cos(lam)
+        sin_sigma = np.hypot(
+            cos_u2 * sin_lam,
+            cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lam
+        )
+        cos_sigma = sin_u1 * sin_u2 + cos_u1 * cos_u2 * cos_lam
+        sigma = np.arctan2(sin_sigma, cos_sigma)
+
+        coincident = sin_sigma == 0.0
+        sin_alpha = np.where(
+            coincident, 0.0,
+            cos_u1 * cos_u2 * sin_lam / np.where(coincident, 1.0, sin_sigma)
+        )
+        cos2_alpha = 1.0 - sin_alpha * sin_alpha
+        # Garis ekuator: cos2_alpha = 0
+        cos_2sm = np.where(
+            cos2_alpha == 0.0, 0.0,
+            cos_sigma - 2.0 * sin_u1 * sin_u2 / np.where(cos2_alpha == 0.0, 1.0, cos2_alpha)
+        )
+
+        C = WGS84_F / 16.0 * cos2_alpha * (4.0 + WGS84_F * (4.0 - 3.0 * cos2_alpha))
+        lam_next = L + (1.0 - C) * WGS84_F * sin_alpha * (
+            sigma + C * sin_sigma * (
+                cos_2sm + C * cos_sigma * (-1.0 + 2.0 * cos_2sm * cos_2sm)
+            )
+        )
+        converged = np.max(np.abs(lam_next - lam), initial=0.0) < 1e-12
+        lam = lam_next
+        if converged:
+            break
+
+    sin_lam = np.sin(lam)
+    cos_lam = np.cos(lam)
+
+    u2sq = cos2_alpha * (WGS84_A * WGS84_A - b * b) / (b * b)
+    A = 1.0 + u2sq / 16384.0 * (4096.0 + u2sq * (-768.0 + u2sq * (320.0 - 175.0 * u2sq)))
+    B = u2sq / 1024.0 * (256.0 + u2sq * (-128.0 + u2sq * (74.0 - 47.0 * u2sq)))
+    delta_sigma = B * sin_sigma * (
+        cos_2sm + B / 4.0 * (
+            cos_sigma * (-1.0 + 2.0 * cos_2sm * cos_2sm)
+            - B / 6.0 * cos_2sm
+            * (-3.0 + 4.0 * sin_sigma * sin_sigma)
+            * (-3.0 + 4.0 * cos_2sm * cos_2sm)
+        )
+    )
+
+    distance = b * A * (sigma - delta_sigma)
+    azimuth = np.degrees(np.arctan2(
+        cos_u2 * sin_lam,
+        cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lam
+    ))
+
+    same = (lon1 == lon2) & (lat1 == lat2)
+    return np.where(same, 0.0, distance), np.where(same, 0.0, azimuth)
+
+
+@lru_cache(maxsize=256)
+def unit_arc(beamwidth, segments):
+    """
+    Template busur satuan untuk (beamwidth, segments).
+    Return (sin_off, cos_off): sin/cos offset sudut tiap vertex busur
+    relatif terhadap azimuth, dari -bw/2 sampai +bw/2 (read-only).
+    """
+    steps = np.arange(segments + 1, dtype=np.float64) / segments
+    offsets = np.radians(-beamwidth / 2.0 + beamwidth * steps)
+
+    sin_off = np.sin(offsets)
+    cos_off = np.cos(offsets)
+    sin_off.setflags(write=False)
+    cos_off.setflags(write=False)
+    return sin_off, cos_off
+
+
+def equirectangular_frame(lat):
+    """
+    Frame 2x2 (derajat per meter timur/utara) di latitude lat,
+    konsisten dengan aproksimasi equirectangular wedge_rings.
+    """
+    return np.array([
+        [1.0 / (M_PER_DEG * math.cos(math.radians(lat))), 0.0],
+        [0.0, 1.0 / M_PER_DEG],
+    ])
+
+
+def wedge_arc(cx, cy, frame, azimuth, radius_m, beamwidth, segments):
+    """
+    Titik busur satu wedge (tanpa center) dari template unit_arc:
+    rotasi azimuth + skala radius dalam meter, lalu frame 2x2
+    (map unit per meter) ke koordinat peta. Return (xs, ys).
+    """
+    sin_off, cos_off = unit_arc(float(beamwidth), int(segments))
+
+    az = math.radians(azimuth)
+    sin_az = math.sin(az)
+    cos_az = math.cos(az)
+
+    east_m = radius_m * (sin_az * cos_off + cos_az * sin_off)
+    north_m = radius_m * (cos_az * cos_off - sin_az * sin_off)
+
+    xs = cx + frame[0, 0] * east_m + frame[0, 1] * north_m
+    ys = cy + frame[1, 0] * east_m + frame[1, 1] * north_m
+    return xs, ys
+
+
+def wedge_rings(x, y, azimuths, radii, beamwidths, segments,
+                 frames=None, geodesic=False):
+    """
+    Hitung ring wedge untuk N center sekaligus.
+    Return array (N, segments + 3, 2):
+    center, segments + 1 titik busur, center.
+
+    frames None  : x/y = lon/lat WGS84, hasil dalam derajat
+                   (aproksimasi equirectangular).
+    frames (N,2,2): Jacobian map unit per meter (timur, utara),
+                   hasil langsung dalam satuan CRS x/y.
+    geodesic     : x/y = lon/lat WGS84, vertex busur dari direct
+                   geodesic problem pada ellipsoid WGS84.
+
+    Trig per vertex diambil dari template unit_arc; per sektor hanya
+    rotasi azimuth, skala radius dan koreksi latitude / proyeksi.
+    """
+    n = x.shape[0]
+    az = np.broadcast_to(np.asarray(azimuths, dtype=np.float64), (n,))
+    r = np.broadcast_to(np.asarray(radii, dtype=np.float64), (n,))
+    bw = np.broadcast_to(np.asarray(beamwidths, dtype=np.float64), (n,))
+
+    az_rad = np.radians(az)
+    sin_az = np.sin(az_rad)[:, None]
+    cos_az = np.cos(az_rad)[:, None]
+
+    # Offset sudut per vertex (dibagi per beamwidth unik)
+    sin_off = np.empty((n, segments + 1), dtype=np.float64)
+    cos_off = np.empty((n, segments + 1), dtype=np.float64)
+    for bw_value in np.unique(bw):
+        rows = bw == bw_value
+        sin_off[rows], cos_off[rows] = unit_arc(float(bw_value), int(segments))
+
+    # Rotasi: sin(az + off), cos(az + off)
+    sin_vertex = sin_az * cos_off + cos_az * sin_off
+    cos_vertex = cos_az * cos_off - sin_az * sin_off
+
+    east_m = r[:, None] * sin_vertex
+    north_m = r[:, None] * cos_vertex
+
+    rings = np.empty((n, segments + 3, 2), dtype=np.float64)
+    rings[:, 0, 0] = x
+    rings[:, 0, 1] = y
+
+    if geodesic:
+        rings[:, 1:-1, 0], rings[:, 1:-1, 1] = geodesic_direct(
+            x, y, sin_vertex, cos_vertex, r
+        )
+    elif frames is None:
+        m_per_deg_lon = M_PER_DEG * np.cos(np.radians(y))
+        rings[:, 1:-1, 0] = x[:, None] + east_m / m_per_deg_lon[:, None]
+        rings[:, 1:-1, 1] = y[:, None] + north_m / M_PER_DEG
+    else:
+        rings[:, 1:-1, 0] = (
+            x[:, None]
+            + frames[:, 0, 0, None] * east_m
+            + frames[:, 0, 1, None] * north_m
+        )
+        rings[:, 1:-1, 1] = (
+            y[:, None]
+            + frames[:, 1, 0, None] * east_m
+            + frames[:, 1, 1, None] * north_m
+        )
+
+    rings[:, -1] = rings[:, 0]
+
+    return rings
+
+
+def wedge_wkbs(x, y, azimuths, radii, beamwidths, segments,
+                frames=None, geodesic=False):
+    """
+    WKB wedge untuk N center. segments boleh skalar atau per sektor;
+    sektor dikelompokkan per jumlah segmen (shape ring harus sama).
+    """
+    if np.ndim(segments) == 0:
+        rings = wedge_rings(
+            x, y, azimuths, radii, beamwidths, int(segments),
+            frames, geodesic
+        )
+        return polygon_wkb(rings)
+
+    n = x.shape[0]
+    az = np.broadcast_to(np.asarray(azimuths, dtype=np.float64), (n,))
+    r = np.broadcast_to(np.asarray(radii, dtype=np.float64), (n,))
+    bw = np.broadcast_to(np.asarray(beamwidths, dtype=np.float64), (n,))
+    seg = np.asarray(segments, dtype=np.int64)
+
+    wkbs = [None] * n
+    for seg_value in np.unique(seg):
+        rows = np.flatnonzero(seg == seg_value)
+        rings = wedge_rings(
+            x[rows], y[rows],
+            az[rows], r[rows], bw[rows],
+            int(seg_value),
+            None if frames is None else frames[rows],
+            geodesic
+        )
+        for row, wkb in zip(rows, polygon_wkb(rings)):
+            wkbs[row] = wkb
+
+    return wkbs
+
+
+def polygon_wkb(rings):
+    """
+    Encode array ring (N, P, 2) menjadi list WKB Polygon (little endian),
+    satu buffer untuk semua wedge lalu dipotong per record.
+    """
+    n, n_points = rings.shape[0], rings.shape[1]
+
+    dtype = np.dtype([
+        ("order", "u1"),
+        ("type", "<u4"),
+        ("rings", "<u4"),
+        ("points", "<u4"),
+        ("xy", "<f8", (n_points, 2)),
+    ])
+
+    records = np.empty(n, dtype=dtype)
+    records["order"] = 1
+    records["type"] = 3
+    records["rings"] = 1
+    records["points"] = n_points
+    records["xy"] = rings
+
+    buf = records.tobytes()
+    size = dtype.itemsize
+    return [buf[i * size:(i + 1) * size] for i in range(n)]
+
+
+def curve_arc_pieces(radii, beamwidths, lat=None, max_error=0.5,
+                     max_span=CURVE_MAX_SPAN):
+    """
+    Jumlah potongan busur (CircularString 3 titik) per sektor.
+
+    Di CRS geografis busur digambar sebagai lingkaran di ruang derajat,
+    sedangkan lingkaran di permukaan adalah elips di ruang itu. Error
+    radial terburuk (semua azimuth) busur 3 titik ≈ CURVE_ERROR_COEF ·
+    R · (1 / cos(lat) − 1) · span³ (span radian; fit numerik lat 30–70°,
+    konservatif), sehingga span per potongan dipilih agar error ≤
+    max_error meter. lat None = CRS proyeksi, hanya dibatasi max_span
+    derajat per potongan. Jumlah potongan dibatasi CURVE_MAX_PIECES.
+    """
+    r = np.asarray(radii, dtype=np.float64)
+    bw = np.asarray(beamwidths, dtype=np.float64)
+    r, bw = np.broadcast_arrays(r, bw)
+
+    pieces = np.ceil(bw / max_span)
+    if lat is not None:
+        stretch = 1.0 / np.maximum(np.cos(np.radians(lat)), 1e-6) - 1.0
+        scale = CURVE_ERROR_COEF * r * stretch
+        with np.errstate(divide="ignore"):
+            span = np.cbrt(max_error / scale)
+        pieces = np.maximum(pieces, np.ceil(np.radians(bw) / span))
+
+    return np.clip(pieces, 1, CURVE_MAX_PIECES).astype(np.int64)
+
+
+def curve_polygon_wkb(rings):
+    """
+    Encode ring (N, 2k + 3, 2) [center, 2k + 1 titik busur, center]
+    menjadi list WKB CurvePolygon berisi satu CompoundCurve:
+    LineString, CircularString k potongan, LineString.
+    """
+    n = rings.shape[0]
+    arc_points = rings.shape[1] - 2
+
+    def part(n_points):
+        return np.dtype([
+            ("order", "u1"),
+            ("type", "<u4"),
+            ("points", "<u4"),
+            ("xy", "<f8", (n_points, 2)),
+        ])
+
+    dtype = np.dtype([
+        ("order", "u1"),
+        ("type", "<u4"),
+        ("rings", "<u4"),
+        ("curve_order", "u1"),
+        ("curve_type", "<u4"),
+        ("curves", "<u4"),
+        ("line_start", part(2)),
+        ("arc", part(arc_points)),
+        ("line_end", part(2)),
+    ])
+
+    records = np.empty(n, dtype=dtype)
+    records["order"] = 1
+    records["type"] = 10        # CurvePolygon
+    records["rings"] = 1
+    records["curve_order"] = 1
+    records["curve_type"] = 9   # CompoundCurve
+    records["curves"] = 3
+
+    for name, wkb_type, points in (
+        ("line_start", 2, rings[:, 0:2]),   # LineString
+        ("arc", 8, rings[:, 1:-1]),         # CircularString
+        ("line_end", 2, rings[:, -2:]),     # LineString
+    ):
+        records[name]["order"] = 1
+        records[name]["type"] = wkb_type
+        records[name]["points"] = points.shape[1]
+        records[name]["xy"] = points
+
+    buf = records.tobytes()
+    size = dtype.itemsize
+    return [buf[i * size:(i + 1) * size] for i in range(n)]
+
+
+# ============================================================
+# Hit test
+# ============================================================
+
+def sectors_contain(px, py, cx, cy, frames, azimuths, radii, beamwidths):
+    """
+    Uji analitik titik (px, py) terhadap N sektor, tanpa geometry:
+    offset peta dikembalikan ke meter timur/utara lewat frame (N, 2, 2),
+    lalu cek jarak <= radius dan selisih bearing <= beamwidth / 2.
+    Return array bool (N,).
+    """
+    cx = np.asarray(cx, dtype=np.float64)
+    cy = np.asarray(cy, dtype=np.float64)
+    frames = np.asarray(frames, dtype=np.float64)
+
+    offset = np.stack([px - cx, py - cy], axis=-1)[..., None]
+    east_m, north_m = np.linalg.solve(frames, offset)[..., 0].T
+
+    dist = np.hypot(east_m, north_m)
+    bearing = np.degrees(np.arctan2(east_m, north_m))
+    return _within_sectors(dist, bearing, azimuths, radii, beamwidths)
+
+
+def sectors_contain_geodesic(px, py, cx, cy, azimuths, radii, beamwidths):
+    """
+    Versi geodesic sectors_contain untuk wedge mode geodesic: titik
+    dan center dalam WGS84 (derajat), jarak dan bearing dari
+    geodesic_inverse. Return array bool (N,).
+    """
+    dist, bearing = geodesic_inverse(cx, cy, px, py)
+    return _within_sectors(dist, bearing, azimuths, radii, beamwidths)
+
+
+def _within_sectors(dist, bearing, azimuths, radii, beamwidths):
+    """
+    Jarak <= radius dan selisih bearing <= beamwidth / 2 (array bool).
+    """
+    delta = (bearing - np.asarray(azimuths, dtype=np.float64) + 180.0) % 360.0 - 180.0
+
+    bw = np.asarray(beamwidths, dtype=np.float64)
+    return (
+        (dist <= np.asarray(radii, dtype=np.float64))
+        & ((np.abs(delta) <= bw / 2.0) | (bw >= 360.0) | (dist == 0.0))
+    )
@@ -0,0 +1,173 @@
+# ============================================================
+# SHOOTER - QGIS Plugin
+#
+# Author  : Achmad Amrulloh
+# Email   : achmad.amrulloh@gmail.com
+# LinkedIn: https://www.linkedin.com/in/achmad-amrulloh/
+#
+# Description:
+# Manual Add Sector & Site Tool for RF Planning and RF Optimization.
+#
+# Copyright (C) 2026 Achmad Amrulloh
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# ============================================================
+
+import os
+import sqlite3
+from contextlib import closing
+
+from qgis.core import (
+    Qgis,
+    QgsMessageLog,
+    QgsProject,
+    QgsVectorFileWriter,
+    QgsVectorLayer,
+    QgsWkbTypes,
+)
+
+DEFAULT_GPKG_NAME = "shooter_plan.gpkg"
+
+
+class ShooterGpkgStore:
+    """
+    Backend GeoPackage untuk layer Shooter.
+
+    Satu file .gpkg berisi satu tabel per layer (SHOOTER_ADD_SECTOR,
+    SHOOTER_ADD_SITE) dengan schema field yang sama seperti layer
+    memory, R-tree spatial index, dan journal WAL. Penulisan dilakukan
+    per batch dalam satu transaksi (commitChanges tanpa stop editing).
+    """
+
+    @staticmethod
+    def resolvePath(configured_path: str = "") -> str:
+        """
+        Path GeoPackage: dari settings; jika kosong, di folder project.
+        Return "" untuk project yang belum disimpan, agar project lain
+        tidak berbagi satu file default.
+        """
+        if configured_path:
+            return configured_path
+
+        home = QgsProject.instance().homePath()
+        if not home:
+            return ""
+        return os.path.join(home, DEFAULT_GPKG_NAME)
+
+    @staticmethod
+    def layerUri(path: str, layer_name: str) -> str:
+        return f"{path}|layername={layer_name}"
+
+    @staticmethod
+    def isGpkgLayer(layer) -> bool:
+        return (
+            layer.providerType() == "ogr"
+            and layer.dataProvider().storageType() == "GPKG"
+        )
+
+    @staticmethod
+    def hasTable(path: str, layer_name: str) -> bool:
+        if not os.path.exists(path):
+            return False
+
+        # closing(): "with connect()" hanya commit, tidak menutup koneksi
+        with closing(sqlite3.connect(path)) as conn:
+            row = conn.execute(
+                "SELECT 1 FROM gpkg_contents WHERE table_name = ?",
+                (layer_name,)
+            ).fetchone()
+        return row is not None
+
+    @staticmethod
+    def enableWal(path: str):
+        # journal_mode WAL tersimpan permanen di file database
+        with closing(sqlite3.connect(path)) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+
+    @staticmethod
+    def createTable(path: str, layer_name: str, geometry_type: str, crs, fields):
+        """
+        Buat tabel layer di GeoPackage (file dibuat jika belum ada)
+        dengan R-tree spatial index. Return False jika gagal.
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+        options = QgsVectorFileWriter.SaveVectorOptions()
+        options.driverName = "GPKG"
+        options.layerName = layer_name
+        options.layerOptions = ["SPATIAL_INDEX=YES"]
+        options.actionOnExistingFile = (
+            QgsVectorFileWriter.CreateOrOverwriteLayer
+            if os.path.exists(path)
+            else QgsVectorFileWriter.CreateOrOverwriteFile
+        )
+
+        wkb_type = (
+            QgsWkbTypes.CurvePolygon
+            if geometry_type == "CurvePolygon"
+            else QgsWkbTypes.Polygon
+        )
+
+        writer = QgsVectorFileWriter.create(
+            path,
+            fields,
+            wkb_type,
+            crs,
+            QgsProject.instance().transformContext(),
+            options
+        )
+        error = writer.hasError()
+        message = writer.errorMessage()
+        # Tabel baru ditulis ke disk saat writer dihapus
+        del writer
+
+        if error != QgsVectorFileWriter.NoError:
+            QgsMessageLog.logMessage(
+                f"Cannot create GeoPackage layer {layer_name} in {path}: {message}",
+                "SHOOTER", Qgis.Warning
+            )
+            return False
+
+        ShooterGpkgStore.enableWal(path)
+        return True
+
+    @staticmethod
+    def openLayer(path: str, layer_name: str, geometry_type: str, crs, fields):
+        """
+        Buka (atau buat) layer GeoPackage. Tabel yang sudah ada dipakai
+        apa adanya, sehingga plan bertahan setelah QGIS ditutup.
+        Return None jika file / tabel tidak bisa dibuka.
+
+        Tabel lama dengan CRS lain tetap dipakai: semua jalur tulis
+        (ShooterLayerManager.buildLayerWedges) mentransform wedge dan
+        center_lon / center_lat ke CRS layer.
+        """
+        try:
+            if not ShooterGpkgStore.hasTable(path, layer_name):
+                if not ShooterGpkgStore.createTable(path, layer_name, geometry_type, crs, fields):
+                    return None
+        except (OSError, sqlite3.Error) as e:
+            QgsMessageLog.logMessage(
+                f"Cannot open GeoPackage {path}: {e}", "SHOOTER", Qgis.Warning
+            )
+            return None
+
+        layer = QgsVectorLayer(
+            ShooterGpkgStore.layerUri(path, layer_name),
+            layer_name,
+            "ogr"
+        )
+        if not layer.isValid():
+            return None
+        return layer
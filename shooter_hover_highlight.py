@@ -0,0 +1,120 @@
+# ============================================================
+# SHOOTER - QGIS Plugin
+#
+# Author  : Achmad Amrulloh
+# Email   : achmad.amrulloh@gmail.com
+# LinkedIn: https://www.linkedin.com/in/achmad-amrulloh/
+#
+# Description:
+# Manual Add Sector & Site Tool for RF Planning and RF Optimization.
+#
+# Copyright (C) 2026 Achmad Amrulloh
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# ============================================================
+
+from qgis.gui import QgsRubberBand
+from qgis.core import QgsPointXY, QgsWkbTypes
+from PyQt5.QtGui import QColor
+
+from .shooter_layer_manager import ShooterLayerManager
+from .shooter_sector_index import ShooterSectorIndex
+
+
+class ShooterHoverHighlight:
+    """
+    Highlight sektor di bawah cursor saat tool idle.
+
+    Tiap mouse move hanya query ShooterSectorIndex (bbox + uji
+    analitik); satu rubber band dipakai ulang dan baru di-set ulang
+    jika sektor yang di-highlight berganti. Tidak ada canvas.refresh().
+    Sektor overlap bisa di-cycle dengan cycle() (tombol Shift di tool).
+    """
+
+    def __init__(self, canvas, layer_names):
+        self.canvas = canvas
+        self.layer_names = list(layer_names)
+
+        self.rb = QgsRubberBand(canvas, QgsWkbTypes.PolygonGeometry)
+        self.rb.setFillColor(QColor(0, 255, 255, 40))
+        self.rb.setStrokeColor(QColor(0, 255, 255, 220))
+        self.rb.setWidth(2.0)
+
+        self._hits = []         # [(layer, fid)] di bawah cursor
+        self._keys = ()         # ((layer id, fid), ...) untuk deteksi perubahan
+        self._position = 0      # index sektor yang di-highlight (cycle)
+        self._shown = None      # (layer id, fid) yang sedang di rubber band
+
+    def update(self, map_point: QgsPointXY):
+        hits = ShooterSectorIndex.hitsAt(
+            [ShooterLayerManager.getLayer(name) for name in self.layer_names],
+            map_point,
+            self.canvas.mapSettings().destinationCrs()
+        )
+
+        keys = tuple((layer.id(), fid) for layer, fid in hits)
+        if keys == self._keys:
+            return
+
+        self._hits = hits
+        self._keys = keys
+        self._position = 0
+        self._show()
+
+    def cycle(self):
+        """
+        Pindah ke sektor overlap berikutnya. Return True jika berganti.
+        """
+        if len(self._hits) < 2:
+            return False
+
+        self._position = (self._position + 1) % len(self._hits)
+        self._show()
+        return True
+
+    def current(self):
+        """
+        (layer, feature) yang sedang di-highlight, atau (None, None).
+        """
+        if not self._hits:
+            return None, None
+
+        layer, fid = self._hits[self._position]
+        return layer, layer.getFeature(fid)
+
+    def clear(self):
+        self._hits = []
+        self._keys = ()
+        self._position = 0
+        self._show()
+
+    def remove(self):
+        self.clear()
+        self.canvas.scene().removeItem(self.rb)
+
+    def _show(self):
+        if not self._hits:
+            if self._shown is not None:
+                self.rb.reset(QgsWkbTypes.PolygonGeometry)
+                self._shown = None
+            return
+
+        key = self._keys[self._position]
+        if key == self._shown:
+            return
+
+        layer, fid = self._hits[self._position]
+        # setToGeometry transform dari CRS layer ke CRS canvas
+        self.rb.setToGeometry(layer.getFeature(fid).geometry(), layer)
+        self._shown = key
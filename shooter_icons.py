@@ -0,0 +1,147 @@
+# ============================================================
+# SHOOTER - QGIS Plugin
+#
+# Author  : Achmad Amrulloh
+# Email   : achmad.amrulloh@gmail.com
+# LinkedIn: https://www.linkedin.com/in/achmad-amrulloh/
+#
+# Description:
+# Manual Add Sector & Site Tool for RF Planning and RF Optimization.
+#
+# Copyright (C) 2026 Achmad Amrulloh
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# ============================================================
+
+import os
+
+from qgis.PyQt.QtCore import Qt
+from qgis.PyQt.QtGui import QCursor, QGuiApplication, QIcon, QPainter, QPixmap
+from qgis.PyQt.QtSvg import QSvgRenderer
+
+PLUGIN_DIR = os.path.dirname(__file__)
+
+# Icon context menu (ShooterContextMenuBuilder)
+MENU_ICONS = (
+    "edit", "move", "coordinates", "color",
+    "rename", "toggle", "delete", "settings",
+)
+MENU_ICON_SIZE = 18
+
+# Cursor map tool
+TOOL_CURSORS = ("shooter-sector", "shooter-site")
+CURSOR_SIZE = 28
+
+
+class ShooterIcons:
+    """
+    Registry icon & cursor Shooter untuk seluruh proses.
+
+    SVG dibaca dan di-render sekali per (nama, ukuran, device pixel
+    ratio); QIcon / QCursor yang sudah jadi dibagikan dari cache,
+    sehingga pembuatan tool dan context menu tidak menyentuh disk.
+    """
+
+    _icon_dir = None
+    _renderers = {}     # nama → QSvgRenderer
+    _pixmaps = {}       # (nama, ukuran, dpr) → QPixmap
+    _icons = {}         # (nama, ukuran) → QIcon
+    _cursors = {}       # (nama, ukuran, dpr) → QCursor
+
+    @staticmethod
+    def iconDir():
+        # Folder icon: "Icon" (path lama) atau "icon"
+        if ShooterIcons._icon_dir is None:
+            for name in ("Icon", "icon"):
+                path = os.path.join(PLUGIN_DIR, name)
+                if os.path.isdir(path):
+                    ShooterIcons._icon_dir = path
+                    break
+            else:
+                ShooterIcons._icon_dir = os.path.join(PLUGIN_DIR, "Icon")
+        return ShooterIcons._icon_dir
+
+    @staticmethod
+    def devicePixelRatios():
+        """
+        DPR semua layar yang terhubung (minimal 1.0).
+        """
+        ratios = {1.0}
+        for screen in QGuiApplication.screens():
+            ratios.add(float(screen.devicePixelRatio()))
+        return sorted(ratios)
+
+    @staticmethod
+    def pixmap(name, size, dpr=1.0):
+        key = (name, size, dpr)
+        pixmap = ShooterIcons._pixmaps.get(key)
+        if pixmap is not None:
+            return pixmap
+
+        renderer = ShooterIcons._renderers.get(name)
+        if renderer is None:
+            renderer = QSvgRenderer(os.path.join(ShooterIcons.iconDir(), f"{name}.svg"))
+            ShooterIcons._renderers[name] = renderer
+
+        device_size = int(round(size * dpr))
+        pixmap = QPixmap(device_size, device_size)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
+        renderer.render(painter)
+        painter.end()
+
+        pixmap.setDevicePixelRatio(dpr)
+        ShooterIcons._pixmaps[key] = pixmap
+        return pixmap
+
+    @staticmethod
+    def icon(name, size=MENU_ICON_SIZE):
+        key = (name, size)
+        icon = ShooterIcons._icons.get(key)
+        if icon is None:
+            icon = QIcon()
+            for dpr in ShooterIcons.devicePixelRatios():
+                icon.addPixmap(ShooterIcons.pixmap(name, size, dpr))
+            ShooterIcons._icons[key] = icon
+        return icon
+
+    @staticmethod
+    def cursor(name, size=CURSOR_SIZE, dpr=1.0):
+        key = (name, size, dpr)
+        cursor = ShooterIcons._cursors.get(key)
+        if cursor is None:
+            # Hotspot di tengah pixmap (hotX = hotY = -1)
+            cursor = QCursor(ShooterIcons.pixmap(name, size, dpr))
+            ShooterIcons._cursors[key] = cursor
+        return cursor
+
+    @staticmethod
+    def preload():
+        """
+        Render semua icon menu dan cursor tool di awal (initGui),
+        agar klik kanan pertama pun tanpa I/O disk.
+        """
+        for name in MENU_ICONS:
+            ShooterIcons.icon(name)
+        for name in TOOL_CURSORS:
+            for dpr in ShooterIcons.devicePixelRatios():
+                ShooterIcons.cursor(name, CURSOR_SIZE, dpr)
+
+    @staticmethod
+    def clear():
+        ShooterIcons._renderers.clear()
+        ShooterIcons._pixmaps.clear()
+        ShooterIcons._icons.clear()
+        ShooterIcons._cursors.clear()
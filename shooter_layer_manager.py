@@ -24,7 +24,13 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 # ============================================================
 
+import numpy as np
+
 from qgis.core import (
+    Qgis,
+    QgsCsException,
+    QgsMessageLog,
+    QgsPointXY,
     QgsVectorLayer,
     QgsProject,
     QgsField,
@@ -35,54 +41,158 @@ from qgis.core import (
     QgsPalLayerSettings,
     QgsTextFormat,
     QgsProperty,
-    QgsVectorLayerSimpleLabeling
+    QgsVectorLayerSimpleLabeling,
+    QgsWkbTypes
 )
 
-from PyQt5.QtCore import QVariant, QSettings
+from PyQt5.QtCore import QVariant
 from PyQt5.QtGui import QColor, QFont
 from qgis.core import QgsProperty
 
+from .shooter_settings import ShooterSettings
+from .shooter_geometry import ShooterGeometry
+from .shooter_gpkg_store import ShooterGpkgStore
+
 LAYER_NAME = "SHOOTER_ADD_SECTOR"
 LAYER_ADD_SECTOR = "SHOOTER_ADD_SECTOR"
 LAYER_ADD_SITE   = "SHOOTER_ADD_SITE"
 
+# Storage backend layer Shooter (settings "storage_backend")
+STORAGE_MEMORY = "memory"
+STORAGE_GPKG = "gpkg"
+
+# Role layer Shooter yang dilacak registry
+SHOOTER_LAYER_ROLES = (LAYER_ADD_SECTOR, LAYER_ADD_SITE)
+
 
 class ShooterLayerManager:
 
+    # Registry layer Shooter: role (nama layer) → layer id.
+    # Sinkron lewat signal project layersAdded / layersWillBeRemoved
+    # dan nameChanged tiap layer.
+    _registry = {}
+    _registry_project = None
+    _watched_layer_ids = set()
+
+    # --------------------------------------------------
+    # Layer registry
+    # --------------------------------------------------
+    @staticmethod
+    def getLayer(layer_name: str):
+        """
+        Lookup O(1) layer Shooter berdasarkan role. Nama lain
+        fallback ke QgsProject.mapLayersByName.
+        """
+        project = QgsProject.instance()
+
+        if layer_name not in SHOOTER_LAYER_ROLES:
+            layers = project.mapLayersByName(layer_name)
+            return layers[0] if layers else None
+
+        ShooterLayerManager._ensureRegistry(project)
+
+        layer_id = ShooterLayerManager._registry.get(layer_name)
+        if layer_id is None:
+            return None
+        return project.mapLayer(layer_id)
+
+    @staticmethod
+    def _ensureRegistry(project):
+        if ShooterLayerManager._registry_project is project:
+            return
+
+        ShooterLayerManager._registry_project = project
+        project.layersAdded.connect(ShooterLayerManager._onLayersAdded)
+        project.layersWillBeRemoved.connect(ShooterLayerManager._onLayersWillBeRemoved)
+
+        ShooterLayerManager._watchLayers(project.mapLayers().values())
+        ShooterLayerManager._rebuildRegistry()
+
+    @staticmethod
+    def _rebuildRegistry(excluded_ids=()):
+        registry = {}
+        for layer_id, layer in QgsProject.instance().mapLayers().items():
+            if layer_id in excluded_ids:
+                continue
+            name = layer.name()
+            if name in SHOOTER_LAYER_ROLES and name not in registry:
+                registry[name] = layer_id
+
+        ShooterLayerManager._registry = registry
+
+    @staticmethod
+    def _watchLayers(layers):
+        # Rename layer bisa mengubah role-nya
+        for layer in layers:
+            if layer.id() in ShooterLayerManager._watched_layer_ids:
+                continue
+            layer.nameChanged.connect(ShooterLayerManager._rebuildRegistry)
+            ShooterLayerManager._watched_layer_ids.add(layer.id())
+
+    @staticmethod
+    def _onLayersAdded(layers):
+        ShooterLayerManager._watchLayers(layers)
+
+        registry = ShooterLayerManager._registry
+        for layer in layers:
+            name = layer.name()
+            if name in SHOOTER_LAYER_ROLES and name not in registry:
+                registry[name] = layer.id()
+
+    @staticmethod
+    def _onLayersWillBeRemoved(layer_ids):
+        removed = set(layer_ids)
+        ShooterLayerManager._watched_layer_ids -= removed
+
+        if removed & set(ShooterLayerManager._registry.values()):
+            # Cari pengganti (layer lain dengan nama yang sama)
+            ShooterLayerManager._rebuildRegistry(removed)
+
+
     @staticmethod
     def getOrCreateLayerByName(layer_name: str):
         project = QgsProject.instance()
-        layers = project.mapLayersByName(layer_name)
-        
-        if layers:
-            layer = layers[0]
+        layer = ShooterLayerManager.getLayer(layer_name)
+
+        if layer:
             ShooterLayerManager.ensureShooterGroupAndLayerVisible(layer_name)
             return layer
 
         # Jika belum ada, buat baru
         project_crs = QgsProject.instance().crs().authid()
 
-        layer = QgsVectorLayer(
-            f"Polygon?crs={project_crs}",
-            layer_name,
-            "memory"
-        )
-        provider = layer.dataProvider()
-
-        # Define fields
-        fields = QgsFields()
-        fields.append(QgsField("sector_id", QVariant.String))
-        fields.append(QgsField("dummy_id", QVariant.String))
-        fields.append(QgsField("azimuth", QVariant.Double))
-        fields.append(QgsField("radius_m", QVariant.Double))
-        fields.append(QgsField("beamwidth", QVariant.Double))
-        fields.append(QgsField("center_lat", QVariant.Double))
-        fields.append(QgsField("center_lon", QVariant.Double))
-        fields.append(QgsField("line_color", QVariant.String))
-        fields.append(QgsField("line_width", QVariant.Int))
-        fields.append(QgsField("show_label", QVariant.Bool))
-        provider.addAttributes(fields)
-        layer.updateFields()
+        settings = ShooterSettings.instance()
+        geometry_type = "CurvePolygon" if settings.value("store_as_curves") else "Polygon"
+
+        fields = ShooterLayerManager.shooterFields()
+
+        layer = None
+        if settings.value("storage_backend") == STORAGE_GPKG:
+            gpkg_path = ShooterGpkgStore.resolvePath(settings.value("gpkg_path"))
+            if gpkg_path:
+                layer = ShooterGpkgStore.openLayer(
+                    gpkg_path,
+                    layer_name,
+                    geometry_type,
+                    QgsProject.instance().crs(),
+                    fields
+                )
+            else:
+                QgsMessageLog.logMessage(
+                    f"{layer_name}: save the project or set a GeoPackage path "
+                    "in Settings to store layers in GeoPackage; using a memory layer.",
+                    "SHOOTER", Qgis.Info
+                )
+
+        # Default (atau GeoPackage gagal dibuka): layer memory
+        if layer is None:
+            layer = QgsVectorLayer(
+                f"{geometry_type}?crs={project_crs}",
+                layer_name,
+                "memory"
+            )
+            layer.dataProvider().addAttributes(fields)
+            layer.updateFields()
 
         # Styling & Labeling (Sama seperti sebelumnya)
         symbol = QgsFillSymbol.createSimple({"style": "no"})
@@ -117,10 +227,7 @@ class ShooterLayerManager:
 
         
 
-        settings = QSettings()
-        settings.beginGroup("SHOOTER/settings")
-        default_text_color = settings.value("default_text_color", "#000000", type=str)
-        settings.endGroup()
+        default_text_color = settings.value("default_text_color")
 
         text_format = QgsTextFormat()
         text_format.setFont(QFont("Arial", 10, QFont.Bold))
@@ -150,15 +257,148 @@ class ShooterLayerManager:
 
 
 
+    @staticmethod
+    def shooterFields() -> QgsFields:
+        """
+        Schema field layer Shooter (sama untuk memory dan GeoPackage).
+        """
+        fields = QgsFields()
+        fields.append(QgsField("sector_id", QVariant.String))
+        fields.append(QgsField("dummy_id", QVariant.String))
+        fields.append(QgsField("azimuth", QVariant.Double))
+        fields.append(QgsField("radius_m", QVariant.Double))
+        fields.append(QgsField("beamwidth", QVariant.Double))
+        fields.append(QgsField("center_lat", QVariant.Double))
+        fields.append(QgsField("center_lon", QVariant.Double))
+        fields.append(QgsField("line_color", QVariant.String))
+        fields.append(QgsField("line_width", QVariant.Int))
+        fields.append(QgsField("show_label", QVariant.Bool))
+        return fields
+
+
+    @staticmethod
+    def isCurveLayer(layer) -> bool:
+        """
+        True jika layer menyimpan wedge sebagai CurvePolygon.
+        """
+        return QgsWkbTypes.isCurvedType(layer.wkbType())
+
+
+    @staticmethod
+    def buildLayerWedges(layer, centers, azimuths, radii, beamwidths, centers_crs=None):
+        """
+        Wedge siap tulis ke layer Shooter, dipakai semua jalur tulis
+        agar penanganan CRS seragam.
+
+        Center (N, 2) dalam centers_crs (default CRS project). Wedge
+        dibangun di CRS project, lalu geometry dan center ditransform
+        ke CRS layer: atribut center_lon / center_lat selalu dalam CRS
+        layer (konvensi hit test ShooterSectorIndex).
+
+        Return (geoms, layer_xy); baris yang gagal ditransform berisi
+        geometry None dan center NaN.
+        """
+        project_crs = QgsProject.instance().crs()
+        layer_crs = layer.crs()
+        if centers_crs is None:
+            centers_crs = project_crs
+
+        xy = np.array(centers, dtype=np.float64).reshape(-1, 2)
+        n = len(xy)
+        project_xy, valid = ShooterGeometry.transformXY(xy, centers_crs, project_crs)
+
+        rows = np.flatnonzero(valid)
+        built = ShooterGeometry.buildStoredWedges(
+            project_xy[rows],
+            np.broadcast_to(np.asarray(azimuths, dtype=np.float64), (n,))[rows],
+            np.broadcast_to(np.asarray(radii, dtype=np.float64), (n,))[rows],
+            np.broadcast_to(np.asarray(beamwidths, dtype=np.float64), (n,))[rows],
+            ShooterLayerManager.isCurveLayer(layer)
+        ) if len(rows) else []
+
+        geoms = [None] * n
+        for i, geom in zip(rows, built):
+            geoms[i] = geom
+
+        if layer_crs == project_crs:
+            return geoms, project_xy
+
+        # Center input yang sudah dalam CRS layer dipakai apa adanya
+        if centers_crs == layer_crs:
+            layer_xy = xy.copy()
+            layer_xy[~valid] = np.nan
+        else:
+            layer_xy, layer_valid = ShooterGeometry.transformXY(project_xy, project_crs, layer_crs)
+            valid &= layer_valid
+
+        to_layer = ShooterGeometry.getTransform(project_crs, layer_crs)
+        for i in np.flatnonzero(valid):
+            try:
+                geoms[i].transform(to_layer)
+            except QgsCsException:
+                valid[i] = False
+
+        for i in np.flatnonzero(~valid):
+            geoms[i] = None
+            layer_xy[i] = np.nan
+
+        return geoms, layer_xy
+
+
+    @staticmethod
+    def buildLayerWedge(layer, center: QgsPointXY, azimuth, radius_m, beamwidth, center_crs=None):
+        """
+        Versi satu wedge dari buildLayerWedges.
+        Return (geometry, center dalam CRS layer) atau (None, None).
+        """
+        geoms, layer_xy = ShooterLayerManager.buildLayerWedges(
+            layer, [[center.x(), center.y()]],
+            [azimuth], [radius_m], [beamwidth], center_crs
+        )
+        if geoms[0] is None:
+            return None, None
+        return geoms[0], QgsPointXY(float(layer_xy[0, 0]), float(layer_xy[0, 1]))
+
+
     @staticmethod
     def addFeatureByLayer(layer_name: str, geometry, attrs: dict):
-        layer = ShooterLayerManager.getOrCreateLayerByName(layer_name)
+        ShooterLayerManager.addFeaturesByLayer(layer_name, [(geometry, attrs)])
 
-        feature = QgsFeature(layer.fields())
-        for key, val in attrs.items():
-            feature[key] = val
 
-        feature.setGeometry(geometry)
+    @staticmethod
+    def addFeaturesByLayer(layer_name: str, items, description: str = "Add Shooter features"):
+        """
+        Tambah banyak feature sekaligus: [(geometry, attrs), ...].
+        Layer di-resolve sekali, index field di-cache per set key,
+        satu addFeatures dalam satu edit command (satu langkah undo)
+        dan satu repaint.
+        """
+        items = list(items)
+        if not items:
+            return []
+
+        layer = ShooterLayerManager.getOrCreateLayerByName(layer_name)
+        fields = layer.fields()
+        field_count = fields.count()
+
+        index_cache = {}
+        features = []
+        for geometry, attrs in items:
+            keys = tuple(attrs.keys())
+            indexes = index_cache.get(keys)
+            if indexes is None:
+                indexes = [fields.indexFromName(key) for key in keys]
+                index_cache[keys] = indexes
+
+            values = [None] * field_count
+            for idx, val in zip(indexes, attrs.values()):
+                if idx != -1:
+                    values[idx] = val
+
+            feature = QgsFeature(fields)
+            feature.setAttributes(values)
+            feature.setGeometry(geometry)
+            features.append(feature)
 
         # =========================================
         # ALWAYS KEEP LAYER EDITABLE
@@ -166,57 +406,101 @@ class ShooterLayerManager:
         if not layer.isEditable():
             layer.startEditing()
 
-        layer.addFeature(feature)
+        # Edit lain yang belum di-commit (mis. geometry digeser user)
+        had_pending_edits = layer.isModified()
+
+        layer.beginEditCommand(description)
+        try:
+            added = layer.addFeatures(features)
+        except Exception:
+            layer.destroyEditCommand()
+            raise
+        if not added:
+            layer.destroyEditCommand()
+            return []
+        layer.endEditCommand()
+
+        # GeoPackage: tulis batch dalam satu transaksi, tetap editable.
+        # commitChanges menulis seluruh edit buffer, jadi hanya dilakukan
+        # jika buffer tidak berisi edit lain; jika ada, batch ikut
+        # tersimpan saat user menyimpan edit layer.
+        if ShooterGpkgStore.isGpkgLayer(layer) and not had_pending_edits:
+            layer.commitChanges(False)
+
         layer.triggerRepaint()
+        return features
 
 
+    @staticmethod
+    def _shooterGroup(root):
+        """
+        Mengembalikan group SHOOTER di posisi paling atas root.
+        Group hanya dibuat / dipindah jika posisinya belum benar.
+        """
+        group = root.findGroup("SHOOTER")
+        if group is None:
+            return root.insertGroup(0, "SHOOTER")
+
+        ShooterLayerManager._moveTreeNode(group, root, 0)
+        return group
+
+    @staticmethod
+    def _moveTreeNode(node, new_parent, index=0):
+        """
+        Memindahkan node layer tree ke new_parent pada posisi index
+        tanpa clone. Tidak melakukan apa pun jika posisi sudah benar,
+        sehingga tidak ada sinyal layer tree yang terpicu.
+        """
+        parent = node.parent()
+        children = new_parent.children()
+        if parent is new_parent and index < len(children) and children[index] is node:
+            return False
+
+        # takeChild melepas node tanpa menghapusnya; node tetap utuh
+        # (style, expanded state, custom property) saat dipasang kembali.
+        # Registry bridge dimatikan selama take / insert: jika tidak,
+        # layer yang sempat keluar dari tree ikut dihapus dari project.
+        bridge = QgsProject.instance().layerTreeRegistryBridge()
+        enabled = bridge.isEnabled()
+        bridge.setEnabled(False)
+        try:
+            if parent is not None:
+                parent.takeChild(node)
+            new_parent.insertChildNode(index, node)
+        finally:
+            bridge.setEnabled(enabled)
+        return True
+
     @staticmethod
     def ensureShooterGroupAndLayerVisible(layer_name: str):
         """
         Memastikan Group SHOOTER ada dan layer berada di dalamnya secara aman.
+        Idempotent: jika susunan sudah benar, layer tree tidak diubah.
         """
-        project = QgsProject.instance()
-        root = project.layerTreeRoot()
+        layer = ShooterLayerManager.getLayer(layer_name)
+        if not layer:
+            return
+
+        root = QgsProject.instance().layerTreeRoot()
 
         # 1. Pastikan Group SHOOTER ada di paling atas
-        group = root.findGroup("SHOOTER")
-        if not group:
-            group = root.insertGroup(0, "SHOOTER")
-        
-        # 2. Cari layer berdasarkan nama
-        layers = project.mapLayersByName(layer_name)
-        if not layers:
+        group = ShooterLayerManager._shooterGroup(root)
+
+        # 2. Cari node layer di seluruh tree
+        layer_node = root.findLayer(layer.id())
+        if not layer_node:
             return
-        
-        layer = layers[0]
-        layer_id = layer.id()
-        
-        # Cari node layer di seluruh tree
-        layer_node = root.findLayer(layer_id)
-        
-        if layer_node:
-            # Cek apakah sudah di dalam group yang benar
-            current_parent = layer_node.parent()
-            
-            if current_parent != group:
-                # Pindahkan secara aman: Clone -> Add to Group -> Remove Old
-                new_node = layer_node.clone()
-                group.insertChildNode(0, new_node)
-                current_parent.removeChildNode(layer_node)
-                # Gunakan node baru untuk operasi selanjutnya
-                layer_node = new_node
-            else:
-                # Jika sudah di dalam group, cukup geser ke urutan paling atas di dalam group tersebut
-                if group.children()[0] != layer_node:
-                    new_node = layer_node.clone()
-                    group.insertChildNode(0, new_node)
-                    group.removeChildNode(layer_node)
-                    layer_node = new_node
-
-            # Pastikan checkbox layer tercentang (Visible)
+
+        # Pindahkan ke urutan paling atas di dalam group (tanpa clone)
+        ShooterLayerManager._moveTreeNode(layer_node, group, 0)
+
+        # Pastikan layer dan group tercentang (Visible) dan terexpand,
+        # hanya set jika berbeda agar tidak memicu refresh legend
+        if not layer_node.itemVisibilityChecked():
             layer_node.setItemVisibilityChecked(True)
-            # Pastikan group juga terexpand/tercentang
+        if not group.itemVisibilityChecked():
             group.setItemVisibilityChecked(True)
+        if not group.isExpanded():
             group.setExpanded(True)
     
     @staticmethod
@@ -228,12 +512,4 @@ class ShooterLayerManager:
         root = project.layerTreeRoot()
 
         # Mencari atau membuat group SHOOTER di posisi paling atas
-        group = root.findGroup("SHOOTER")
-        if group is None:
-            group = root.insertGroup(0, "SHOOTER")
-        else:
-            # Jika sudah ada, pastikan posisinya tetap di paling atas (index 0)
-            if root.children()[0] != group:
-                clone = group.clone()
-                root.removeChildNode(group)
-                root.insertChildNode(0, clone)
\ No newline at end of file
+        group = ShooterLayerManager._shooterGroup(root)
\ No newline at end of file
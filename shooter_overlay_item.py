@@ -0,0 +1,111 @@
+# ============================================================
+# SHOOTER - QGIS Plugin
+#
+# Author  : Achmad Amrulloh
+# Email   : achmad.amrulloh@gmail.com
+# LinkedIn: https://www.linkedin.com/in/achmad-amrulloh/
+#
+# Description:
+# Manual Add Sector & Site Tool for RF Planning and RF Optimization.
+#
+# Copyright (C) 2026 Achmad Amrulloh
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# ============================================================
+
+from qgis.gui import QgsMapCanvasItem
+from qgis.core import QgsPointXY
+from qgis.PyQt.QtCore import Qt, QPointF, QRectF
+from qgis.PyQt.QtGui import QColor, QFont, QPainter, QStaticText, QTransform
+
+
+class ShooterOverlayItem(QgsMapCanvasItem):
+    """
+    Overlay teks ringan (AZ / R) yang menempel pada titik peta.
+
+    Digambar langsung dengan QPainter dari QStaticText yang di-cache;
+    hanya bounding rect item ini yang di-repaint. Tidak didaftarkan ke
+    annotation manager, jadi project tidak menjadi dirty saat drag.
+    """
+
+    PADDING = 6
+    OFFSET = QPointF(15, -15)
+
+    def __init__(self, canvas):
+        super().__init__(canvas)
+        self._map_pos = None
+        self._text = ""
+        self._rect = QRectF()
+
+        self._font = QFont()
+        self._font.setPixelSize(11)
+
+        self._static = QStaticText()
+        self._static.setTextFormat(Qt.RichText)
+
+        self._background = QColor(0, 0, 0, 160)
+        self._foreground = QColor(255, 255, 255)
+
+        self.setZValue(1000)
+
+    def setText(self, html: str):
+        if html == self._text:
+            return
+
+        self._text = html
+        self._static.setText(html)
+        self._static.prepare(QTransform(), self._font)
+
+        size = self._static.size()
+        rect = QRectF(
+            self.OFFSET.x(),
+            self.OFFSET.y(),
+            size.width() + 2 * self.PADDING,
+            size.height() + 2 * self.PADDING
+        )
+        if rect != self._rect:
+            self.prepareGeometryChange()
+            self._rect = rect
+
+        self.update()
+
+    def setMapPosition(self, map_pt):
+        self._map_pos = QgsPointXY(map_pt)
+        self.updatePosition()
+
+    def updatePosition(self):
+        if self._map_pos is not None:
+            self.setPos(self.toCanvasCoordinates(self._map_pos))
+
+    def boundingRect(self):
+        return self._rect
+
+    def paint(self, painter, option=None, widget=None):
+        if not self._text:
+            return
+
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self._background)
+        painter.drawRoundedRect(self._rect, 4, 4)
+
+        painter.setFont(self._font)
+        painter.setPen(self._foreground)
+        painter.drawStaticText(
+            QPointF(
+                self._rect.left() + self.PADDING,
+                self._rect.top() + self.PADDING
+            ),
+            self._static
+        )
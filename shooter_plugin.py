@@ -26,9 +26,10 @@
 
 import os
 
-from qgis.PyQt.QtWidgets import QAction
+from qgis.PyQt.QtWidgets import QAction, QFileDialog, QMessageBox, QProgressDialog
+from qgis.PyQt.QtCore import QCoreApplication, Qt, QTimer
 from qgis.PyQt.QtGui import QIcon
-from qgis.core import QgsProject
+from qgis.core import QgsFeedback, QgsProject
 
 from .shooter_add_sector_tool import ShooterAddSectorTool
 from .shooter_add_site_tool import ShooterAddSiteTool
@@ -36,6 +37,10 @@ from .shooter_add_mode_dialog import ShooterAddModeDialog
 from .shooter_about_dialog import ShooterAboutDialog
 from .shooter_layer_manager import ShooterLayerManager
 from .shooter_settings_dialog import ShooterSettingsDialog
+from .shooter_icons import ShooterIcons
+from .shooter_project_store import ShooterProjectStore
+from .shooter_sector_store import ShooterSectorStore
+from .shooter_site_importer import ShooterSiteImporter
 
 
 class ShooterPlugin:
@@ -47,6 +52,12 @@ class ShooterPlugin:
 
         self.plugin_dir = os.path.dirname(__file__)
 
+        # Sector store: muat extent setelah pan / zoom selesai
+        self._store_timer = QTimer()
+        self._store_timer.setSingleShot(True)
+        self._store_timer.setInterval(200)
+        self._store_timer.timeout.connect(self._loadStoreExtent)
+
     # --------------------------------------------------
     # GUI init
     # --------------------------------------------------
@@ -111,6 +122,30 @@ class ShooterPlugin:
 
         self.iface.addPluginToMenu("Shooter", self.action_about)
 
+        # =========================
+        # Sector Store (.shs)
+        # =========================
+        self.action_open_store = QAction("Open Sector Store...", self.iface.mainWindow())
+        self.action_open_store.triggered.connect(self.openSectorStore)
+        self.iface.addPluginToMenu("Shooter", self.action_open_store)
+
+        self.action_export_store = QAction("Export Sector Store...", self.iface.mainWindow())
+        self.action_export_store.triggered.connect(self.exportSectorStore)
+        self.iface.addPluginToMenu("Shooter", self.action_export_store)
+
+        # =========================
+        # Site database import
+        # =========================
+        self.action_import_sites = QAction("Import Sites...", self.iface.mainWindow())
+        self.action_import_sites.triggered.connect(self.importSites)
+        self.iface.addPluginToMenu("Shooter", self.action_import_sites)
+
+        # Render icon menu & cursor tool sekali di awal
+        ShooterIcons.preload()
+
+        # Simpan / muat layer Shooter (memory) di file project
+        ShooterProjectStore.connectProject(QgsProject.instance())
+
 
 
 
@@ -130,6 +165,109 @@ class ShooterPlugin:
         dlg.exec_()
 
 
+    # --------------------------------------------------
+    # Sector store
+    # --------------------------------------------------
+    def openSectorStore(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self.iface.mainWindow(),
+            "Open Shooter Sector Store",
+            "",
+            "Shooter sector store (*.shs)"
+        )
+        if not path:
+            return
+
+        self._closeSectorStore()
+        try:
+            count = ShooterSectorStore.open(path)
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self.iface.mainWindow(), "Shooter", str(e))
+            return
+
+        self.canvas.extentsChanged.connect(self._store_timer.start)
+        self.iface.mainWindow().statusBar().showMessage(
+            f"SHOOTER: {count} sectors in store, loading current extent", 3000
+        )
+        self._loadStoreExtent()
+
+    def exportSectorStore(self):
+        path, _ = QFileDialog.getSaveFileName(
+            self.iface.mainWindow(),
+            "Export Shooter Sector Store",
+            "",
+            "Shooter sector store (*.shs)"
+        )
+        if not path:
+            return
+
+        if not path.lower().endswith(".shs"):
+            path += ".shs"
+
+        count = ShooterSectorStore.exportLayers(path)
+        self.iface.mainWindow().statusBar().showMessage(
+            f"SHOOTER: {count} sectors exported", 3000
+        )
+
+    def _loadStoreExtent(self):
+        ShooterSectorStore.loadExtent(self.canvas)
+
+    def _closeSectorStore(self):
+        self._store_timer.stop()
+        if ShooterSectorStore.isOpen():
+            try:
+                self.canvas.extentsChanged.disconnect(self._store_timer.start)
+            except TypeError:
+                pass
+        ShooterSectorStore.close()
+
+
+    # --------------------------------------------------
+    # Site import
+    # --------------------------------------------------
+    def importSites(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self.iface.mainWindow(),
+            "Import Shooter Sites",
+            "",
+            "Site table (*.csv *.txt *.xlsx)"
+        )
+        if not path:
+            return
+
+        progress = QProgressDialog(
+            "Importing sites...", "Cancel", 0, 100, self.iface.mainWindow()
+        )
+        progress.setWindowTitle("Shooter")
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(0)
+
+        # Event loop diproses per chunk agar tombol Cancel responsif
+        feedback = QgsFeedback()
+        progress.canceled.connect(feedback.cancel)
+
+        def onProgress(value):
+            progress.setValue(int(value))
+            QCoreApplication.processEvents()
+
+        feedback.progressChanged.connect(onProgress)
+
+        try:
+            result = ShooterSiteImporter.importFile(path, feedback)
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self.iface.mainWindow(), "Shooter", str(e))
+            return
+        finally:
+            progress.close()
+
+        message = f"SHOOTER: {result['sites']} sites ({result['sectors']} sectors) imported"
+        if result["canceled"]:
+            message += ", canceled"
+        if result["skipped"]:
+            message += f", {result['skipped']} rows skipped (see the SHOOTER log)"
+        self.iface.mainWindow().statusBar().showMessage(message, 5000)
+
+
     # --------------------------------------------------
     # Unload plugin
     # --------------------------------------------------
@@ -138,6 +276,12 @@ class ShooterPlugin:
         self.iface.removePluginMenu("Shooter", self.action)
         self.iface.removePluginMenu("Shooter", self.action_settings)
         self.iface.removePluginMenu("Shooter", self.action_about)
+        self.iface.removePluginMenu("Shooter", self.action_open_store)
+        self.iface.removePluginMenu("Shooter", self.action_export_store)
+        self.iface.removePluginMenu("Shooter", self.action_import_sites)
+        self._closeSectorStore()
+        ShooterIcons.clear()
+        ShooterProjectStore.disconnectProject()
 
 
     # --------------------------------------------------
@@ -0,0 +1,236 @@
+# ============================================================
+# SHOOTER - QGIS Plugin
+#
+# Author  : Achmad Amrulloh
+# Email   : achmad.amrulloh@gmail.com
+# LinkedIn: https://www.linkedin.com/in/achmad-amrulloh/
+#
+# Description:
+# Manual Add Sector & Site Tool for RF Planning and RF Optimization.
+#
+# Copyright (C) 2026 Achmad Amrulloh
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# ============================================================
+
+import base64
+import json
+import zlib
+
+import numpy as np
+
+from qgis.core import QgsFeature, QgsFeatureRequest, QgsProject
+from PyQt5.QtCore import QVariant
+
+from .shooter_layer_manager import ShooterLayerManager, SHOOTER_LAYER_ROLES
+from .shooter_sector_model import plain_value
+
+# Elemen XML di file project (.qgs) yang memuat tabel atribut Shooter
+PROJECT_ELEMENT = "ShooterLayers"
+FORMAT_VERSION = 1
+
+# Kolom yang cukup untuk membangun ulang wedge
+WEDGE_COLUMNS = ("center_lon", "center_lat", "azimuth", "radius_m", "beamwidth")
+
+
+def _to_float(value):
+    value = plain_value(value)
+    return np.nan if value is None else float(value)
+
+
+class ShooterProjectStore:
+    """
+    Serialisasi layer Shooter (memory) ke file project sebagai tabel
+    atribut saja.
+
+    Geometry wedge tidak disimpan: saat project dibuka, wedge dibangun
+    ulang secara bulk dari center_lon / center_lat / azimuth / radius_m /
+    beamwidth. Kolom Double disimpan sebagai array float64, kolom lain
+    sebagai list JSON; payload di-kompres zlib + base64.
+    """
+
+    _project = None
+
+    @staticmethod
+    def connectProject(project=None):
+        project = project or QgsProject.instance()
+        if ShooterProjectStore._project is project:
+            return
+
+        ShooterProjectStore.disconnectProject()
+        project.writeProject.connect(ShooterProjectStore.writeProject)
+        project.readProject.connect(ShooterProjectStore.readProject)
+        ShooterProjectStore._project = project
+
+    @staticmethod
+    def disconnectProject():
+        project = ShooterProjectStore._project
+        if project is None:
+            return
+
+        try:
+            project.writeProject.disconnect(ShooterProjectStore.writeProject)
+            project.readProject.disconnect(ShooterProjectStore.readProject)
+        except TypeError:
+            pass
+        ShooterProjectStore._project = None
+
+    # --------------------------------------------------
+    # Save
+    # --------------------------------------------------
+    @staticmethod
+    def writeProject(doc):
+        layers = []
+        for name in SHOOTER_LAYER_ROLES:
+            layer = ShooterLayerManager.getLayer(name)
+            # Layer GeoPackage sudah persisten sendiri
+            if layer is None or layer.providerType() != "memory":
+                continue
+            layers.append(ShooterProjectStore.serializeLayer(layer))
+
+        if not layers:
+            return
+
+        payload = ShooterProjectStore.encode({
+            "version": FORMAT_VERSION,
+            "layers": layers,
+        })
+
+        root = doc.documentElement()
+        old = root.firstChildElement(PROJECT_ELEMENT)
+        if not old.isNull():
+            root.removeChild(old)
+
+        element = doc.createElement(PROJECT_ELEMENT)
+        element.setAttribute("version", str(FORMAT_VERSION))
+        element.appendChild(doc.createTextNode(payload))
+        root.appendChild(element)
+
+    @staticmethod
+    def serializeLayer(layer) -> dict:
+        fields = layer.fields()
+
+        request = QgsFeatureRequest().setFlags(QgsFeatureRequest.NoGeometry)
+        rows = [feature.attributes() for feature in layer.getFeatures(request)]
+
+        columns = {}
+        for i, field in enumerate(fields):
+            values = [row[i] for row in rows]
+            if field.type() == QVariant.Double:
+                array = np.array([_to_float(v) for v in values], dtype="<f8")
+                columns[field.name()] = {
+                    "f8": base64.b64encode(array.tobytes()).decode("ascii")
+                }
+            else:
+                columns[field.name()] = {"values": [plain_value(v) for v in values]}
+
+        return {
+            "id": layer.id(),
+            "name": layer.name(),
+            "count": len(rows),
+            "columns": columns,
+        }
+
+    @staticmethod
+    def encode(data: dict) -> str:
+        raw = json.dumps(data, separators=(",", ":")).encode("utf-8")
+        return base64.b64encode(zlib.compress(raw, 6)).decode("ascii")
+
+    @staticmethod
+    def decode(payload: str) -> dict:
+        raw = zlib.decompress(base64.b64decode(payload))
+        return json.loads(raw.decode("utf-8"))
+
+    # --------------------------------------------------
+    # Load
+    # --------------------------------------------------
+    @staticmethod
+    def readProject(doc):
+        element = doc.documentElement().firstChildElement(PROJECT_ELEMENT)
+        if element.isNull():
+            return
+
+        data = ShooterProjectStore.decode(element.text())
+        if data.get("version") != FORMAT_VERSION:
+            return
+
+        project = QgsProject.instance()
+        for entry in data["layers"]:
+            layer = project.mapLayer(entry["id"]) or ShooterLayerManager.getLayer(entry["name"])
+            # Hanya layer memory yang masih kosong (hindari duplikasi)
+            if layer is None or layer.providerType() != "memory" or layer.featureCount() > 0:
+                continue
+            ShooterProjectStore.restoreLayer(layer, entry)
+
+    @staticmethod
+    def restoreLayer(layer, entry: dict):
+        """
+        Isi layer dari tabel atribut; wedge dibangun ulang sekaligus
+        lewat ShooterLayerManager.buildLayerWedges.
+        """
+        count = entry["count"]
+        if count == 0:
+            return
+
+        columns = {}
+        for name, column in entry["columns"].items():
+            if "f8" in column:
+                columns[name] = np.frombuffer(base64.b64decode(column["f8"]), dtype="<f8")
+            else:
+                columns[name] = column["values"]
+
+        geometries = [None] * count
+        if all(name in columns for name in WEDGE_COLUMNS):
+            lon, lat, az, r, bw = (
+                np.asarray(columns[name], dtype=np.float64) for name in WEDGE_COLUMNS
+            )
+            valid = np.isfinite(lon) & np.isfinite(lat) & np.isfinite(az) & np.isfinite(r) & np.isfinite(bw)
+            rows = np.flatnonzero(valid)
+
+            if len(rows):
+                # Center tersimpan dalam CRS layer (atribut feature)
+                geoms, _layer_xy = ShooterLayerManager.buildLayerWedges(
+                    layer,
+                    np.column_stack([lon[rows], lat[rows]]),
+                    az[rows], r[rows], bw[rows],
+                    layer.crs()
+                )
+
+                for row, geom in zip(rows, geoms):
+                    geometries[row] = geom
+
+        fields = layer.fields()
+        field_columns = [columns.get(field.name()) for field in fields]
+
+        features = []
+        for i in range(count):
+            values = []
+            for column in field_columns:
+                if column is None:
+                    values.append(None)
+                elif isinstance(column, np.ndarray):
+                    value = column[i]
+                    values.append(None if np.isnan(value) else float(value))
+                else:
+                    values.append(column[i])
+
+            feature = QgsFeature(fields)
+            feature.setAttributes(values)
+            if geometries[i] is not None:
+                feature.setGeometry(geometries[i])
+            features.append(feature)
+
+        layer.dataProvider().addFeatures(features)
+        layer.updateExtents()
+        layer.triggerRepaint()
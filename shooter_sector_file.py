@@ -0,0 +1,235 @@
+# ============================================================
+# SHOOTER - QGIS Plugin
+#
+# Author  : Achmad Amrulloh
+# Email   : achmad.amrulloh@gmail.com
+# LinkedIn: https://www.linkedin.com/in/achmad-amrulloh/
+#
+# Description:
+# Manual Add Sector & Site Tool for RF Planning and RF Optimization.
+#
+# Copyright (C) 2026 Achmad Amrulloh
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# ============================================================
+"""
+Format file sektor Shooter (.shs): header 64 byte + record fixed-width
+little endian, dibaca lewat np.memmap sehingga membuka file jutaan
+sektor hanya memetakan file tanpa parsing. Tidak bergantung pada qgis.
+"""
+
+import os
+import struct
+
+import numpy as np
+
+from .shooter_geometry_kernel import M_PER_DEG
+
+MAGIC = b"SHOOTSEC"
+FORMAT_VERSION = 1
+
+# magic, version, record size, jumlah record, CRS authid
+HEADER = struct.Struct("<8sHHQ32s")
+HEADER_SIZE = 64
+
+# Nilai kolom "layer"
+LAYER_CODE_SECTOR = 0
+LAYER_CODE_SITE = 1
+
+SECTOR_DTYPE = np.dtype([
+    ("center_lon", "<f8"),
+    ("center_lat", "<f8"),
+    ("azimuth", "<f8"),
+    ("radius_m", "<f8"),
+    ("beamwidth", "<f8"),
+    ("sector_id", "S32"),
+    ("dummy_id", "S32"),
+    ("line_color", "S9"),       # #RRGGBB / #RRGGBBAA
+    ("line_width", "u1"),
+    ("show_label", "u1"),
+    ("layer", "u1"),            # LAYER_CODE_*
+    ("_reserved", "V4"),
+])
+
+
+def write_sector_file(path, records, crs_authid="EPSG:4326"):
+    """
+    Tulis array record (dtype SECTOR_DTYPE) ke path.
+    """
+    records = np.asarray(records, dtype=SECTOR_DTYPE)
+
+    header = HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        SECTOR_DTYPE.itemsize,
+        len(records),
+        crs_authid.encode("ascii")[:32],
+    )
+
+    with open(path, "wb") as fh:
+        fh.write(header.ljust(HEADER_SIZE, b"\0"))
+        records.tofile(fh)
+
+
+def read_header(path):
+    with open(path, "rb") as fh:
+        raw = fh.read(HEADER_SIZE)
+
+    if len(raw) < HEADER_SIZE:
+        raise ValueError(f"{path}: not a Shooter sector file")
+
+    magic, version, record_size, count, crs = HEADER.unpack_from(raw)
+    if magic != MAGIC:
+        raise ValueError(f"{path}: not a Shooter sector file")
+    if version != FORMAT_VERSION or record_size != SECTOR_DTYPE.itemsize:
+        raise ValueError(f"{path}: unsupported sector file version {version}")
+
+    expected = HEADER_SIZE + count * record_size
+    if os.path.getsize(path) < expected:
+        raise ValueError(f"{path}: truncated sector file")
+
+    return {
+        "version": version,
+        "count": count,
+        "crs": crs.rstrip(b"\0").decode("ascii"),
+    }
+
+
+def open_sector_file(path, mode="r"):
+    """
+    Return (header, records). records adalah np.memmap (N,) dtype
+    SECTOR_DTYPE; records["azimuth"] dsb. adalah view tanpa copy.
+    """
+    header = read_header(path)
+    if header["count"] == 0:
+        return header, np.zeros(0, dtype=SECTOR_DTYPE)
+
+    records = np.memmap(
+        path,
+        dtype=SECTOR_DTYPE,
+        mode=mode,
+        offset=HEADER_SIZE,
+        shape=(header["count"],)
+    )
+    return header, records
+
+
+def extent_mask(records, xmin, ymin, xmax, ymax, units_per_m=None):
+    """
+    Mask record yang bounding box sektornya (center ± radius)
+    berpotongan dengan extent. units_per_m None = CRS geografis
+    (derajat per meter dihitung per latitude), selain itu skalar
+    map unit per meter.
+    """
+    x = records["center_lon"]
+    y = records["center_lat"]
+    r = records["radius_m"]
+
+    if units_per_m is None:
+        dy = r / M_PER_DEG
+        dx = dy / np.maximum(np.cos(np.radians(y)), 1e-6)
+    else:
+        dx = dy = r * units_per_m
+
+    return (
+        (x + dx >= xmin) & (x - dx <= xmax)
+        & (y + dy >= ymin) & (y - dy <= ymax)
+    )
+
+
+class SectorGrid:
+    """
+    Grid index center sektor (CSR): row diurutkan per cell, sehingga
+    query extent hanya menyentuh cell yang relevan lalu uji bbox
+    exact dengan extent_mask. Dibangun sekali per file.
+    """
+
+    def __init__(self, records, units_per_m=None, target_per_cell=16):
+        x = np.asarray(records["center_lon"], dtype=np.float64)
+        y = np.asarray(records["center_lat"], dtype=np.float64)
+        r = np.asarray(records["radius_m"], dtype=np.float64)
+
+        self.records = records
+        self.units_per_m = units_per_m
+
+        n = len(x)
+
+        # Jangkauan maksimum sektor dari center-nya (map unit)
+        if units_per_m is None:
+            reach_y = r / M_PER_DEG
+            reach_x = reach_y / np.maximum(np.cos(np.radians(y)), 1e-6)
+            self.reach = float(max(reach_x.max(), reach_y.max())) if n else 0.0
+        else:
+            self.reach = float(r.max() * units_per_m) if n else 0.0
+
+        self.x0 = float(x.min()) if n else 0.0
+        self.y0 = float(y.min()) if n else 0.0
+        span_x = float(x.max()) - self.x0 if n else 0.0
+        span_y = float(y.max()) - self.y0 if n else 0.0
+
+        # Cell minimal selebar satu jangkauan: data yang menumpuk
+        # (mis. satu site) tidak menghasilkan cell mikroskopis
+        cells_per_axis = max(1, int(np.sqrt(max(n, 1) / target_per_cell)))
+        self.cell = max(max(span_x, span_y) / cells_per_axis, self.reach, 1e-9)
+        self.ncols = int(span_x // self.cell) + 1
+        self.nrows = int(span_y // self.cell) + 1
+
+        keys = self._cell_keys(x, y)
+        self.order = np.argsort(keys, kind="stable")
+        self.sorted_keys = keys[self.order]
+
+    def _cell_keys(self, x, y):
+        cx = np.floor((x - self.x0) / self.cell).astype(np.int64)
+        cy = np.floor((y - self.y0) / self.cell).astype(np.int64)
+        return cy * self.ncols + cx
+
+    def rows_in(self, xmin, ymin, xmax, ymax):
+        """
+        Index record yang bbox sektornya berpotongan dengan extent.
+        """
+        if len(self.order) == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        cx0, cy0 = self._cell_range(xmin - self.reach, ymin - self.reach)
+        cx1, cy1 = self._cell_range(xmax + self.reach, ymax + self.reach)
+        if cx1 < 0 or cy1 < 0 or cx0 >= self.ncols or cy0 >= self.nrows:
+            return np.zeros(0, dtype=np.int64)
+        cx0, cx1 = max(cx0, 0), min(cx1, self.ncols - 1)
+        cy0, cy1 = max(cy0, 0), min(cy1, self.nrows - 1)
+
+        # Tiap baris cell adalah rentang key yang kontigu
+        starts = np.arange(cy0, cy1 + 1, dtype=np.int64) * self.ncols
+        lo = np.searchsorted(self.sorted_keys, starts + cx0, side="left")
+        hi = np.searchsorted(self.sorted_keys, starts + cx1, side="right")
+        chunks = [self.order[a:b] for a, b in zip(lo, hi) if b > a]
+        if not chunks:
+            return np.zeros(0, dtype=np.int64)
+
+        rows = np.sort(np.concatenate(chunks))
+        mask = extent_mask(self.records[rows], xmin, ymin, xmax, ymax, self.units_per_m)
+        return rows[mask]
+
+    def _cell_range(self, x, y):
+        return (
+            int(np.floor((x - self.x0) / self.cell)),
+            int(np.floor((y - self.y0) / self.cell)),
+        )
+
+
+def decode_text(values):
+    return [value.decode("utf-8", "ignore") for value in values]
+
+
+def encode_text(values, size):
+    return [str(value or "").encode("utf-8")[:size] for value in values]
@@ -0,0 +1,158 @@
+# ============================================================
+# SHOOTER - QGIS Plugin
+#
+# Author  : Achmad Amrulloh
+# Email   : achmad.amrulloh@gmail.com
+# LinkedIn: https://www.linkedin.com/in/achmad-amrulloh/
+#
+# Description:
+# Manual Add Sector & Site Tool for RF Planning and RF Optimization.
+#
+# Copyright (C) 2026 Achmad Amrulloh
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# ============================================================
+
+import numpy as np
+
+from qgis.core import QgsPointXY, QgsProject
+
+from .shooter_geometry import ShooterGeometry
+from .shooter_geometry_kernel import sectors_contain, sectors_contain_geodesic
+from .shooter_sector_model import ShooterSectorModel
+
+
+class ShooterSectorIndex:
+    """
+    Hit test sektor untuk klik kanan dan hover.
+
+    Dibangun di atas ShooterSectorModel: kandidat dipilih dengan filter
+    bbox vektor pada kolom xmin / ymin / xmax / ymax, lalu diuji
+    analitik dari center_lon / center_lat / azimuth / radius_m /
+    beamwidth (jarak + jendela sudut), tanpa uji intersection polygon.
+    Sinkronisasi dengan layer sepenuhnya ditangani model.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.layer = model.layer
+
+    # --------------------------------------------------
+    # Public API
+    # --------------------------------------------------
+    @staticmethod
+    def forLayer(layer):
+        return ShooterSectorIndex(ShooterSectorModel.forLayer(layer))
+
+    @staticmethod
+    def hitsAt(layers, map_point: QgsPointXY, map_crs):
+        """
+        Semua sektor di bawah map_point (CRS canvas) pada layers, urut
+        sesuai prioritas layer lalu radius terkecil.
+        Return list (layer, fid).
+        """
+        hits = []
+        for layer in layers:
+            if layer is None:
+                continue
+
+            point = map_point
+            if map_crs.isValid() and layer.crs() != map_crs:
+                point = ShooterGeometry.getTransform(map_crs, layer.crs()).transform(map_point)
+
+            for fid in ShooterSectorIndex.forLayer(layer).fidsAt(point):
+                hits.append((layer, fid))
+
+        return hits
+
+    @staticmethod
+    def hitTest(layers, map_point: QgsPointXY, map_crs):
+        """
+        Sektor teratas di bawah map_point (CRS canvas) pada layers.
+        Return (layer, feature) atau (None, None).
+        """
+        for layer in layers:
+            if layer is None:
+                continue
+
+            hits = ShooterSectorIndex.hitsAt([layer], map_point, map_crs)
+            if hits:
+                return layer, layer.getFeature(hits[0][1])
+
+        return None, None
+
+    def fidsAt(self, point: QgsPointXY):
+        """
+        Id feature sektor yang memuat point (CRS layer), radius terkecil
+        lebih dulu (sektor overlap).
+        """
+        data = self.model.array()
+        if len(data) == 0:
+            return []
+
+        # Filter bbox dua tahap: sumbu x di seluruh array, sumbu y
+        # hanya pada sisa kandidat
+        x, y = point.x(), point.y()
+        rows = np.flatnonzero((data["xmin"] <= x) & (data["xmax"] >= x))
+        candidates = data[rows]
+        candidates = candidates[(candidates["ymin"] <= y) & (candidates["ymax"] >= y)]
+        if len(candidates) == 0:
+            return []
+
+        centers = np.column_stack([candidates["center_lon"], candidates["center_lat"]])
+
+        # Uji dengan aturan yang sama seperti wedge dibangun: mode
+        # geodesic di WGS84 (Vincenty), selain itu di CRS project
+        # dengan frame lokal ShooterGeometry.wedgeFrames
+        geodesic = ShooterGeometry._storageSettings()["geodesic_wedges"]
+        test_crs = ShooterGeometry.wgs84Crs() if geodesic else QgsProject.instance().crs()
+
+        framed = np.ones(len(centers), dtype=bool)
+        layer_crs = self.layer.crs()
+        if layer_crs != test_crs:
+            point_xy, point_ok = ShooterGeometry.transformXY([[x, y]], layer_crs, test_crs)
+            if not point_ok[0]:
+                return []
+            x, y = point_xy[0]
+            centers, framed = ShooterGeometry.transformXY(centers, layer_crs, test_crs)
+
+        # Center yang gagal ditransform tidak bisa diuji
+        rows = np.flatnonzero(framed)
+        tested = candidates[rows]
+        hits = np.zeros(len(candidates), dtype=bool)
+        if geodesic:
+            hits[rows] = sectors_contain_geodesic(
+                x, y, centers[rows, 0], centers[rows, 1],
+                tested["azimuth"], tested["radius_m"], tested["beamwidth"]
+            )
+        else:
+            hits[rows] = sectors_contain(
+                x, y, centers[rows, 0], centers[rows, 1],
+                ShooterGeometry.wedgeFrames(centers[rows], geodesic=False),
+                tested["azimuth"], tested["radius_m"], tested["beamwidth"]
+            )
+
+        hit_rows = np.flatnonzero(hits)
+        order = hit_rows[np.argsort(candidates["radius_m"][hit_rows], kind="stable")]
+        return candidates["fid"][order].tolist()
+
+    def featureAt(self, point: QgsPointXY):
+        """
+        Feature sektor yang memuat point (CRS layer), atau None.
+        Jika beberapa sektor overlap, radius terkecil yang dipilih.
+        """
+        fids = self.fidsAt(point)
+        if not fids:
+            return None
+        return self.layer.getFeature(fids[0])
@@ -0,0 +1,304 @@
+# ============================================================
+# SHOOTER - QGIS Plugin
+#
+# Author  : Achmad Amrulloh
+# Email   : achmad.amrulloh@gmail.com
+# LinkedIn: https://www.linkedin.com/in/achmad-amrulloh/
+#
+# Description:
+# Manual Add Sector & Site Tool for RF Planning and RF Optimization.
+#
+# Copyright (C) 2026 Achmad Amrulloh
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# ============================================================
+
+import math
+
+import numpy as np
+
+from qgis.core import QgsFeatureRequest
+
+# Kolom numerik per sektor (satu baris per feature)
+MODEL_DTYPE = np.dtype([
+    ("fid", "<i8"),
+    ("center_lon", "<f8"),
+    ("center_lat", "<f8"),
+    ("azimuth", "<f8"),
+    ("radius_m", "<f8"),
+    ("beamwidth", "<f8"),
+    ("line_width", "<i2"),   # -1 = NULL
+    ("show_label", "?"),
+    ("xmin", "<f8"),     # bbox geometry (CRS layer)
+    ("ymin", "<f8"),
+    ("xmax", "<f8"),
+    ("ymax", "<f8"),
+])
+
+NUMERIC_FIELDS = ("center_lon", "center_lat", "azimuth", "radius_m", "beamwidth")
+TEXT_FIELDS = ("sector_id", "dummy_id", "line_color")
+MODEL_FIELDS = NUMERIC_FIELDS + TEXT_FIELDS + ("line_width", "show_label")
+
+INITIAL_CAPACITY = 1024
+
+
+class SectorLabel:
+    """
+    Atribut teks satu sektor (ringkas, tanpa __dict__).
+    """
+    __slots__ = ("sector_id", "dummy_id", "line_color")
+
+    def __init__(self, sector_id, dummy_id, line_color):
+        self.sector_id = sector_id
+        self.dummy_id = dummy_id
+        self.line_color = line_color
+
+
+def plain_value(value):
+    """
+    QVariant NULL → None.
+    """
+    if value is None or (hasattr(value, "isNull") and value.isNull()):
+        return None
+    return value
+
+
+def _number(value):
+    # None / NULL QVariant / teks tidak valid → NaN
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+class ShooterSectorModel:
+    """
+    Model kolom (NumPy structured array) dari satu layer Shooter.
+
+    Satu baris per feature; baris dihapus dengan swap-remove sehingga
+    array selalu padat. Sinkron lewat signal layer featureAdded,
+    featureDeleted, attributeValueChanged dan geometryChanged: signal
+    hanya mencatat fid, lalu baris di-refresh secara batch saat array
+    diakses. Analitik (overlap, hit test, export) cukup membaca array
+    tanpa QgsFeature.
+    """
+
+    # layer id → ShooterSectorModel
+    _models = {}
+
+    def __init__(self, layer):
+        self.layer = layer
+        self._data = np.zeros(INITIAL_CAPACITY, dtype=MODEL_DTYPE)
+        self._labels = []
+        self._size = 0
+        self._rows = {}         # fid → row
+        self._pending = set()
+        self._dirty = True
+        self._field_indexes = set()
+        self._attr_indexes = []
+
+        layer.featureAdded.connect(self._onFeatureChanged)
+        layer.featureDeleted.connect(self._onFeatureDeleted)
+        layer.geometryChanged.connect(self._onGeometryChanged)
+        layer.attributeValueChanged.connect(self._onAttributeValueChanged)
+        layer.committedFeaturesAdded.connect(self._onCommittedFeaturesAdded)
+        layer.afterRollBack.connect(self._markDirty)
+        layer.updatedFields.connect(self._markDirty)
+        layer.willBeDeleted.connect(self._onWillBeDeleted)
+
+    # --------------------------------------------------
+    # Public API
+    # --------------------------------------------------
+    @staticmethod
+    def forLayer(layer):
+        model = ShooterSectorModel._models.get(layer.id())
+        if model is None:
+            model = ShooterSectorModel(layer)
+            ShooterSectorModel._models[layer.id()] = model
+        return model
+
+    @staticmethod
+    def invalidate(layer):
+        """
+        Rebuild penuh pada akses berikutnya, untuk perubahan yang
+        tidak lewat edit buffer (mis. dataProvider().addFeatures).
+        """
+        model = ShooterSectorModel._models.get(layer.id())
+        if model is not None:
+            model._dirty = True
+
+    def array(self):
+        """
+        View (N,) dtype MODEL_DTYPE, sinkron dengan layer.
+        Jangan disimpan lintas edit: baris bisa berpindah.
+        """
+        self._sync()
+        return self._data[:self._size]
+
+    def column(self, name):
+        return self.array()[name]
+
+    def labels(self):
+        """
+        List SectorLabel, sejajar dengan array().
+        """
+        self._sync()
+        return self._labels
+
+    def rowOf(self, fid):
+        self._sync()
+        return self._rows.get(fid)
+
+    def __len__(self):
+        self._sync()
+        return self._size
+
+    # --------------------------------------------------
+    # Sinkronisasi
+    # --------------------------------------------------
+    def _sync(self):
+        if self._dirty:
+            self._rebuild()
+        elif self._pending:
+            self._refreshPending()
+
+    def _request(self):
+        fields = self.layer.fields()
+        self._attr_indexes = [fields.indexFromName(name) for name in MODEL_FIELDS]
+        self._field_indexes = set(self._attr_indexes)
+        return QgsFeatureRequest().setSubsetOfAttributes(list(MODEL_FIELDS), fields)
+
+    def _rebuild(self):
+        records = []
+        labels = []
+        for feature in self.layer.getFeatures(self._request()):
+            record, label = self._record(feature)
+            records.append(record)
+            labels.append(label)
+
+        size = len(records)
+        self._data = np.zeros(max(INITIAL_CAPACITY, 2 * size), dtype=MODEL_DTYPE)
+        self._data[:size] = records
+        self._labels = labels
+        self._size = size
+        self._rows = {record[0]: row for row, record in enumerate(records)}
+        self._pending = set()
+        self._dirty = False
+
+    def _refreshPending(self):
+        fids = self._pending
+        self._pending = set()
+
+        request = self._request().setFilterFids(list(fids))
+        for feature in self.layer.getFeatures(request):
+            self._upsert(feature)
+
+    def _upsert(self, feature):
+        record, label = self._record(feature)
+
+        row = self._rows.get(record[0])
+        if row is None:
+            row = self._append(record[0])
+        self._data[row] = record
+        self._labels[row] = label
+
+    def _record(self, feature):
+        """
+        Feature → (tuple MODEL_DTYPE, SectorLabel).
+        """
+        geometry = feature.geometry()
+        if geometry is None or geometry.isEmpty():
+            bbox = (np.nan, np.nan, np.nan, np.nan)
+        else:
+            rect = geometry.boundingBox()
+            bbox = (rect.xMinimum(), rect.yMinimum(), rect.xMaximum(), rect.yMaximum())
+
+        attrs = feature.attributes()
+        lon, lat, az, r, bw, sector_id, dummy_id, line_color, line_width, show_label = (
+            attrs[idx] if idx != -1 else None for idx in self._attr_indexes
+        )
+
+        line_width = _number(line_width)
+        record = (
+            feature.id(),
+            _number(lon), _number(lat), _number(az), _number(r), _number(bw),
+            -1 if math.isnan(line_width) else int(line_width),
+            bool(plain_value(show_label)),
+        ) + bbox
+        label = SectorLabel(
+            plain_value(sector_id),
+            plain_value(dummy_id),
+            plain_value(line_color),
+        )
+        return record, label
+
+    def _append(self, fid):
+        if self._size == len(self._data):
+            grown = np.zeros(len(self._data) * 2, dtype=MODEL_DTYPE)
+            grown[:self._size] = self._data[:self._size]
+            self._data = grown
+
+        row = self._size
+        self._size += 1
+        self._labels.append(None)
+        self._rows[fid] = row
+        return row
+
+    def _remove(self, fid):
+        row = self._rows.pop(fid, None)
+        if row is None:
+            return
+
+        # Swap-remove: baris terakhir pindah ke posisi yang dihapus
+        last = self._size - 1
+        if row != last:
+            self._data[row] = self._data[last]
+            self._labels[row] = self._labels[last]
+            self._rows[int(self._data[row]["fid"])] = row
+        self._labels.pop()
+        self._size = last
+
+    # --------------------------------------------------
+    # Signal handler layer
+    # --------------------------------------------------
+    def _markDirty(self, *_args):
+        self._dirty = True
+
+    def _onFeatureChanged(self, fid):
+        self._pending.add(fid)
+
+    def _onGeometryChanged(self, fid, _geometry):
+        self._pending.add(fid)
+
+    def _onAttributeValueChanged(self, fid, idx, _value):
+        if idx in self._field_indexes:
+            self._pending.add(fid)
+
+    def _onFeatureDeleted(self, fid):
+        self._pending.discard(fid)
+        if not self._dirty:
+            self._remove(fid)
+
+    def _onCommittedFeaturesAdded(self, _layer_id, features):
+        # Commit mengganti id sementara (negatif) dengan id provider
+        for fid in [fid for fid in self._rows if fid < 0]:
+            self._remove(fid)
+        self._pending = {fid for fid in self._pending if fid >= 0}
+
+        if not self._dirty:
+            for feature in features:
+                self._upsert(feature)
+
+    def _onWillBeDeleted(self):
+        ShooterSectorModel._models.pop(self.layer.id(), None)
@@ -0,0 +1,268 @@
+# ============================================================
+# SHOOTER - QGIS Plugin
+#
+# Author  : Achmad Amrulloh
+# Email   : achmad.amrulloh@gmail.com
+# LinkedIn: https://www.linkedin.com/in/achmad-amrulloh/
+#
+# Description:
+# Manual Add Sector & Site Tool for RF Planning and RF Optimization.
+#
+# Copyright (C) 2026 Achmad Amrulloh
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# ============================================================
+
+import numpy as np
+
+from qgis.core import (
+    Qgis,
+    QgsCoordinateReferenceSystem,
+    QgsCsException,
+    QgsFeature,
+    QgsMessageLog,
+    QgsProject,
+)
+from PyQt5.QtGui import QColor
+
+from .shooter_geometry import ShooterGeometry
+from .shooter_layer_manager import ShooterLayerManager, LAYER_ADD_SECTOR, LAYER_ADD_SITE
+from .shooter_sector_model import ShooterSectorModel, NUMERIC_FIELDS
+from .shooter_sector_file import (
+    SECTOR_DTYPE,
+    LAYER_CODE_SECTOR,
+    LAYER_CODE_SITE,
+    SectorGrid,
+    decode_text,
+    encode_text,
+    open_sector_file,
+    write_sector_file,
+)
+
+# Batas feature per materialisasi (zoom terlalu jauh)
+MAX_MATERIALIZE = 100000
+
+LAYER_CODES = {
+    LAYER_CODE_SECTOR: LAYER_ADD_SECTOR,
+    LAYER_CODE_SITE: LAYER_ADD_SITE,
+}
+
+
+class ShooterSectorStore:
+    """
+    File sektor memory-mapped (.shs) sebagai sumber data plan skala
+    nasional. Membuka file hanya memetakan record; loadExtent()
+    memuat ke layer Shooter hanya sektor di extent canvas yang belum
+    dimuat, dengan wedge dibangun secara bulk.
+    """
+
+    _path = None
+    _header = None
+    _records = None
+    _crs = None
+    _grid = None
+    _loaded = None      # bool (N,): record sudah ada di layer
+
+    @staticmethod
+    def open(path: str) -> int:
+        """
+        Buka file sektor. Return jumlah record.
+        """
+        header, records = open_sector_file(path)
+
+        ShooterSectorStore.close()
+        ShooterSectorStore._path = path
+        ShooterSectorStore._header = header
+        ShooterSectorStore._records = records
+        ShooterSectorStore._crs = QgsCoordinateReferenceSystem(header["crs"])
+        ShooterSectorStore._loaded = np.zeros(len(records), dtype=bool)
+        return len(records)
+
+    @staticmethod
+    def close():
+        ShooterSectorStore._path = None
+        ShooterSectorStore._header = None
+        ShooterSectorStore._records = None
+        ShooterSectorStore._crs = None
+        ShooterSectorStore._grid = None
+        ShooterSectorStore._loaded = None
+
+    @staticmethod
+    def isOpen() -> bool:
+        return ShooterSectorStore._records is not None
+
+    # --------------------------------------------------
+    # Materialisasi extent
+    # --------------------------------------------------
+    @staticmethod
+    def loadExtent(canvas) -> int:
+        """
+        Muat sektor di extent canvas ke layer Shooter.
+        Return jumlah feature yang ditambahkan.
+        """
+        if not ShooterSectorStore.isOpen():
+            return 0
+
+        store_crs = ShooterSectorStore._crs
+        extent = canvas.extent()
+        canvas_crs = canvas.mapSettings().destinationCrs()
+        if canvas_crs != store_crs:
+            try:
+                extent = ShooterGeometry.getTransform(canvas_crs, store_crs).transformBoundingBox(extent)
+            except QgsCsException:
+                # Extent di luar domain CRS store (mis. zoom ke seluruh dunia)
+                return 0
+
+        grid = ShooterSectorStore._gridFor(store_crs, extent)
+        rows = grid.rows_in(
+            extent.xMinimum(), extent.yMinimum(),
+            extent.xMaximum(), extent.yMaximum()
+        )
+        rows = rows[~ShooterSectorStore._loaded[rows]]
+
+        if len(rows) > MAX_MATERIALIZE:
+            QgsMessageLog.logMessage(
+                f"{len(rows)} sectors in view, zoom in to load them "
+                f"(limit {MAX_MATERIALIZE}).",
+                "SHOOTER", Qgis.Info
+            )
+            return 0
+
+        added = 0
+        layer_codes = ShooterSectorStore._records["layer"][rows]
+        for code, layer_name in LAYER_CODES.items():
+            layer_rows = rows[layer_codes == code]
+            if len(layer_rows):
+                added += ShooterSectorStore._materialize(layer_name, layer_rows)
+
+        ShooterSectorStore._loaded[rows] = True
+        return added
+
+    @staticmethod
+    def _gridFor(store_crs, extent):
+        if ShooterSectorStore._grid is None:
+            units_per_m = None
+            if not store_crs.isGeographic():
+                # Skala proyeksi di tengah extent (map unit per meter)
+                center = extent.center()
+                frame = ShooterGeometry._projectedFrames(
+                    np.array([[center.x(), center.y()]]), store_crs
+                )[0]
+                units_per_m = float(np.abs(frame).sum(axis=0).max())
+            ShooterSectorStore._grid = SectorGrid(ShooterSectorStore._records, units_per_m)
+        return ShooterSectorStore._grid
+
+    @staticmethod
+    def _materialize(layer_name, rows) -> int:
+        records = ShooterSectorStore._records[rows]
+
+        layer = ShooterLayerManager.getOrCreateLayerByName(layer_name)
+
+        centers = np.column_stack([records["center_lon"], records["center_lat"]])
+
+        # Geometry dan atribut center dalam CRS layer
+        geoms, centers = ShooterLayerManager.buildLayerWedges(
+            layer,
+            centers,
+            records["azimuth"],
+            records["radius_m"],
+            records["beamwidth"],
+            ShooterSectorStore._crs
+        )
+
+        fields = layer.fields()
+        columns = {
+            "sector_id": decode_text(records["sector_id"]),
+            "dummy_id": decode_text(records["dummy_id"]),
+            "azimuth": records["azimuth"].tolist(),
+            "radius_m": records["radius_m"].tolist(),
+            "beamwidth": records["beamwidth"].tolist(),
+            "center_lat": centers[:, 1].tolist(),
+            "center_lon": centers[:, 0].tolist(),
+            # Kosong / 0 → NULL, agar default style (coalesce) berlaku
+            "line_color": [c or None for c in decode_text(records["line_color"])],
+            "line_width": [w or None for w in records["line_width"].tolist()],
+            "show_label": records["show_label"].astype(bool).tolist(),
+        }
+        field_columns = [columns.get(field.name()) for field in fields]
+
+        features = []
+        for i, geom in enumerate(geoms):
+            if geom is None:
+                continue
+            feature = QgsFeature(fields)
+            feature.setAttributes([
+                None if column is None else column[i]
+                for column in field_columns
+            ])
+            feature.setGeometry(geom)
+            features.append(feature)
+
+        layer.dataProvider().addFeatures(features)
+        layer.updateExtents()
+        ShooterSectorModel.invalidate(layer)
+        layer.triggerRepaint()
+        return len(features)
+
+    # --------------------------------------------------
+    # Export
+    # --------------------------------------------------
+    @staticmethod
+    def exportLayers(path: str) -> int:
+        """
+        Tulis seluruh feature layer Shooter ke file sektor, langsung dari
+        model kolom (tanpa iterasi QgsFeature).
+        Koordinat center dalam CRS project. Return jumlah record.
+        """
+        project_crs = QgsProject.instance().crs()
+        parts = []
+        for code, layer_name in LAYER_CODES.items():
+            layer = ShooterLayerManager.getLayer(layer_name)
+            if layer is None:
+                continue
+
+            model = ShooterSectorModel.forLayer(layer)
+            data = model.array()
+            labels = model.labels()
+
+            part = np.zeros(len(data), dtype=SECTOR_DTYPE)
+            for name in NUMERIC_FIELDS:
+                part[name] = data[name]
+            part["sector_id"] = encode_text([label.sector_id for label in labels], 32)
+            part["dummy_id"] = encode_text([label.dummy_id for label in labels], 32)
+            part["line_color"] = encode_text([
+                QColor(label.line_color or "#FFFF00").name() for label in labels
+            ], 9)
+            part["line_width"] = np.where(data["line_width"] < 0, 2, np.clip(data["line_width"], 0, 255))
+            part["show_label"] = data["show_label"]
+            part["layer"] = code
+
+            # Center di model dalam CRS layer → CRS project
+            if layer.crs() != project_crs:
+                xy, _valid = ShooterGeometry.transformXY(
+                    np.column_stack([data["center_lon"], data["center_lat"]]),
+                    layer.crs(), project_crs
+                )
+                part["center_lon"] = xy[:, 0]
+                part["center_lat"] = xy[:, 1]
+
+            # Sektor tanpa center / azimuth / radius valid tidak bisa dibangun
+            valid = np.ones(len(part), dtype=bool)
+            for name in NUMERIC_FIELDS:
+                valid &= np.isfinite(part[name])
+            parts.append(part[valid])
+
+        records = np.concatenate(parts) if parts else np.zeros(0, dtype=SECTOR_DTYPE)
+        write_sector_file(path, records, project_crs.authid())
+        return len(records)
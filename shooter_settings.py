@@ -0,0 +1,110 @@
+# ============================================================
+# SHOOTER - QGIS Plugin
+#
+# Author  : Achmad Amrulloh
+# Email   : achmad.amrulloh@gmail.com
+# LinkedIn: https://www.linkedin.com/in/achmad-amrulloh/
+#
+# Description:
+# Manual Add Sector & Site Tool for RF Planning and RF Optimization.
+#
+# Copyright (C) 2026 Achmad Amrulloh
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# ============================================================
+
+from qgis.PyQt.QtCore import QObject, QSettings, pyqtSignal
+
+
+class ShooterSettings(QObject):
+    """
+    Settings Shooter yang di-cache di memori (singleton).
+
+    QSettings hanya dibaca sekali saat instance dibuat dan ditulis saat
+    update(); tool membaca dari cache dan subscribe ke signal changed,
+    sehingga tidak ada akses registry / disk per event mouse.
+    """
+
+    GROUP = "SHOOTER/settings"
+
+    # key → (default, type)
+    DEFAULTS = {
+        "use_drag_radius": (True, bool),
+        "default_radius": (100, int),
+        "default_beamwidth": (30, int),
+        "default_site_radius": (100, int),
+        "default_line_color": ("#FFFF00", str),
+        "default_line_width": (2, int),
+        "default_text_color": ("#000000", str),
+        "use_arc_tolerance": (False, bool),
+        "arc_tolerance_m": (0.5, float),
+        "store_as_curves": (False, bool),
+        "geodesic_wedges": (False, bool),
+        "storage_backend": ("memory", str),
+        "gpkg_path": ("", str),
+    }
+
+    # Dipancarkan setelah update(), berisi list key yang berubah
+    changed = pyqtSignal(list)
+
+    _instance = None
+
+    @staticmethod
+    def instance():
+        if ShooterSettings._instance is None:
+            ShooterSettings._instance = ShooterSettings()
+        return ShooterSettings._instance
+
+    def __init__(self):
+        super().__init__()
+        self._values = {}
+        self.reload()
+
+    def reload(self):
+        """
+        Baca ulang semua key dari QSettings.
+        """
+        settings = QSettings()
+        settings.beginGroup(self.GROUP)
+        self._values = {
+            key: settings.value(key, default, type=value_type)
+            for key, (default, value_type) in self.DEFAULTS.items()
+        }
+        settings.endGroup()
+
+    def value(self, key):
+        return self._values[key]
+
+    def values(self) -> dict:
+        return dict(self._values)
+
+    def update(self, values: dict):
+        """
+        Simpan key yang berubah ke QSettings, lalu emit changed.
+        """
+        changed_keys = [
+            key for key, value in values.items()
+            if self._values.get(key) != value
+        ]
+        if not changed_keys:
+            return
+
+        settings = QSettings()
+        settings.beginGroup(self.GROUP)
+        for key in changed_keys:
+            settings.setValue(key, values[key])
+            self._values[key] = values[key]
+        settings.endGroup()
+
+        self.changed.emit(changed_keys)
@@ -30,16 +30,19 @@
 
 from qgis.PyQt.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout,
-    QLabel, QSpinBox, QCheckBox,
-    QPushButton, QColorDialog
+    QLabel, QSpinBox, QDoubleSpinBox, QCheckBox,
+    QPushButton, QColorDialog, QLineEdit, QFileDialog
 )
-from qgis.PyQt.QtCore import QSettings
 from qgis.PyQt.QtGui import QColor
 
+from .shooter_settings import ShooterSettings
+from .shooter_gpkg_store import DEFAULT_GPKG_NAME
+from .shooter_layer_manager import STORAGE_GPKG, STORAGE_MEMORY
+
 
 class ShooterSettingsDialog(QDialog):
 
-    SETTINGS_GROUP = "SHOOTER/settings"
+    SETTINGS_GROUP = ShooterSettings.GROUP
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -49,19 +52,21 @@ class ShooterSettingsDialog(QDialog):
 
         layout = QVBoxLayout(self)
 
-        settings = QSettings()
-        settings.beginGroup(self.SETTINGS_GROUP)
-
-        use_drag_radius = settings.value("use_drag_radius", True, type=bool)
-        default_radius = settings.value("default_radius", 100, type=int)
-        default_beamwidth = settings.value("default_beamwidth", 30, type=int)
-        default_site_radius = settings.value("default_site_radius", 100, type=int)
-        default_line_color = settings.value("default_line_color", "#FFFF00", type=str)
-        default_line_width = settings.value("default_line_width", 2, type=int)
-        default_text_color = settings.value("default_text_color", "#000000", type=str)
-
-
-        settings.endGroup()
+        settings = ShooterSettings.instance()
+
+        use_drag_radius = settings.value("use_drag_radius")
+        default_radius = settings.value("default_radius")
+        default_beamwidth = settings.value("default_beamwidth")
+        default_site_radius = settings.value("default_site_radius")
+        default_line_color = settings.value("default_line_color")
+        default_line_width = settings.value("default_line_width")
+        default_text_color = settings.value("default_text_color")
+        use_arc_tolerance = settings.value("use_arc_tolerance")
+        arc_tolerance_m = settings.value("arc_tolerance_m")
+        store_as_curves = settings.value("store_as_curves")
+        geodesic_wedges = settings.value("geodesic_wedges")
+        storage_backend = settings.value("storage_backend")
+        gpkg_path = settings.value("gpkg_path")
 
         # =========================
         # Sector Radius
@@ -170,6 +175,78 @@ class ShooterSettingsDialog(QDialog):
         text_color_layout.addWidget(self.text_color_button)
         layout.addLayout(text_color_layout)
 
+        layout.addSpacing(12)
+
+        # =========================
+        # Arc Precision
+        # =========================
+        layout.addWidget(QLabel("Arc Precision"))
+
+        self.cb_arc_tolerance = QCheckBox("Vertex count from chord tolerance")
+        self.cb_arc_tolerance.setChecked(use_arc_tolerance)
+        layout.addWidget(self.cb_arc_tolerance)
+
+        tol_layout = QHBoxLayout()
+        tol_layout.addWidget(QLabel("Max Chord Error (m)"))
+
+        self.tol_spin = QDoubleSpinBox()
+        self.tol_spin.setRange(0.01, 100.0)
+        self.tol_spin.setDecimals(2)
+        self.tol_spin.setSingleStep(0.1)
+        self.tol_spin.setValue(arc_tolerance_m)
+        tol_layout.addWidget(self.tol_spin)
+
+        layout.addLayout(tol_layout)
+
+        self.tol_spin.setEnabled(use_arc_tolerance)
+        self.cb_arc_tolerance.stateChanged.connect(
+            lambda: self.tol_spin.setEnabled(
+                self.cb_arc_tolerance.isChecked()
+            )
+        )
+
+        self.cb_store_curves = QCheckBox("Store new layers as curves (CurvePolygon)")
+        self.cb_store_curves.setChecked(store_as_curves)
+        layout.addWidget(self.cb_store_curves)
+
+        self.cb_geodesic = QCheckBox("Geodesic construction (WGS84 ellipsoid)")
+        self.cb_geodesic.setChecked(geodesic_wedges)
+        layout.addWidget(self.cb_geodesic)
+
+        layout.addSpacing(12)
+
+        # =========================
+        # Storage
+        # =========================
+        layout.addWidget(QLabel("Storage"))
+
+        use_gpkg = storage_backend == STORAGE_GPKG
+        self.cb_gpkg = QCheckBox("Store layers in GeoPackage (persistent)")
+        self.cb_gpkg.setChecked(use_gpkg)
+        layout.addWidget(self.cb_gpkg)
+
+        gpkg_layout = QHBoxLayout()
+
+        self.gpkg_edit = QLineEdit(gpkg_path)
+        self.gpkg_edit.setPlaceholderText(DEFAULT_GPKG_NAME + " (project folder)")
+        gpkg_layout.addWidget(self.gpkg_edit)
+
+        self.gpkg_button = QPushButton("...")
+        self.gpkg_button.setFixedWidth(30)
+        self.gpkg_button.clicked.connect(self._chooseGpkgPath)
+        gpkg_layout.addWidget(self.gpkg_button)
+
+        layout.addLayout(gpkg_layout)
+
+        self.gpkg_edit.setEnabled(use_gpkg)
+        self.gpkg_button.setEnabled(use_gpkg)
+        self.cb_gpkg.stateChanged.connect(
+            lambda: (
+                self.gpkg_edit.setEnabled(self.cb_gpkg.isChecked()),
+                self.gpkg_button.setEnabled(self.cb_gpkg.isChecked())
+            )
+        )
+
 
         layout.addStretch()
 
@@ -216,20 +293,36 @@ class ShooterSettingsDialog(QDialog):
             f"background-color: {self.text_color.name()};"
         )
 
+
+    # --------------------------------------------------
+    def _chooseGpkgPath(self):
+        path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Shooter GeoPackage",
+            self.gpkg_edit.text() or DEFAULT_GPKG_NAME,
+            "GeoPackage (*.gpkg)",
+            options=QFileDialog.DontConfirmOverwrite
+        )
+        if path:
+            self.gpkg_edit.setText(path)
+
     
     # --------------------------------------------------
     def _saveSettings(self):
-        settings = QSettings()
-        settings.beginGroup(self.SETTINGS_GROUP)
-
-        settings.setValue("use_drag_radius", self.cb_use_drag.isChecked())
-        settings.setValue("default_radius", self.radius_spin.value())
-        settings.setValue("default_beamwidth", self.bw_spin.value())
-        settings.setValue("default_site_radius", self.site_spin.value())
-        settings.setValue("default_line_color", self.current_color.name())
-        settings.setValue("default_line_width", self.lw_spin.value())
-        settings.setValue("default_text_color", self.text_color.name())
-
-        settings.endGroup()
+        ShooterSettings.instance().update({
+            "use_drag_radius": self.cb_use_drag.isChecked(),
+            "default_radius": self.radius_spin.value(),
+            "default_beamwidth": self.bw_spin.value(),
+            "default_site_radius": self.site_spin.value(),
+            "default_line_color": self.current_color.name(),
+            "default_line_width": self.lw_spin.value(),
+            "default_text_color": self.text_color.name(),
+            "use_arc_tolerance": self.cb_arc_tolerance.isChecked(),
+            "arc_tolerance_m": self.tol_spin.value(),
+            "store_as_curves": self.cb_store_curves.isChecked(),
+            "geodesic_wedges": self.cb_geodesic.isChecked(),
+            "storage_backend": STORAGE_GPKG if self.cb_gpkg.isChecked() else STORAGE_MEMORY,
+            "gpkg_path": self.gpkg_edit.text().strip(),
+        })
 
         self.accept()
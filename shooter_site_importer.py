@@ -0,0 +1,147 @@
+# ============================================================
+# SHOOTER - QGIS Plugin
+#
+# Author  : Achmad Amrulloh
+# Email   : achmad.amrulloh@gmail.com
+# LinkedIn: https://www.linkedin.com/in/achmad-amrulloh/
+#
+# Description:
+# Manual Add Sector & Site Tool for RF Planning and RF Optimization.
+#
+# Copyright (C) 2026 Achmad Amrulloh
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# ============================================================
+
+import numpy as np
+
+from qgis.core import Qgis, QgsMessageLog
+
+from .shooter_geometry import ShooterGeometry
+from .shooter_layer_manager import ShooterLayerManager, LAYER_ADD_SITE
+from .shooter_settings import ShooterSettings
+from .shooter_site_table import read_site_chunks, DEFAULT_CHUNK_ROWS
+
+# Baris error yang ditulis ke log per import
+MAX_LOGGED_ERRORS = 200
+
+
+class ShooterSiteImporter:
+    """
+    Import database site (CSV / XLSX) ke layer SHOOTER_ADD_SITE.
+
+    File dibaca per chunk; wedge tiap chunk dibangun sekaligus lewat
+    ShooterLayerManager.buildLayerWedges (dalam CRS layer)
+    dan ditulis dengan satu addFeaturesByLayer (satu edit command, satu
+    langkah undo per chunk). Progress dan pembatalan lewat QgsFeedback
+    (opsional); chunk yang sudah ditulis tetap ada.
+    """
+
+    @staticmethod
+    def importFile(path: str, feedback=None, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> dict:
+        """
+        Return ringkasan {"sites", "sectors", "skipped", "canceled"}.
+        OSError / ValueError jika file tidak bisa dibaca.
+        """
+        settings = ShooterSettings.instance()
+        chunks = read_site_chunks(
+            path,
+            settings.value("default_site_radius"),
+            settings.value("default_beamwidth"),
+            chunk_rows,
+        )
+        style = {
+            "line_color": settings.value("default_line_color"),
+            "line_width": settings.value("default_line_width"),
+        }
+
+        result = {"sites": 0, "sectors": 0, "skipped": 0, "canceled": False}
+        logged = 0
+
+        ShooterLayerManager.ensureShooterGroupAndLayerVisible(LAYER_ADD_SITE)
+
+        try:
+            for chunk in chunks:
+                if feedback is not None and feedback.isCanceled():
+                    result["canceled"] = True
+                    break
+
+                sites, sectors, errors = ShooterSiteImporter._writeChunk(chunk, style)
+                result["sites"] += sites
+                result["sectors"] += sectors
+                result["skipped"] += len(errors)
+
+                for row_no, message in errors[:max(MAX_LOGGED_ERRORS - logged, 0)]:
+                    QgsMessageLog.logMessage(
+                        f"Site import {path}, row {row_no}: {message}",
+                        "SHOOTER", Qgis.Warning
+                    )
+                logged += len(errors)
+
+                if feedback is not None:
+                    feedback.setProgress(100.0 * chunk.progress)
+        finally:
+            chunks.close()
+
+        return result
+
+    @staticmethod
+    def _writeChunk(chunk, style):
+        """
+        Tulis satu chunk ke layer site. Return (site, sektor, errors).
+        """
+        errors = list(chunk.errors)
+        if len(chunk.site) == 0:
+            return 0, 0, errors
+
+        # Geometry dan center dalam CRS layer
+        layer = ShooterLayerManager.getOrCreateLayerByName(LAYER_ADD_SITE)
+        geoms, layer_xy = ShooterLayerManager.buildLayerWedges(
+            layer,
+            np.column_stack([chunk.lon, chunk.lat])[chunk.site],
+            chunk.azimuth,
+            chunk.radius_m,
+            chunk.beamwidth,
+            ShooterGeometry.wgs84Crs()
+        )
+
+        built = np.array([geom is not None for geom in geoms], dtype=bool)
+        valid = np.zeros(len(chunk.lon), dtype=bool)
+        valid[chunk.site[built]] = True
+        for site in np.flatnonzero(~valid):
+            errors.append((chunk.row_nos[site], "cannot transform to layer CRS"))
+
+        items = []
+        for row in np.flatnonzero(built).tolist():
+            s = int(chunk.site[row])
+            items.append((
+                geoms[row],
+                {
+                    "sector_id": chunk.sector_ids[row],
+                    "dummy_id": chunk.dummy_ids[s],
+                    "azimuth": float(chunk.azimuth[row]),
+                    "radius_m": float(chunk.radius_m[row]),
+                    "beamwidth": float(chunk.beamwidth[row]),
+                    "center_lat": float(layer_xy[row, 1]),
+                    "center_lon": float(layer_xy[row, 0]),
+                    "line_color": style["line_color"],
+                    "line_width": style["line_width"],
+                    "show_label": True
+                }
+            ))
+
+        ShooterLayerManager.addFeaturesByLayer(
+            LAYER_ADD_SITE, items, f"Import {len(items)} sectors"
+        )
+        return int(np.count_nonzero(valid)), len(items), errors
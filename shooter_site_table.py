@@ -0,0 +1,352 @@
+# ============================================================
+# SHOOTER - QGIS Plugin
+#
+# Author  : Achmad Amrulloh
+# Email   : achmad.amrulloh@gmail.com
+# LinkedIn: https://www.linkedin.com/in/achmad-amrulloh/
+#
+# Description:
+# Manual Add Sector & Site Tool for RF Planning and RF Optimization.
+#
+# Copyright (C) 2026 Achmad Amrulloh
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# ============================================================
+"""
+Pembaca tabel site (CSV / XLSX) secara streaming: baris dibaca per
+chunk, divalidasi, lalu dikembalikan sebagai array NumPy per site dan
+per sektor sehingga wedge bisa dibangun sekaligus per chunk. Tidak
+bergantung pada qgis; XLSX butuh openpyxl.
+"""
+
+import csv
+import io
+import math
+import os
+import re
+from collections import namedtuple
+
+import numpy as np
+
+DEFAULT_CHUNK_ROWS = 2000
+
+# Azimuth jika kolom azimuth kosong (sama dengan tool Add Site)
+DEFAULT_SITE_AZIMUTHS = (0.0, 120.0, 240.0)
+
+# Nama kolom (lowercase, spasi / strip → "_") → kolom kanonik
+HEADER_ALIASES = {
+    "dummy_id": ("dummy_id", "site_id", "siteid", "site", "site_name", "id", "name"),
+    "sector_id": ("sector_id", "sector", "sector_name", "cell", "cell_id", "cell_name"),
+    "center_lat": ("center_lat", "lat", "latitude", "y"),
+    "center_lon": ("center_lon", "lon", "long", "lng", "longitude", "x"),
+    "azimuth": ("azimuth", "azimuths", "az", "azi"),
+    "beamwidth": ("beamwidth", "beamwidths", "bw", "hbw"),
+    "radius_m": ("radius_m", "radius", "radii", "range"),
+}
+
+REQUIRED_COLUMNS = ("dummy_id", "center_lat", "center_lon")
+
+# Rentang nilai sama dengan dialog Edit Sector / Settings, agar sektor
+# hasil import bisa diedit tanpa nilai terpotong
+BEAMWIDTH_RANGE = (10.0, 180.0)
+RADIUS_RANGE = (10.0, 10000.0)
+
+# Pemisah nilai dalam satu sel, mis. "0;120;240" atau "0/120/240"
+LIST_SEPARATORS = re.compile(r"[;|/]")
+
+CSV_DELIMITERS = ",;\t|"
+SNIFF_BYTES = 64 * 1024
+
+# Satu chunk hasil baca:
+# - per site   : row_nos (nomor baris file), dummy_ids, lon, lat (WGS84)
+# - per sektor : site (index ke array site), sector_ids,
+#                azimuth, radius_m, beamwidth
+# errors   : [(nomor baris, pesan), ...]
+# progress : 0..1 (posisi baca di file)
+SiteChunk = namedtuple("SiteChunk", (
+    "row_nos", "dummy_ids", "lon", "lat",
+    "site", "sector_ids", "azimuth", "radius_m", "beamwidth",
+    "errors", "progress",
+))
+
+
+class SiteRowError(ValueError):
+    pass
+
+
+# ============================================================
+# Reader
+# ============================================================
+
+def read_site_chunks(path, default_radius, default_beamwidth,
+                     chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    Generator SiteChunk dari file .csv / .txt / .xlsx.
+    Baris tidak valid tidak menghentikan import; dicatat di errors.
+    """
+    if os.path.splitext(path)[1].lower() in (".xlsx", ".xlsm"):
+        rows = iter_xlsx_rows(path)
+    else:
+        rows = iter_csv_rows(path)
+
+    try:
+        header = None
+        for _row_no, cells, _progress in rows:
+            if any(_cell_text(cell) for cell in cells):
+                header = cells
+                break
+        if header is None:
+            raise ValueError(f"{os.path.basename(path)}: no header row")
+
+        columns = map_columns(header)
+        missing = [name for name in REQUIRED_COLUMNS if name not in columns]
+        if missing:
+            raise ValueError(
+                f"{os.path.basename(path)}: missing column(s) {', '.join(missing)}"
+            )
+
+        builder = _ChunkBuilder(default_radius, default_beamwidth)
+        for row_no, cells, progress in rows:
+            if not any(_cell_text(cell) for cell in cells):
+                continue
+
+            builder.add(row_no, cells, columns)
+            if builder.rows >= chunk_rows:
+                yield builder.take(progress)
+
+        if builder.rows:
+            yield builder.take(1.0)
+    finally:
+        # Tutup file / workbook juga saat import dibatalkan
+        rows.close()
+
+
+def iter_csv_rows(path):
+    """
+    (nomor baris, sel, progress) dari CSV; delimiter dideteksi dari
+    awal file. Progress dari posisi byte file.
+    """
+    size = max(os.path.getsize(path), 1)
+
+    with open(path, "rb") as raw:
+        sample = raw.read(SNIFF_BYTES).decode("utf-8-sig", errors="replace")
+        raw.seek(0)
+
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=CSV_DELIMITERS)
+        except csv.Error:
+            dialect = csv.excel
+
+        text = io.TextIOWrapper(raw, encoding="utf-8-sig", errors="replace", newline="")
+        reader = csv.reader(text, dialect)
+        for row_no, cells in enumerate(reader, start=1):
+            yield row_no, cells, raw.tell() / size
+
+
+def iter_xlsx_rows(path):
+    """
+    (nomor baris, sel, progress) dari sheet aktif XLSX, dibaca dalam
+    mode read-only openpyxl (tanpa memuat seluruh workbook).
+    """
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ValueError("Reading .xlsx files needs the openpyxl package")
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        sheet = workbook.active
+        total = max(sheet.max_row or 0, 1)
+        for row_no, cells in enumerate(sheet.iter_rows(values_only=True), start=1):
+            yield row_no, cells, min(row_no / total, 1.0)
+    finally:
+        workbook.close()
+
+
+def map_columns(header_cells) -> dict:
+    """
+    Header → {kolom kanonik: index sel}. Nama kolom tidak peka huruf
+    besar / kecil; kolom yang tidak dikenal diabaikan.
+    """
+    lookup = {
+        alias: name
+        for name, aliases in HEADER_ALIASES.items()
+        for alias in aliases
+    }
+
+    columns = {}
+    for idx, cell in enumerate(header_cells):
+        key = re.sub(r"[\s\-]+", "_", _cell_text(cell).lower())
+        name = lookup.get(key)
+        if name is not None and name not in columns:
+            columns[name] = idx
+    return columns
+
+
+# ============================================================
+# Parsing baris
+# ============================================================
+
+class _ChunkBuilder:
+
+    def __init__(self, default_radius, default_beamwidth):
+        self.default_radius = float(default_radius)
+        self.default_beamwidth = float(default_beamwidth)
+        self._reset()
+
+    def _reset(self):
+        self.rows = 0
+        self.row_nos = []
+        self.dummy_ids = []
+        self.lon = []
+        self.lat = []
+        self.site = []
+        self.sector_ids = []
+        self.azimuth = []
+        self.radius_m = []
+        self.beamwidth = []
+        self.errors = []
+
+    def add(self, row_no, cells, columns):
+        self.rows += 1
+        try:
+            dummy_id, lon, lat, sector_ids, az, r, bw = self._parse(cells, columns)
+        except SiteRowError as e:
+            self.errors.append((row_no, str(e)))
+            return
+
+        site = len(self.dummy_ids)
+        self.row_nos.append(row_no)
+        self.dummy_ids.append(dummy_id)
+        self.lon.append(lon)
+        self.lat.append(lat)
+
+        self.site.extend([site] * len(az))
+        self.sector_ids.extend(sector_ids)
+        self.azimuth.extend(az)
+        self.radius_m.extend(r)
+        self.beamwidth.extend(bw)
+
+    def take(self, progress) -> SiteChunk:
+        chunk = SiteChunk(
+            self.row_nos,
+            self.dummy_ids,
+            np.asarray(self.lon, dtype=np.float64),
+            np.asarray(self.lat, dtype=np.float64),
+            np.asarray(self.site, dtype=np.intp),
+            self.sector_ids,
+            np.asarray(self.azimuth, dtype=np.float64),
+            np.asarray(self.radius_m, dtype=np.float64),
+            np.asarray(self.beamwidth, dtype=np.float64),
+            self.errors,
+            progress,
+        )
+        self._reset()
+        return chunk
+
+    def _parse(self, cells, columns):
+        def cell(name):
+            idx = columns.get(name)
+            if idx is None or idx >= len(cells):
+                return None
+            return cells[idx]
+
+        dummy_id = _cell_text(cell("dummy_id"))
+        if not dummy_id:
+            raise SiteRowError("empty site ID")
+
+        lat = _single_number(cell("center_lat"), "latitude")
+        lon = _single_number(cell("center_lon"), "longitude")
+        if not -90.0 <= lat <= 90.0:
+            raise SiteRowError(f"latitude {lat} out of range")
+        if not -180.0 <= lon <= 180.0:
+            raise SiteRowError(f"longitude {lon} out of range")
+
+        az = _numbers(cell("azimuth"), "azimuth") or list(DEFAULT_SITE_AZIMUTHS)
+        bw = _numbers(cell("beamwidth"), "beamwidth") or [self.default_beamwidth]
+        r = _numbers(cell("radius_m"), "radius") or [self.default_radius]
+
+        # Nilai tunggal berlaku untuk semua sektor di baris
+        n = max(len(az), len(bw), len(r))
+        az, bw, r = (_broadcast(values, n) for values in (az, bw, r))
+
+        if any(not RADIUS_RANGE[0] <= value <= RADIUS_RANGE[1] for value in r):
+            raise SiteRowError(
+                f"radius must be {RADIUS_RANGE[0]:g}-{RADIUS_RANGE[1]:g} m"
+            )
+        if any(not BEAMWIDTH_RANGE[0] <= value <= BEAMWIDTH_RANGE[1] for value in bw):
+            raise SiteRowError(
+                f"beamwidth must be {BEAMWIDTH_RANGE[0]:g}-{BEAMWIDTH_RANGE[1]:g}°"
+            )
+        az = [value % 360.0 for value in az]
+
+        names = [
+            name.strip()
+            for name in LIST_SEPARATORS.split(_cell_text(cell("sector_id")))
+            if name.strip()
+        ]
+        if len(names) != n:
+            names = [f"Sector {idx}" for idx in range(1, n + 1)]
+
+        return dummy_id, lon, lat, names, az, r, bw
+
+
+def _cell_text(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value).strip()
+
+
+def _to_number(text, label) -> float:
+    # Desimal koma (mis. "-6,2001") dari spreadsheet lokal Indonesia
+    try:
+        value = float(text.replace(",", "."))
+    except ValueError:
+        raise SiteRowError(f"invalid {label} {text!r}")
+    if not math.isfinite(value):
+        raise SiteRowError(f"invalid {label} {text!r}")
+    return value
+
+
+def _numbers(value, label) -> list:
+    """
+    Sel → list angka; sel kosong → [].
+    """
+    if value is None or isinstance(value, bool):
+        return []
+    if isinstance(value, (int, float)):
+        return [_to_number(repr(float(value)), label)]
+
+    return [
+        _to_number(part.strip(), label)
+        for part in LIST_SEPARATORS.split(str(value))
+        if part.strip()
+    ]
+
+
+def _single_number(value, label) -> float:
+    values = _numbers(value, label)
+    if len(values) != 1:
+        raise SiteRowError(f"missing {label}" if not values else f"invalid {label}")
+    return values[0]
+
+
+def _broadcast(values, n) -> list:
+    if len(values) == n:
+        return values
+    if len(values) == 1:
+        return values * n
+    raise SiteRowError("azimuth, beamwidth and radius counts differ")
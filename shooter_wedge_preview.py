@@ -0,0 +1,72 @@
+# ============================================================
+# SHOOTER - QGIS Plugin
+#
+# Author  : Achmad Amrulloh
+# Email   : achmad.amrulloh@gmail.com
+# LinkedIn: https://www.linkedin.com/in/achmad-amrulloh/
+#
+# Description:
+# Manual Add Sector & Site Tool for RF Planning and RF Optimization.
+#
+# Copyright (C) 2026 Achmad Amrulloh
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# ============================================================
+
+from qgis.core import QgsGeometry, QgsPointXY, QgsWkbTypes
+
+from .shooter_geometry import ShooterGeometry
+from .shooter_geometry_kernel import wedge_arc
+
+
+class ShooterWedgePreview:
+    """
+    Preview wedge untuk rubber band selama drag.
+
+    Frame lokal (map unit per meter) dihitung sekali saat drag dimulai;
+    setiap mouse move hanya merotasi + menskala template busur, lalu
+    ring dikirim ke rubber band dengan satu setToGeometry (satu
+    updateRect / repaint, bukan satu per vertex seperti movePoint).
+    """
+
+    def __init__(self, rubber_band):
+        self.rb = rubber_band
+        self.center = None
+        self.frame = None
+
+    def begin(self, center: QgsPointXY):
+        self.center = center
+        self.frame = ShooterGeometry.localFrame(center)
+        self.rb.reset(QgsWkbTypes.PolygonGeometry)
+
+    def update(self, azimuth, radius_m, beamwidth, segments):
+        if self.center is None:
+            return
+
+        xs, ys = wedge_arc(
+            self.center.x(), self.center.y(),
+            self.frame,
+            azimuth, radius_m, beamwidth, segments
+        )
+
+        # center → titik busur → center
+        ring = [self.center]
+        ring.extend(QgsPointXY(x, y) for x, y in zip(xs.tolist(), ys.tolist()))
+        ring.append(self.center)
+        self.rb.setToGeometry(QgsGeometry.fromPolygonXY([ring]), None)
+
+    def reset(self):
+        self.center = None
+        self.frame = None
+        self.rb.reset(QgsWkbTypes.PolygonGeometry)